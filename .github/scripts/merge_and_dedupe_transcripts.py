@@ -11,6 +11,7 @@ Deduplicates across all sources, embeds using OpenAI, and updates Pinecone index
 """
 
 import os
+import sys
 import json
 import hashlib
 import time
@@ -19,25 +20,31 @@ from tqdm import tqdm
 from openai import OpenAI
 import pinecone
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scripts"))
+from embeddings import check_dimension, get_backend
+from index_generations import resolve_alias
+
 # === Load environment variables ===
 from dotenv import load_dotenv
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-PINECONE_INDEX = os.getenv("PINECONE_INDEX", "forged-freedom-ai")
+PINECONE_INDEX = resolve_alias(os.getenv("PINECONE_INDEX", "forged-freedom-ai"))  # live generation
 
 if not OPENAI_API_KEY or not PINECONE_API_KEY:
     raise SystemExit("❌ Missing API keys — check your .env file.")
 
 client = OpenAI(api_key=OPENAI_API_KEY)
+embedder = get_backend("openai", "text-embedding-3-large")
 
 # === Initialize Pinecone ===
 pinecone.init(api_key=PINECONE_API_KEY, environment="us-east1-gcp")
 if PINECONE_INDEX not in pinecone.list_indexes().names():
-    pinecone.create_index(name=PINECONE_INDEX, dimension=3072, metric="cosine")
+    pinecone.create_index(name=PINECONE_INDEX, dimension=embedder.dimension, metric="cosine")
 
 index = pinecone.Index(PINECONE_INDEX)
+check_dimension(embedder, index)
 
 # === Helper functions ===
 
@@ -117,12 +124,9 @@ for h, entry in tqdm(local_texts.items()):
     for i, chunk in enumerate(chunks):
         chunk_id = f"{h}-{i}"
         try:
-            embedding = client.embeddings.create(
-                input=chunk,
-                model="text-embedding-3-large"
-            ).data[0].embedding
+            embedding = embedder.embed_one(chunk)
 
-            batch.append((chunk_id, embedding, {"source": entry["path"]}))
+            batch.append((chunk_id, embedding, {"source": entry["path"], **embedder.metadata()}))
 
             if len(batch) >= batch_size:
                 index.upsert(vectors=batch)
@@ -8,7 +8,11 @@ Environment variables:
  - PINECONE_ENV (or PINECONE_REGION depending on your pinecone client version)
  - PINECONE_INDEX
  - IGNORE_AFTER  (default "ggst"; set to empty string to disable)
- - EMBED_MODEL (optional; you can plug in your embedding function)
+ - EMBED_BACKEND (optional; openai | openrouter | local, default openai)
+ - EMBED_MODEL (optional; embedding model name)
+
+Each file is cut into token chunks (scripts/chunking.py) that fit the
+embedding model's input limit; chunk i of a file is stored as `<file id>-<i>`.
 """
 import os
 import sys
@@ -19,6 +23,12 @@ import subprocess
 import pathlib
 from typing import List
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scripts"))
+from pinecone_writer import UpsertWriter
+from embeddings import get_backend
+from index_generations import resolve_alias
+from chunking import chunk_tokens_cdc
+
 # Optional: import pinecone client if available
 try:
     import pinecone
@@ -47,16 +57,40 @@ def has_non_ascii(s: str) -> bool:
 def sha1_hex(s: str, length: int = 12) -> str:
     return hashlib.sha1(s.encode('utf-8', 'surrogatepass')).hexdigest()[:length]
 
-# ------- Embedding placeholder -------
-def generate_embedding(text: str) -> List[float]:
-    """
-    Replace this with your embedding function (OpenAI, Cohere, local model, etc.)
-    Return a list/sequence of floats representing the embedding for `text`.
-    """
-    # Minimal placeholder: return a tiny deterministic vector (replace in prod)
-    h = hashlib.sha1(text.encode('utf-8')).digest()
-    # convert some bytes to small floats
-    return [float(b) / 255.0 for b in h[:16]]
+def vector_id(base_name: str, chunk: int) -> str:
+    """Stable ASCII Pinecone id for one chunk of a file."""
+    candidate_id = sanitize(base_name, index=chunk)
+    if has_non_ascii(candidate_id):
+        # fallback to hex id if sanitize still produced non-ASCII (unlikely)
+        candidate_id = f"{sha1_hex(base_name)}-{chunk}"
+
+    # Safety: enforce a conservative allowed-id pattern (alnum, dot, underscore, hyphen)
+    # replace any other ascii chars with '-' just in case (space/pipe will be removed)
+    candidate_id = re.sub(r'[^A-Za-z0-9._-]+', '-', candidate_id).strip('-')
+    if not candidate_id:
+        candidate_id = f"{sha1_hex(base_name)}-{chunk}"
+    return candidate_id
+
+# ------- Embedding backend -------
+# EMBED_BACKEND=openai|openrouter|local picks the backend (see scripts/embeddings.py).
+# Created lazily so a dry run needs no API key (or tiktoken).
+embedder = None
+enc = None
+EMBED_BATCH = 64  # chunks per embedding call
+
+def generate_embeddings(text: str) -> List[tuple]:
+    """(chunk, embedding) for every token chunk of `text`, each within the model's input limit."""
+    global embedder, enc
+    if embedder is None:
+        import tiktoken
+
+        embedder = get_backend("openai", "text-embedding-3-small", index=index)
+        enc = tiktoken.get_encoding("cl100k_base")
+    chunks = [c for c in chunk_tokens_cdc(text, enc) if c.strip()]
+    embeddings = []
+    for b in range(0, len(chunks), EMBED_BATCH):
+        embeddings += embedder.embed(chunks[b:b + EMBED_BATCH])
+    return list(zip(chunks, embeddings))
 
 # ------- Main flow -------
 IGNORE_AFTER = os.getenv("IGNORE_AFTER", "ggst")  # default per your request
@@ -65,6 +99,8 @@ IGNORE_AFTER = os.getenv("IGNORE_AFTER", "ggst")  # default per your request
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_ENV = os.getenv("PINECONE_ENV") or os.getenv("PINECONE_REGION")
 PINECONE_INDEX = os.getenv("PINECONE_INDEX")
+if PINECONE_INDEX:
+    PINECONE_INDEX = resolve_alias(PINECONE_INDEX)  # live generation
 
 if not PINECONE_API_KEY or not PINECONE_ENV or not PINECONE_INDEX:
     print("Warning: One or more Pinecone environment variables missing (PINECONE_API_KEY, PINECONE_ENV/REGION, PINECONE_INDEX).")
@@ -120,6 +156,7 @@ uploaded = 0
 skipped_by_marker = 0
 skipped_by_error = 0
 skipped_binary_or_read = 0
+pending = []
 
 for f in files:
     if f in ignored_files:
@@ -143,48 +180,35 @@ for f in files:
 
     # create a stable ASCII id for Pinecone
     base_name = path.name
-    candidate_id = sanitize(base_name, index=0)
-    if has_non_ascii(candidate_id):
-        # fallback to hex id if sanitize still produced non-ASCII (unlikely)
-        candidate_id = sha1_hex(base_name)
-
-    # Safety: enforce a conservative allowed-id pattern (alnum, dot, underscore, hyphen)
-    # replace any other ascii chars with '-' just in case (space/pipe will be removed)
-    candidate_id = re.sub(r'[^A-Za-z0-9._-]+', '-', candidate_id).strip('-')
-    if not candidate_id:
-        candidate_id = sha1_hex(base_name)
-
-    # generate embedding (replace with your real embedder)
-    embedding = generate_embedding(text)
-
-    vector = {
-        "id": candidate_id,
-        "values": embedding,
-        "metadata": {"path": f}
-    }
 
     if not pinecone_enabled:
-        print(f"[DRY-RUN] Would upsert vector id={candidate_id} for file {f}")
+        print(f"[DRY-RUN] Would upsert vectors id={vector_id(base_name, 0)}... for file {f}")
         uploaded += 1
         continue
 
-    # Attempt upsert, but catch Pinecone errors and skip if ID problems occur
     try:
-        # upsert a single vector (batching could be added)
-        index.upsert(vectors=[vector])
-        print(f"Upserted id={candidate_id}  -> {f}")
-        uploaded += 1
+        embedded = generate_embeddings(text)
     except Exception as e:
-        # Try to detect an ID/ASCII problem and skip; otherwise surface the error but continue
-        msg = str(e)
-        print(f"Pinecone upsert error for id={candidate_id} file={f}: {msg}")
+        print(f"Embedding error for {f}: {e} -- skipping")
         skipped_by_error += 1
         continue
 
+    pending.extend({
+        "id": vector_id(base_name, i),
+        "values": embedding,
+        "metadata": {"path": f, "chunk_index": i, "text": chunk[:1500], **embedder.metadata()}
+    } for i, (chunk, embedding) in enumerate(embedded))
+
+# Batched parallel upsert; vectors that still fail (e.g. ID problems) are isolated and skipped
+if pending:
+    report = UpsertWriter(index).write(pending)
+    uploaded += report.upserted
+    skipped_by_error += len(report.failed)
+
 # Summary
 print("\n=== Summary ===")
 print(f"Total git-tracked files: {len(files)}")
-print(f"Uploaded (or dry-run processed): {uploaded}")
+print(f"Uploaded chunk vectors (or dry-run files processed): {uploaded}")
 print(f"Skipped by marker (non-ASCII after IGNORE_AFTER): {skipped_by_marker}")
 print(f"Skipped due to read/binary issues: {skipped_binary_or_read}")
 print(f"Skipped due to upsert errors: {skipped_by_error}")
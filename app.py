@@ -16,8 +16,14 @@ from flask import Flask, request, jsonify
 from pinecone import Pinecone
 import requests
 import os
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from embeddings import get_backend
+from index_generations import resolve_alias
+from index_migration import search_target
+
 # ============================================================
 # 🧩 Flask app
 # ============================================================
@@ -40,11 +46,33 @@ if not OPENROUTER_API_KEY:
     raise ValueError("❌ Missing OpenRouter API key.")
 
 # ============================================================
-# 🔌 Initialize Pinecone
+# 🔌 Initialize Pinecone + embedding backend
 # ============================================================
 pc = Pinecone(api_key=PINECONE_API_KEY)
-index = pc.Index(PINECONE_INDEX_NAME)
-print(f"✅ Connected to Pinecone index: {PINECONE_INDEX_NAME}")
+_search = {}
+
+
+def search_clients():
+    """
+    (index, embedder) for queries.
+
+    Follows scripts/index_migration.py: stays on the current index until a
+    migration reports 100% coverage, then switches to the new index + model.
+    Index names are resolved through the generation alias on every call, so
+    a blue-green flip (scripts/index_generations.py) needs no restart.
+    """
+    index_name, backend, model = search_target(PINECONE_INDEX_NAME, "openrouter", EMBED_MODEL)
+    target = (resolve_alias(index_name), backend, model)
+    if _search.get("target") != target:
+        name, backend, model = target
+        index = pc.Index(name)
+        _search.update(target=target, index=index, embedder=get_backend(backend, model, index=index))
+        print(f"✅ Connected to Pinecone index: {name}")
+        print(f"🧠 Query embeddings: {_search['embedder']}")
+    return _search["index"], _search["embedder"]
+
+
+search_clients()
 
 # ============================================================
 # 🔎 API Routes
@@ -62,19 +90,10 @@ def api_search():
             return jsonify({"error": "Missing query"}), 400
 
         # ----------------------------------------------------
-        # Step 1️⃣: Create embedding using OpenRouter
+        # Step 1️⃣: Embed the query (OpenRouter by default)
         # ----------------------------------------------------
-        embed_url = f"{OPENROUTER_BASE_URL}/embeddings"
-        embed_payload = {"model": EMBED_MODEL, "input": query}
-
-        embed_resp = requests.post(
-            embed_url,
-            headers={"Authorization": f"Bearer {OPENROUTER_API_KEY}"},
-            json=embed_payload,
-            timeout=30,
-        )
-        embed_resp.raise_for_status()
-        query_vector = embed_resp.json()["data"][0]["embedding"]
+        index, embedder = search_clients()
+        query_vector = embedder.embed_one(query)
 
         # ----------------------------------------------------
         # Step 2️⃣: Query Pinecone index
@@ -145,7 +164,7 @@ def home():
     return jsonify({
         "status": "ok",
         "message": "✅ Forged by Freedom Search API ready",
-        "index": PINECONE_INDEX_NAME,
+        "index": _search["target"][0],
         "model": OPENROUTER_MODEL,
         "time": datetime.utcnow().isoformat() + "Z"
     })
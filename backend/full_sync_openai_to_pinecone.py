@@ -1,22 +1,30 @@
 import os
 import re
-import glob
+import sys
 import unicodedata
+import tiktoken
 from tqdm import tqdm
-from openai import OpenAI
 from pinecone import Pinecone, ServerlessSpec
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+from chunking import chunk_sentences
+from embeddings import check_dimension, get_backend
+from index_generations import resolve_alias
+from index_migration import Migration
+from transcript_store import list_transcripts, read_transcript
+
 # === Environment ===
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 
-if not OPENAI_API_KEY or not PINECONE_API_KEY:
+embedder = get_backend("openai", "text-embedding-3-large")
+
+if not PINECONE_API_KEY or (embedder.name == "openai" and not OPENAI_API_KEY):
     raise ValueError("❌ Missing environment variables for OpenAI or Pinecone")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
 pc = Pinecone(api_key=PINECONE_API_KEY)
 
-INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai")
+INDEX_NAME = resolve_alias(os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai"))  # live generation
 index = None
 
 # === Ensure Pinecone index exists ===
@@ -24,26 +32,26 @@ if INDEX_NAME not in [i["name"] for i in pc.list_indexes()]:
     print(f"⚙️ Creating Pinecone index: {INDEX_NAME}")
     pc.create_index(
         name=INDEX_NAME,
-        dimension=3072,
+        dimension=embedder.dimension,
         metric="cosine",
         spec=ServerlessSpec(cloud="aws", region="us-east-1")
     )
 
 index = pc.Index(INDEX_NAME)
+check_dimension(embedder, index)
+
+# Dual-write while an embedding-model migration is backfilling
+migration = Migration.active(pc)
+if migration:
+    print(f"🔀 Migration active: also writing {migration.state['target']['index']} ({migration.backend})")
 
 # === Utility: Chunk text safely ===
-def chunk_text(text, max_chars=6000):
-    paragraphs = text.split("\n")
-    chunks, current = [], ""
-    for para in paragraphs:
-        if len(current) + len(para) + 1 > max_chars:
-            chunks.append(current.strip())
-            current = para
-        else:
-            current += "\n" + para
-    if current.strip():
-        chunks.append(current.strip())
-    return chunks
+# Whisper transcripts are one giant line, so chunk on sentences (not newlines)
+# and bound chunks in tokens so the embedding API never truncates them.
+ENC = tiktoken.get_encoding("cl100k_base")
+
+def chunk_text(text, max_tokens=800, overlap_tokens=120):
+    return list(chunk_sentences(text, ENC, max_tokens=max_tokens, overlap_tokens=overlap_tokens))
 
 # === Utility: Skip files with non-ASCII names ===
 def is_ascii_safe(filename: str) -> bool:
@@ -53,8 +61,11 @@ def is_ascii_safe(filename: str) -> bool:
     except UnicodeEncodeError:
         return False
 
+EMBED_BATCH = 64  # chunks per embedding call
+
 # === Start sync ===
-transcripts = sorted(glob.glob("transcripts/*.txt"))
+# plain and packed (transcript_store.py) transcripts alike
+transcripts = [os.path.join("transcripts", name) for name, _, _ in list_transcripts("transcripts", skip_masters=False)]
 print(f"📚 Found {len(transcripts)} transcript files to sync")
 
 for path in tqdm(transcripts, desc="Uploading transcripts"):
@@ -65,8 +76,7 @@ for path in tqdm(transcripts, desc="Uploading transcripts"):
         print(f"⚠️ Skipping file with non-ASCII name: {filename}")
         continue
 
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read().strip()
+    text = read_transcript(path).strip()
     if not text:
         print(f"⚠️ Skipping empty file: {filename}")
         continue
@@ -74,20 +84,19 @@ for path in tqdm(transcripts, desc="Uploading transcripts"):
     chunks = chunk_text(text)
     vectors = []
 
-    for i, chunk in enumerate(chunks):
+    # Embed in batches so one failing call only loses its own chunks
+    for b in range(0, len(chunks), EMBED_BATCH):
         try:
-            emb = client.embeddings.create(
-                model="text-embedding-3-large",
-                input=chunk
-            )
-            vector = emb.data[0].embedding
+            embeddings = embedder.embed(chunks[b:b + EMBED_BATCH])
+        except Exception as e:
+            print(f"⚠️ Error embedding {filename} chunks {b}-{min(b + EMBED_BATCH, len(chunks)) - 1}: {e}")
+            continue
+        for i, vector in enumerate(embeddings, start=b):
             vectors.append({
                 "id": f"{re.sub(r'[^a-zA-Z0-9_.-]', '_', filename)}-{i}",
                 "values": vector,
-                "metadata": {"source": filename, "chunk": i}
+                "metadata": {"source": filename, "chunk": i, **embedder.metadata()}
             })
-        except Exception as e:
-            print(f"⚠️ Error embedding chunk {i} in {filename}: {e}")
 
     if vectors:
         try:
@@ -95,5 +104,11 @@ for path in tqdm(transcripts, desc="Uploading transcripts"):
             print(f"✅ Uploaded {len(vectors)} chunks from {filename}")
         except Exception as e:
             print(f"❌ Failed to upsert {filename}: {e}")
+            continue
+        if migration:
+            # Target-side failures are left for the backfill to pick up
+            migration.write([(v["id"], chunks[v["metadata"]["chunk"]], v["metadata"]) for v in vectors], filename)
 
+if migration:
+    migration.close()
 print("🎉 Sync complete — all valid transcripts uploaded to Pinecone!")
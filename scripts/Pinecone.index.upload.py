@@ -5,18 +5,52 @@ pinecone_index_upload.py
 Uploads all transcript text chunks into Pinecone with embeddings.
 
 ✅ Auto-creates Pinecone index if missing
-✅ Splits transcripts into ~3500-token chunks
-✅ Embeds via OpenAI (text-embedding-3-large)
+✅ Chunks transcripts on all CPU cores into content-defined chunks (≤3500 tokens)
+✅ Content-hash vector ids — unchanged chunks are never re-embedded
+✅ Chunk-level dedupe — identical chunks across episodes are embedded once
+✅ Embeds via the configured backend (default: OpenAI text-embedding-3-large;
+   EMBED_BACKEND=local for the offline embedder)
 ✅ Uploads to Pinecone with metadata for search + summaries
+✅ Deletes vectors for chunks no file references after an edit
+✅ Deletes each file's pre-CDC `{basename}_{i}` vectors once its content-hash
+   vectors are in (tracked in the catalog, so it happens once per file)
+✅ Checkpoints every committed batch — `--resume` continues a crashed run
+   (the journal is compacted after a run with no failures)
+✅ Dual-writes into the new index while scripts/index_migration.py backfills
+✅ `--new-generation` rebuilds into a fresh versioned index and flips the
+   alias only when the build is complete (scripts/index_generations.py);
+   every run deletes retired generations past their grace period
 """
 
 import os
 import json
+import argparse
 import tiktoken
-from openai import OpenAI
 from pinecone import Pinecone, ServerlessSpec
 from dotenv import load_dotenv
 
+from chunking import content_vector_id
+from chunk_catalog import CATALOG_PATH, ChunkCatalog
+from embeddings import check_dimension, get_backend
+from parallel_chunking import chunk_files_parallel
+from pinecone_writer import UpsertWriter
+from ingest_journal import IngestJournal, file_signature
+from index_migration import INDEXES_DIR, Migration
+from index_generations import Generations, resolve_alias
+from transcript_store import walk_transcripts
+
+parser = argparse.ArgumentParser(description="Upload transcript chunks to Pinecone.")
+parser.add_argument("--resume", action="store_true",
+                    help="skip files and chunks already committed by a previous (crashed) run")
+parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                    help="processes used for chunking/tokenization")
+parser.add_argument("--new-generation", action="store_true",
+                    help="full rebuild into a new index generation, promoted when complete "
+                         "(with --resume: continue the latest unfinished generation)")
+args = parser.parse_args()
+
+FLUSH_EVERY = 100  # chunks embedded between checkpoints
+
 # ============================================================
 # 🔐 Load Environment
 # ============================================================
@@ -24,39 +58,77 @@ load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai")
+INDEX_ALIAS = os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai")
+INDEX_NAME = resolve_alias(INDEX_ALIAS)
 
-if not OPENAI_API_KEY or not PINECONE_API_KEY:
+embedder = get_backend("openai", "text-embedding-3-large")
+
+if not PINECONE_API_KEY or (embedder.name == "openai" and not OPENAI_API_KEY):
     raise SystemExit("❌ Missing OpenAI or Pinecone API key. Check .env file.")
 
 # ============================================================
 # ⚙️ Initialize Clients
 # ============================================================
-client = OpenAI(api_key=OPENAI_API_KEY)
 pc = Pinecone(api_key=PINECONE_API_KEY)
+print(f"🧠 Embedding backend: {embedder}")
+
+generations = Generations(INDEX_ALIAS)
+if args.new_generation:
+    building = sorted((e["created"], n) for n, e in generations.entries.items() if e["status"] == "building")
+    if args.resume and building:
+        INDEX_NAME = building[-1][1]
+        print(f"⏯️ Continuing generation {INDEX_NAME}")
+    else:
+        INDEX_NAME = generations.create(pc, embedder)
+    GENERATION_CATALOG = os.path.join(INDEXES_DIR, f"{INDEX_NAME}.catalog.json")
+    GENERATION_JOURNAL = os.path.join(INDEXES_DIR, f"{INDEX_NAME}.journal.jsonl")
 
 # Create index if it doesn’t exist
 if INDEX_NAME not in pc.list_indexes().names():
     print(f"🪶 Creating Pinecone index: {INDEX_NAME}")
     pc.create_index(
         name=INDEX_NAME,
-        dimension=1536,
+        dimension=embedder.dimension,
         metric="cosine",
         spec=ServerlessSpec(cloud="aws", region="us-east-1"),
     )
 
 index = pc.Index(INDEX_NAME)
+check_dimension(embedder, index)
+writer = UpsertWriter(index)
 print(f"✅ Connected to Pinecone index: {INDEX_NAME}")
 
-# ============================================================
-# 🧩 Helper: Chunk Text
-# ============================================================
-def chunk_text(text, max_tokens=3500):
-    """Split large transcripts into smaller chunks."""
-    enc = tiktoken.get_encoding("cl100k_base")
-    tokens = enc.encode(text)
-    for i in range(0, len(tokens), max_tokens):
-        yield enc.decode(tokens[i:i + max_tokens])
+# Dual-write while an embedding-model migration is backfilling
+migration = Migration.active(pc)
+if migration:
+    print(f"🔀 Migration active: also writing {migration.state['target']['index']} ({migration.backend})")
+
+ENC = tiktoken.get_encoding("cl100k_base")
+
+# Files are chunked by chunk_files_parallel(): small files one per core, huge
+# master transcripts split into block ranges chunked on all cores at once.
+
+def legacy_ids(basename, batch_size=100):
+    """Ids the original uploader wrote for one file (`{basename}_{i}`, i = 0, 1, …)."""
+    prefix = f"{basename}_"
+    try:
+        return [vid for page in index.list(prefix=prefix) for vid in page if vid[len(prefix):].isdigit()]
+    except Exception:
+        # Indexes that cannot list ids: the old ids were contiguous, so probe
+        # i = 0, 1, 2, … until a whole batch comes back empty
+        ids = []
+        while True:
+            found = index.fetch(ids=[f"{prefix}{i}" for i in range(len(ids), len(ids) + batch_size)]).vectors
+            if not found:
+                return ids
+            ids += sorted(found, key=lambda vid: int(vid[len(prefix):]))
+
+def existing_ids(ids, batch_size=100):
+    """Return the subset of ids already stored in the index."""
+    found = set()
+    for i in range(0, len(ids), batch_size):
+        found.update(index.fetch(ids=ids[i:i + batch_size]).vectors.keys())
+    return found
 
 # ============================================================
 # 🧠 Main Process
@@ -65,50 +137,159 @@ TRANSCRIPTS_DIR = os.path.join(os.getcwd(), "transcripts")
 
 print(f"📚 Scanning transcripts in: {TRANSCRIPTS_DIR}")
 
-transcript_files = [
-    os.path.join(root, file)
-    for root, _, files in os.walk(TRANSCRIPTS_DIR)
-    for file in files
-    if file.endswith(".txt")
-]
+# Plain and packed (transcript_store.py) transcripts alike
+transcript_files = list(walk_transcripts(TRANSCRIPTS_DIR, skip_masters=False))
 
 print(f"📁 Found {len(transcript_files)} transcript files to index.\n")
 
+if args.new_generation:
+    # The live index keeps its catalog; this generation gets its own until promotion
+    catalog = ChunkCatalog(GENERATION_CATALOG)
+    journal = IngestJournal(GENERATION_JOURNAL, resume=args.resume)
+else:
+    catalog = ChunkCatalog()
+    journal = IngestJournal(resume=args.resume)
+if args.resume:
+    print(f"⏯️ Resuming: {len(journal.done_files)} files already complete.\n")
+
+def embed_batch(batch, rel_path, source, channel, tokens):
+    """Embed + upsert one batch of (index, chunk, byte_start, byte_end, id); returns failures."""
+    vectors = []
+    embeddings = embedder.embed([chunk for _, chunk, _, _, _ in batch])
+    for (i, chunk, start, end, vid), embedding in zip(batch, embeddings):
+        tokens[vid] = len(ENC.encode(chunk, disallowed_special=()))
+        vectors.append({
+            "id": vid,
+            "values": embedding,
+            "metadata": {
+                "source": source,
+                "channel": channel,
+                "chunk_index": i,
+                "byte_start": start,
+                "byte_end": end,
+                "text": chunk[:1500],  # preview text
+                **embedder.metadata(),
+            }
+        })
+
+    report = writer.write(vectors)
+    bad = {vid for vid, _ in report.failed}
+    journal.record_chunks(rel_path, (v["id"] for v in vectors if v["id"] not in bad))
+    if migration:
+        # Target-side failures are left for the backfill to pick up
+        good = [(v["id"], chunk, v["metadata"]) for v, (_, chunk, _, _, _) in zip(vectors, batch)
+                if v["id"] not in bad]
+        migration.write(good, rel_path)
+    return len(bad)
+
+signatures = {}
 for file_path in transcript_files:
+    sig = file_signature(file_path)
+    if not journal.is_file_done(os.path.relpath(file_path, TRANSCRIPTS_DIR), sig):
+        signatures[file_path] = sig
+
+failed_files = 0
+
+# Chunking/tokenizing runs in a process pool, results arrive in file order
+for file_path, file_chunks in chunk_files_parallel(list(signatures), workers=args.workers):
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
+        rel_path = os.path.relpath(file_path, TRANSCRIPTS_DIR)
+        sig = signatures[file_path]
+
+        print(f"🧩 Chunked {file_path}...")
+        source = os.path.basename(file_path)
+        channel = os.path.basename(os.path.dirname(file_path))
+        committed = journal.committed_chunks(rel_path)
+        refs, pending, seen, tokens = [], [], set(), {}
+        embedded = failed = 0
 
-        if not text.strip():
+        def flush():
+            """Skip chunks already stored, embed the rest, checkpoint the batch."""
+            global embedded, failed
+            stored = {p[4] for p in pending if p[4] in committed}
+            stored |= existing_ids([p[4] for p in pending if p[4] not in stored])
+            todo = [p for p in pending if p[4] not in stored]
+            if todo:
+                failed += embed_batch(todo, rel_path, source, channel, tokens)
+                embedded += len(todo)
+            pending.clear()
+
+        # Streamed: only FLUSH_EVERY chunks (plus one tokenizer block) are in memory at once
+        for i, (chunk, start, end) in enumerate(file_chunks):
+            if not chunk.strip():
+                continue
+            vid = content_vector_id(chunk)
+            refs.append((vid, i))
+            catalog.seen += 1
+            if vid in seen:
+                # Repeated inside this file
+                catalog.count_duplicate(vid, len(ENC.encode(chunk, disallowed_special=())))
+                continue
+            if catalog.has(vid):
+                # Already stored: unchanged, or the same text from another episode
+                if catalog.referenced_elsewhere(vid, rel_path):
+                    catalog.count_duplicate(vid)
+                continue
+            seen.add(vid)
+            pending.append((i, chunk, start, end, vid))
+            if len(pending) >= FLUSH_EVERY:
+                flush()
+        if pending:
+            flush()
+
+        if not refs:
+            continue
+        catalog.embedded += embedded
+        print(f"➡️ {len(refs)} chunks, {embedded} embedded, {len(refs) - embedded} unchanged or duplicate.")
+        if failed:
+            # Keep the catalog untouched so the next run retries this file.
+            print(f"❌ {failed} vectors failed for {file_path}\n")
+            failed_files += 1
             continue
 
-        print(f"🧩 Chunking {file_path}...")
-        chunks = list(chunk_text(text))
-        print(f"➡️ Created {len(chunks)} chunks.")
-
-        vectors = []
-        for i, chunk in enumerate(chunks):
-            embedding = client.embeddings.create(
-                model="text-embedding-3-large",
-                input=chunk
-            ).data[0].embedding
-
-            vectors.append({
-                "id": f"{os.path.basename(file_path)}_{i}",
-                "values": embedding,
-                "metadata": {
-                    "source": os.path.basename(file_path),
-                    "channel": os.path.basename(os.path.dirname(file_path)),
-                    "chunk_index": i,
-                    "text": chunk[:1500]  # preview text
-                }
-            })
-
-        print(f"⬆️ Uploading {len(vectors)} vectors...")
-        index.upsert(vectors)
+        stale = catalog.set_file(rel_path, refs, tokens)
+        if stale:
+            print(f"🧹 Removing {len(stale)} chunks no longer referenced by any file...")
+            index.delete(ids=stale)
+            if migration:
+                migration.writer.index.delete(ids=stale)
+        if rel_path not in catalog.legacy_cleaned and not args.new_generation:
+            # The same text under the original per-position ids: drop them now
+            # that the content-hash vectors are stored, or search hits it twice
+            old = legacy_ids(source)
+            for i in range(0, len(old), 1000):
+                index.delete(ids=old[i:i + 1000])
+            if old:
+                print(f"🧹 Removed {len(old)} pre-CDC vectors of {source}")
+            catalog.legacy_cleaned.add(rel_path)
+        catalog.save()
+        journal.record_file(rel_path, sig)
         print(f"✅ Indexed {file_path} successfully!\n")
 
     except Exception as e:
         print(f"❌ Error indexing {file_path}: {e}")
+        failed_files += 1
+
+if not failed_files:
+    journal.compact()
+journal.close()
+if migration:
+    migration.close()
+catalog.report()
+
+if args.new_generation:
+    if failed_files:
+        print(f"⏸️ {failed_files} files failed — {INDEX_NAME} stays unpromoted; "
+              "re-run with --new-generation --resume.")
+    else:
+        catalog.save()
+        os.replace(GENERATION_CATALOG, CATALOG_PATH)
+        generations.promote(INDEX_NAME, stats={"files": len(transcript_files), "chunks": len(catalog.chunks)})
 
+# Retired generations past their grace period (and abandoned builds) would
+# otherwise pile up; every run collects them
+try:
+    generations.gc(pc)
+except Exception as e:
+    print(f"⚠️ Generation gc skipped: {e}")
 print("🎯 All transcript indexing complete.")
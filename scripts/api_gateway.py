@@ -8,6 +8,8 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os, openai, pinecone
 
+from embeddings import get_backend
+
 app = Flask(__name__)
 CORS(app)
 
@@ -17,6 +19,7 @@ pinecone_api_key = os.getenv("PINECONE_API_KEY")
 
 pc = pinecone.Pinecone(api_key=pinecone_api_key)
 index = pc.Index("forged-freedom")
+embedder = get_backend("openrouter", "text-embedding-3-large", index=index)
 
 @app.route("/")
 def home():
@@ -29,11 +32,8 @@ def query_pinecone():
     if not query:
         return jsonify({"error": "Missing query"}), 400
 
-    # Embed query via OpenAI
-    embed = openai.embeddings.create(
-        model="text-embedding-3-large",
-        input=query
-    ).data[0].embedding
+    # Embed query (OpenRouter by default, EMBED_BACKEND to override)
+    embed = embedder.embed_one(query)
 
     # Search Pinecone
     res = index.query(vector=embed, top_k=5, include_metadata=True)
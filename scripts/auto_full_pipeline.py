@@ -1,13 +1,47 @@
 #!/usr/bin/env python3
 """
 🚀 Forged By Freedom / ThinkBIG Full Automation Pipeline
-- Downloads latest YouTube videos per channel
+- Downloads latest YouTube videos per channel (download archive + concurrent,
+  bandwidth-capped fetches — youtube_fetch.py)
 - Transcribes using Whisper
-- Rebuilds master_transcript.txt
+- Cleans transcripts, chunks + embeds + upserts them to Pinecone
+  (when PINECONE_API_KEY is set) with the same bookkeeping as
+  Pinecone.index.upload.py: chunk catalog, ingest journal, migration
+  dual-write
+- Rebuilds master_transcript.txt once, only for channels that received
+  new transcripts this run (the dirty set)
 - Pushes updates to GitHub
+
+Stages run concurrently, connected by bounded queues (staged_pipeline.py):
+    fetch → transcribe → clean → chunk → embed → upsert
+so yt-dlp downloads and embedding calls proceed while Whisper keeps the CPU
+busy. Per-stage worker counts are flags:
+    python scripts/auto_full_pipeline.py --fetch-workers 2 --whisper-workers 1 --embed-workers 4
+
+Whisper runs in a persistent worker pool (whisper_pool.py): each worker
+loads the model once, so run this script with the venv that has Whisper.
+Episodes longer than 20 minutes are split at silences and their segments
+transcribed in parallel across the pool (segmented_transcribe.py).
 """
 
-import os, subprocess, datetime, glob, time
+import os, re, subprocess, datetime, glob, time, argparse, threading, itertools
+
+from staged_pipeline import Pipeline, Stage
+from whisper_pool import WhisperPool
+import segmented_transcribe
+from youtube_fetch import ChannelFetcher
+
+parser = argparse.ArgumentParser(description="Download, transcribe and index new episodes.")
+parser.add_argument("--fetch-workers", type=int, default=2, help="parallel yt-dlp channel downloads")
+parser.add_argument("--max-rate", default="20M", help="total download bandwidth cap across all fetches")
+parser.add_argument("--ytdlp", default="yt-dlp", help="yt-dlp command (scripts/fake_ytdlp.py for dry runs)")
+parser.add_argument("--whisper-workers", type=int, default=1, help="persistent Whisper worker processes")
+parser.add_argument("--whisper-threads", type=int, default=None, help="CPU threads per Whisper worker")
+parser.add_argument("--whisper-model", default="small")
+parser.add_argument("--embed-workers", type=int, default=4, help="parallel embedding API calls")
+parser.add_argument("--queue-size", type=int, default=8, help="bounded queue length between stages")
+parser.add_argument("--no-index", action="store_true", help="skip chunk / embed / upsert")
+args = parser.parse_args()
 
 # === CONFIG ===
 ROOT = "/Users/weero/thinkbig_podcast"
@@ -37,37 +71,210 @@ if not GIT_ROOT:
 
 # === MAIN FUNCTIONS ===
 def download_channel(channel_name):
+    """fetch stage: pull new audio, then emit (channel, mp3) for every untranscribed file."""
     log(f"🎧 Checking for new videos from {channel_name}...")
     ch_path = os.path.join(YT_ROOT, channel_name)
-    os.makedirs(ch_path, exist_ok=True)
-    subprocess.run([
-        "yt-dlp", "--extract-audio", "--audio-format", "mp3", "--audio-quality", "0",
-        "-o", f"{ch_path}/%(title)s [%(id)s].%(ext)s",
-        f"https://www.youtube.com/{channel_name}"
-    ], check=False)
-
-def transcribe_channel(channel_name):
-    ch_path = os.path.join(YT_ROOT, channel_name)
+    fetcher.fetch(channel_name)
+
     out_dir = os.path.join(TRANSCRIPTS, channel_name)
-    os.makedirs(out_dir, exist_ok=True)
-    audio_files = glob.glob(os.path.join(ch_path, "*.mp3"))
+    audio_files = sorted(glob.glob(os.path.join(ch_path, "*.mp3")))
     if not audio_files:
         log(f"⚙️ No new audio found for {channel_name}.")
-        return
     for audio in audio_files:
         base = os.path.splitext(os.path.basename(audio))[0]
-        txt_path = os.path.join(out_dir, f"{base}.txt")
-        if os.path.exists(txt_path):
+        if os.path.exists(os.path.join(out_dir, f"{base}.txt")):
             log(f"⏭️ Skipping {base} (already transcribed)")
             continue
-        log(f"🗣️ Transcribing {base}...")
-        subprocess.run([PYTHON, "-m", "whisper", audio, "--model", "small", "--output_dir", out_dir], check=False)
-        os.remove(audio)
-        log(f"✅ Finished {base}")
+        yield channel_name, audio
+
+def transcribe_audio(item):
+    """transcribe stage: Whisper one file, emit (channel, transcript path)."""
+    channel_name, audio = item
+    out_dir = os.path.join(TRANSCRIPTS, channel_name)
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.splitext(os.path.basename(audio))[0]
+    txt_path = os.path.join(out_dir, f"{base}.txt")
+    log(f"🗣️ Transcribing {base}...")
+    try:
+        m = segmented_transcribe.transcribe(whisper_pool, audio, txt_path)
+    except Exception as e:
+        raise RuntimeError(f"Whisper failed on {base} ({e}); audio kept for the next run")
+    os.remove(audio)
+    log(f"✅ Finished {base} in {m['seconds']}s (RTF {m['rtf']})")
+    yield channel_name, txt_path
+
+_BLANK_RUNS = re.compile(r"\n{3,}")
+LOOP_RUN = 3   # this many identical lines in a row is Whisper looping, not speech
+
+# Channels that received new transcripts this run
+dirty_channels = set()
+_dirty_lock = threading.Lock()
+
+def clean_transcript(item):
+    """
+    clean stage: strip trailing spaces, collapse Whisper's repeated-line loops
+    (LOOP_RUN or more identical lines become one), collapse blank runs.
+    A line said twice in a row is kept — repeats in speech are real.
+    """
+    channel_name, txt_path = item
+    with open(txt_path, "r", encoding="utf-8", errors="ignore") as f:
+        raw = f.read()
+    lines = []
+    for line, run in itertools.groupby(l.rstrip() for l in raw.splitlines()):
+        run = list(run)
+        lines += run[:1] if line and len(run) >= LOOP_RUN else run
+    text = _BLANK_RUNS.sub("\n\n", "\n".join(lines)).strip() + "\n"
+    if text != raw:
+        with open(txt_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    with _dirty_lock:
+        dirty_channels.add(channel_name)
+    yield channel_name, txt_path
+
+# === INDEXING STAGES (chunk → embed → upsert) ===
+# Same bookkeeping as Pinecone.index.upload.py: the chunk catalog skips
+# chunks already stored (and deletes the ones an edit orphaned), the ingest
+# journal checkpoints every committed batch, and an active migration gets
+# every vector dual-written.
+EMBED_BATCH = 32
+_catalog_lock = threading.Lock()
+failed_files = 0
+
+class FileIngest:
+    """One transcript in flight: finalized once chunking ended and every batch was upserted."""
+
+    def __init__(self, rel_path, sig):
+        self.rel_path, self.sig = rel_path, sig
+        self.refs, self.tokens = [], {}
+        self.pending, self.failed, self.chunked = 0, 0, False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{self.rel_path}>"
+
+    def add_batch(self):
+        with self._lock:
+            self.pending += 1
+
+    def batch_done(self, failed=0):
+        with self._lock:
+            self.pending -= 1
+            self.failed += failed
+            ready = self.chunked and not self.pending
+        if ready:
+            self.finalize()
+
+    def chunking_done(self):
+        with self._lock:
+            self.chunked = True
+            ready = not self.pending
+        if ready:
+            self.finalize()
+
+    def finalize(self):
+        global failed_files
+        if not self.refs:
+            return
+        if self.failed:
+            # Keep the catalog untouched so the next run retries this file.
+            log(f"❌ {self.failed} vectors failed for {self.rel_path}")
+            with _catalog_lock:
+                failed_files += 1
+            return
+        with _catalog_lock:
+            stale = catalog.set_file(self.rel_path, self.refs, self.tokens)
+            catalog.save()
+        if stale:
+            log(f"🧹 Removing {len(stale)} chunks no longer referenced by any file...")
+            writer.index.delete(ids=stale)
+            if migration:
+                migration.writer.index.delete(ids=stale)
+        journal.record_file(self.rel_path, self.sig)
+        log(f"🧠 Indexed {self.rel_path} ({len(self.refs)} chunks)")
+
+def chunk_transcript(item):
+    """chunk stage: content-defined token chunks not yet stored, emitted in embedding-sized batches."""
+    from chunking import content_vector_id, stream_token_chunks
+    from ingest_journal import file_signature
+
+    channel_name, txt_path = item
+    rel_path = os.path.relpath(txt_path, TRANSCRIPTS)
+    state = FileIngest(rel_path, file_signature(txt_path))
+    if journal.is_file_done(rel_path, state.sig):
+        return
+    committed = journal.committed_chunks(rel_path)
+    batch, seen = [], set()
+    for i, (chunk, start, end) in enumerate(stream_token_chunks(txt_path, ENC)):
+        if not chunk.strip():
+            continue
+        vid = content_vector_id(chunk)
+        state.refs.append((vid, i))
+        with _catalog_lock:
+            catalog.seen += 1
+            if vid in seen:
+                # Repeated inside this file
+                catalog.count_duplicate(vid, len(ENC.encode(chunk, disallowed_special=())))
+                continue
+            if catalog.has(vid):
+                # Already stored: unchanged, or the same text from another episode
+                if catalog.referenced_elsewhere(vid, rel_path):
+                    catalog.count_duplicate(vid)
+                continue
+        seen.add(vid)
+        if vid in committed:
+            continue
+        state.tokens[vid] = len(ENC.encode(chunk, disallowed_special=()))
+        batch.append((vid, chunk, {
+            "source": os.path.basename(txt_path),
+            "channel": channel_name,
+            "chunk_index": i,
+            "byte_start": start,
+            "byte_end": end,
+            "text": chunk[:1500],
+        }))
+        if len(batch) >= EMBED_BATCH:
+            state.add_batch()
+            yield state, batch
+            batch = []
+    if batch:
+        state.add_batch()
+        yield state, batch
+    state.chunking_done()
+
+def embed_chunks(item):
+    """embed stage: one embedding API call per batch."""
+    state, batch = item
+    try:
+        embeddings = embedder.embed([chunk for _, chunk, _ in batch])
+    except Exception:
+        state.batch_done(failed=len(batch))
+        raise
+    yield state, batch, [
+        {"id": vid, "values": emb, "metadata": {**meta, **embedder.metadata()}}
+        for (vid, _, meta), emb in zip(batch, embeddings)
+    ]
+
+def upsert_vectors(item):
+    """upsert stage: size-aware parallel upsert, checkpoint, migration dual-write; nothing flows further."""
+    state, batch, vectors = item
+    report = writer.write(vectors, verbose=False)
+    bad = {vid for vid, _ in report.failed}
+    journal.record_chunks(state.rel_path, (v["id"] for v in vectors if v["id"] not in bad))
+    if migration:
+        # Target-side failures are left for the backfill to pick up
+        migration.write([b for b in batch if b[0] not in bad], state.rel_path)
+    state.batch_done(failed=len(bad))
+    if bad:
+        raise RuntimeError(f"{len(bad)} of {len(vectors)} vectors failed to upsert")
 
-def rebuild_master_transcripts():
-    log("🏗️ Rebuilding master transcripts...")
-    subprocess.run([PYTHON, os.path.join(TRANSCRIPTS, "build_master_transcripts.py")], check=False)
+def rebuild_master_transcripts(channels):
+    """One incremental rebuild restricted to `channels`; unchanged channels cost nothing."""
+    if not channels:
+        log("⏭️ No new transcripts — master rebuild skipped.")
+        return
+    log(f"🏗️ Rebuilding master transcripts for {len(channels)} channel(s): {', '.join(channels)}")
+    builder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build_master_transcripts.py")
+    subprocess.run([PYTHON, builder, "--channels", *channels], cwd=os.path.dirname(TRANSCRIPTS), check=False)
 
 def git_push():
     log("📤 Syncing updates to GitHub...")
@@ -77,17 +284,67 @@ def git_push():
 
 # === EXECUTION ===
 log("=== 🚀 Starting Full ThinkBIG Podcast Automation ===")
-channels = [d for d in os.listdir(TRANSCRIPTS) if d.startswith("@")]
-for ch in channels:
-    start = time.time()
-    log(f"\n🔹 Processing {ch}")
-    try:
-        download_channel(ch)
-        transcribe_channel(ch)
-        rebuild_master_transcripts()
-        log(f"✅ {ch} processed in {round(time.time() - start, 1)}s")
-    except Exception as e:
-        log(f"❌ Error on {ch}: {e}")
+channels = sorted(d for d in os.listdir(TRANSCRIPTS) if d.startswith("@"))
+
+fetcher = ChannelFetcher(YT_ROOT, TRANSCRIPTS, max_concurrent=args.fetch_workers,
+                         max_rate=args.max_rate, ytdlp=args.ytdlp, log=log)
+log(f"🗂️ Download archive: {fetcher.seed_archive()} ids added from existing filenames")
+
+stages = [
+    Stage("fetch", download_channel, workers=args.fetch_workers, queue_size=args.queue_size),
+    Stage("transcribe", transcribe_audio, workers=args.whisper_workers, queue_size=args.queue_size),
+    Stage("clean", clean_transcript, workers=1, queue_size=args.queue_size),
+]
+if not args.no_index and os.getenv("PINECONE_API_KEY"):
+    import tiktoken
+    from pinecone import Pinecone
+
+    from chunk_catalog import ChunkCatalog
+    from embeddings import check_dimension, get_backend
+    from index_generations import resolve_alias
+    from index_migration import Migration
+    from ingest_journal import JOURNAL_PATH, IngestJournal
+    from pinecone_writer import UpsertWriter
+
+    ENC = tiktoken.get_encoding("cl100k_base")
+    embedder = get_backend("openai", "text-embedding-3-large")
+    index_name = resolve_alias(os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai"))
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+    writer = UpsertWriter(pc.Index(index_name))
+    check_dimension(embedder, writer.index)
+    migration = Migration.active(pc)
+    # Shared with Pinecone.index.upload.py, which runs from the repo root
+    catalog = ChunkCatalog(os.path.join(TRANSCRIPTS, "chunk_catalog.json"))
+    journal = IngestJournal(os.path.join(ROOT, JOURNAL_PATH), resume=True)
+    log(f"🧠 Indexing new transcripts into {index_name} with {embedder}")
+    if migration:
+        log(f"🔀 Migration active: also writing {migration.state['target']['index']} ({migration.backend})")
+    stages += [
+        Stage("chunk", chunk_transcript, workers=1, queue_size=args.queue_size),
+        Stage("embed", embed_chunks, workers=args.embed_workers, queue_size=args.queue_size),
+        Stage("upsert", upsert_vectors, workers=2, queue_size=args.queue_size),
+    ]
+else:
+    migration = journal = None
+    log("ℹ️ Indexing disabled (--no-index or no PINECONE_API_KEY).")
+
+start = time.time()
+# Started before the pipeline threads, so workers are forked from a single-threaded parent
+whisper_pool = WhisperPool(args.whisper_workers, args.whisper_model, args.whisper_threads, log=log).start()
+pipeline = Pipeline(stages, log=log)
+pipeline.run(channels)
+whisper_pool.close()
+if journal:
+    if not failed_files:
+        journal.compact()
+    journal.close()
+    catalog.report(os.path.join(TRANSCRIPTS, "chunk_dedupe_report.json"))
+if migration:
+    migration.close()
+pipeline.report()
+whisper_pool.report()
+log(f"✅ {len(channels)} channels processed in {round(time.time() - start, 1)}s")
 
+rebuild_master_transcripts(sorted(dirty_channels))
 git_push()
 log("=== ✅ All channels updated & pushed ===")
@@ -7,24 +7,55 @@ Combines all individual transcript .txt files into per-channel master transcript
 ✨ Features:
 - Scans all subfolders in /transcripts/
 - Groups by channel (folder name)
-- Concatenates text files in sorted order
+- Concatenates text files in sorted order — plain .txt or packed episodes
+  (transcript_store.py), read through the same interface
 - Skips duplicate or empty files
+- Incremental: each master has a hidden sidecar (.master_transcript.txt.inputs.json)
+  recording its inputs (name, size, mtime, hash). Untouched channels are
+  skipped after a directory scan, new episodes that sort last are appended,
+  and only a changed or deleted input (or `--full`) forces a rewrite
+- Streams bytes, never whole files: inputs are copied through one 1 MiB
+  buffer (hashed, UTF-8 validated and word-counted on the way), and on a
+  rewrite every input the sidecar already vouches for is copied by the
+  kernel (copy_file_range / sendfile) without entering Python at all
+- Sharded output: a master rolls over to master_transcript2.txt, 3, … every
+  `--shard-mb` (default 100 MB, sizes tracked in memory), and
+  master_transcript.index.json maps each episode to its shard, byte offset,
+  length and md5 so a reader can seek straight to it (see read_episode)
 - Builds:
-    • transcripts/<channel>/master_transcript.txt
+    • transcripts/<channel>/master_transcript.txt (+ shards, index)
     • transcripts/master_manifest.json
     • transcripts/transcripts_summary.json
     • transcripts/stats.json
+- Channels are built in parallel on a process pool (`--workers`, default
+  one per core); results and logs are merged in channel order
+- `--channels @A @B` rebuilds only those channels and merges them into the
+  existing manifest (used by auto_full_pipeline.py for its dirty set)
 """
 
+import argparse
+import codecs
+import contextlib
+import io
+import multiprocessing
 import os
 import json
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from transcript_store import list_transcripts, open_transcript
+from wordcount import WordCounter
+
 TRANSCRIPTS_DIR = "transcripts"
+OUTPUT_NAME = "master_transcript.txt"
 MANIFEST_PATH = os.path.join(TRANSCRIPTS_DIR, "master_manifest.json")
 SUMMARY_PATH = os.path.join(TRANSCRIPTS_DIR, "transcripts_summary.json")
 STATS_PATH = os.path.join(TRANSCRIPTS_DIR, "stats.json")
+BLOCK_SIZE = 1 << 20
+SHARD_BYTES = 100 << 20   # master_transcript.txt, master_transcript2.txt, … of ≤ 100 MB each
+# bytes str.strip() removes at either end of a file (ASCII whitespace)
+WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
 
 
 def file_md5(path: str) -> str:
@@ -43,77 +74,488 @@ def get_channel_folders():
     return sorted(folders)
 
 
-def build_channel_master(channel_path: str):
-    """Combine all transcript files in a channel folder into one master transcript."""
-    channel_name = os.path.basename(channel_path)
-    output_file = os.path.join(channel_path, "master_transcript.txt")
-    seen_hashes = set()
-    parts = []
-    total_words = 0
-    files_processed = 0
-
-    txt_files = sorted(
-        [
-            f
-            for f in os.listdir(channel_path)
-            if f.endswith(".txt") and not f.startswith("master_transcript")
-        ]
-    )
-
-    if not txt_files:
-        print(f"[WARN] No .txt files found in {channel_name}, skipping.")
-        return None
+def _inputs_path(output_file: str) -> str:
+    """Hidden sidecar next to a master file recording the inputs it was built from."""
+    folder, name = os.path.split(output_file)
+    return os.path.join(folder, f".{name}.inputs.json")
+
+
+def scan_inputs(channel_path: str):
+    """
+    Sorted (name, size, mtime_ns) of a channel's transcripts, plain or packed
+    (transcript_store.py) — one directory scan, no reads.
+    """
+    return list_transcripts(channel_path)
+
+
+def _read_input(path: str):
+    """Return (stripped text, md5 of it) or (None, None) if unreadable — fallback for non-UTF-8 files."""
+    try:
+        with open_transcript(path) as f:
+            text = f.read().strip()
+    except Exception as e:
+        print(f"[WARN] Could not read {path}: {e}")
+        return None, None
+    return text, hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# 📦 Byte-level streaming
+# ============================================================
+def _write_all(fd: int, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
-    for filename in txt_files:
-        path = os.path.join(channel_path, filename)
+
+def _rollback(fd: int, mark: int):
+    """Drop everything written to fd after offset `mark`."""
+    os.ftruncate(fd, mark)
+    os.lseek(fd, mark, os.SEEK_SET)
+
+
+def _body_range(f, size: int):
+    """(start, end) byte offsets of a file's text with surrounding whitespace stripped."""
+    start = 0
+    while start < size:
+        f.seek(start)
+        block = f.read(BLOCK_SIZE)
+        if not block:
+            return start, start
+        rest = block.lstrip(WHITESPACE)
+        if rest:
+            start += len(block) - len(rest)
+            break
+        start += len(block)
+    end = size
+    while end > start:
+        n = min(BLOCK_SIZE, end - start)
+        f.seek(end - n)
+        rest = f.read(n).rstrip(WHITESPACE)
+        if rest:
+            return start, end - n + len(rest)
+        end -= n
+    return start, start
+
+
+def _stream_body(f, start: int, end: int, out_fd: int = None, buf: bytearray = None):
+    """
+    Copy f[start:end] to out_fd through one reusable buffer (or just read it
+    when out_fd is None), hashing it, validating UTF-8 incrementally and
+    counting words across block boundaries.
+
+    Returns (md5, words, bytes), or None as soon as a block is not valid UTF-8 —
+    bytes already written are the caller's to truncate.
+    """
+    buf = buf or bytearray(BLOCK_SIZE)
+    view = memoryview(buf)
+    md5 = hashlib.md5()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    counter = WordCounter()
+    f.seek(start)
+    pos = start
+    while pos < end:
+        n = f.readinto(view[: min(len(buf), end - pos)])
+        if not n:
+            break
+        chunk = view[:n]
+        pos += n
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                text = f.read().strip()
-        except Exception as e:
-            print(f"[WARN] Could not read {path}: {e}")
+            decoder.decode(chunk, final=pos >= end)
+        except UnicodeDecodeError:
+            return None
+        md5.update(chunk)
+        counter.update(chunk)
+        if out_fd is not None:
+            _write_all(out_fd, chunk)
+    return md5.hexdigest(), counter.finish(), pos - start
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """
+    Kernel-side copy of src[offset:offset+count] to dst's position
+    (copy_file_range → sendfile → buffer); returns the bytes copied.
+    """
+    done = 0
+    for copy in (
+        getattr(os, "copy_file_range", None) and (lambda n: os.copy_file_range(src_fd, dst_fd, n, offset + done)),
+        getattr(os, "sendfile", None) and (lambda n: os.sendfile(dst_fd, src_fd, offset + done, n)),
+    ):
+        if not copy:
             continue
+        try:
+            while done < count:
+                n = copy(count - done)
+                if not n:
+                    return done     # source shrank underneath us
+                done += n
+            return done
+        except OSError:
+            continue                # unsupported here (cross-device, macOS file→file, …)
+    os.lseek(src_fd, offset + done, os.SEEK_SET)
+    while done < count:
+        block = os.read(src_fd, min(BLOCK_SIZE, count - done))
+        if not block:
+            break
+        _write_all(dst_fd, block)
+        done += len(block)
+    return done
+
+
+def _input_digest(path: str):
+    """md5 of a file's stripped text without materializing it."""
+    try:
+        with open_transcript(path, "rb", buffering=0) as f:
+            result = _stream_body(f, *_body_range(f, f.seek(0, os.SEEK_END)))
+    except OSError as e:
+        print(f"[WARN] Could not read {path}: {e}")
+        return None
+    return result[0] if result else _read_input(path)[1]
+
+
+def shard_name(output_name: str, n: int) -> str:
+    """Shard n of a master: 1 is output_name itself, then <stem>2<ext>, <stem>3<ext>, …"""
+    if n == 1:
+        return output_name
+    stem, ext = os.path.splitext(output_name)
+    return f"{stem.rstrip('0123456789')}{n}{ext}"
+
+
+def index_path(channel_path: str, output_name: str = OUTPUT_NAME) -> str:
+    """Episode index next to a channel's master shards (master_transcript.index.json)."""
+    stem = os.path.splitext(output_name)[0].rstrip("0123456789")
+    return os.path.join(channel_path, f"{stem}.index.json")
+
+
+class ShardedWriter:
+    """
+    Writes a master transcript as shards of at most `max_bytes` each (an
+    episode is never split across shards; one bigger than max_bytes gets a
+    shard to itself).
+
+    Shard sizes are tracked in memory from the bytes written — the file
+    system is never asked — so rolling over costs nothing per write.
+    """
+
+    def __init__(self, channel_path: str, output_name: str, max_bytes: int, sizes=None):
+        self.channel_path = channel_path
+        self.output_name = output_name
+        self.max_bytes = max_bytes
+        self.sizes = list(sizes or [0])   # bytes per shard; appends resume the last one
+        self.fd = None
+
+    def path(self, n: int) -> str:
+        return os.path.join(self.channel_path, shard_name(self.output_name, n))
+
+    @property
+    def shard(self) -> str:
+        return shard_name(self.output_name, len(self.sizes))
+
+    def _open(self, truncate: bool):
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if truncate else 0) | getattr(os, "O_BINARY", 0)
+        self.fd = os.open(self.path(len(self.sizes)), flags, 0o644)
+        os.lseek(self.fd, self.sizes[-1], os.SEEK_SET)
+
+    def open(self, truncate: bool = False):
+        if truncate:
+            self.sizes = [0]
+        self._open(truncate)
+        return self
+
+    def make_room(self, incoming: int):
+        """Start a new shard if `incoming` more bytes would push a non-empty shard past max_bytes."""
+        if self.max_bytes and self.sizes[-1] and self.sizes[-1] + incoming > self.max_bytes:
+            os.close(self.fd)
+            self.sizes.append(0)
+            self._open(truncate=True)
 
+    def close(self):
+        """Close the last shard, drop it if it stayed empty, and delete shards left over from a longer build."""
+        os.close(self.fd)
+        if len(self.sizes) > 1 and not self.sizes[-1]:
+            os.remove(self.path(len(self.sizes)))
+            self.sizes.pop()
+        n = len(self.sizes) + 1
+        while os.path.exists(self.path(n)):
+            os.remove(self.path(n))
+            n += 1
+        return self.sizes
+
+
+def _plan(channel_path: str, output_name: str, scanned, full: bool):
+    """
+    Decide how to bring one master file up to date.
+
+    Returns ("skip" | "append" | "rewrite", previous state or None, new input names).
+    Inputs whose size+mtime changed are re-hashed, so a fresh checkout (new
+    mtimes, same bytes) is still a skip rather than a rewrite. A rewrite
+    still returns the previous state when there is one, so inputs it
+    vouches for can be copied without being read.
+    """
+    state_path = _inputs_path(os.path.join(channel_path, output_name))
+    if full or not os.path.exists(state_path):
+        return "rewrite", None, []
+    with open(state_path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    for n, size in enumerate(state.get("shards") or [None], 1):
+        path = os.path.join(channel_path, shard_name(output_name, n))
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            return "rewrite", state, []  # master edited or truncated outside the builder
+
+    recorded = {i["name"]: i for i in state["inputs"]}
+    names = {name for name, _, _ in scanned}
+    if set(recorded) - names:
+        return "rewrite", state, []     # an input was deleted
+    for name, size, mtime in scanned:
+        rec = recorded.get(name)
+        if rec and (rec["size"], rec["mtime_ns"]) != (size, mtime):
+            if rec["size"] != size or _input_digest(os.path.join(channel_path, name)) != rec["md5"]:
+                return "rewrite", state, []  # an input changed
+            rec["mtime_ns"] = mtime      # touched only
+
+    new = [name for name, _, _ in scanned if name not in recorded]
+    if not new:
+        return "skip", state, []
+    last = state["inputs"][-1]["name"] if state["inputs"] else ""
+    if all(name > last for name in new):
+        return "append", state, new     # new episodes sort after everything already written
+    return "rewrite", state, []
+
+
+def _add_input(out_fd: int, mark: int, path: str, filename: str, record: dict, known: dict,
+               seen_hashes: set, buf: bytearray) -> int:
+    """
+    Append one transcript at offset `mark` of the open shard: separator +
+    body as raw bytes. Returns the shard's new size.
+
+    An input the previous sidecar vouches for (same size and mtime, valid
+    UTF-8) is copied by the kernel without entering Python (packed episodes,
+    which have no file descriptor, are streamed instead); anything else is
+    streamed through `buf` once, and rolled back by truncation if it turns
+    out empty, duplicate or not UTF-8 (the latter falls back to the old
+    decode-with-errors="ignore" path). An included record gets the
+    `offset` / `length` of its body in the shard.
+    """
+    sep = (b"\n" if mark else b"") + f"\n\n=== {filename} ===\n".encode("utf-8")
+    length = 0
+    try:
+        with open_transcript(path, "rb", buffering=0) as f:
+            if known and known.get("body"):
+                start, end = known["body"]
+                record.update(md5=known["md5"], words=known["words"], body=known["body"])
+                if start < end and known["md5"] not in seen_hashes:
+                    _write_all(out_fd, sep)
+                    if isinstance(f, io.FileIO):
+                        length = _copy_range(f.fileno(), out_fd, start, end - start)
+                    else:
+                        length = (_stream_body(f, start, end, out_fd, buf) or (None, 0, 0))[2]
+            else:
+                start, end = _body_range(f, record["size"])
+                if start < end:
+                    _write_all(out_fd, sep)
+                    result = _stream_body(f, start, end, out_fd, buf)
+                else:
+                    result = (hashlib.md5().hexdigest(), 0, 0)
+                if result:
+                    record.update(md5=result[0], words=result[1], body=[start, end])
+                    length = result[2]
+    except OSError as e:
+        print(f"[WARN] Could not read {path}: {e}")
+        record["md5"] = None
+        _rollback(out_fd, mark)
+        return mark
+
+    if not record.get("body"):
+        _rollback(out_fd, mark)
+        text, digest = _read_input(path)
+        record["md5"] = digest
         if not text:
-            print(f"[WARN] Empty file skipped: {filename}")
-            continue
+            record["body"] = [0, 0]
+        elif digest not in seen_hashes:
+            data = text.encode("utf-8")
+            _write_all(out_fd, sep + data)
+            record["words"] = len(text.split())
+            length = len(data)
+            # body stays None: the master holds a cleaned copy, not a byte range
 
-        file_hash = hashlib.md5(text.encode("utf-8")).hexdigest()
-        if file_hash in seen_hashes:
-            print(f"[WARN] Duplicate file skipped: {filename}")
-            continue
+    start, end = record["body"] or (0, 1)
+    if start >= end:
+        print(f"[WARN] Empty file skipped: {filename}")
+    elif record["md5"] in seen_hashes:
+        print(f"[WARN] Duplicate file skipped: {filename}")
+        _rollback(out_fd, mark)
+    else:
+        seen_hashes.add(record["md5"])
+        record.update(included=True, offset=mark + len(sep), length=length)
+        return mark + len(sep) + length
+    record["words"] = 0
+    return mark
 
-        seen_hashes.add(file_hash)
-        parts.append(f"\n\n=== {filename} ===\n{text}")
-        total_words += len(text.split())
-        files_processed += 1
 
-    if not parts:
-        print(f"[WARN] No valid text content found in {channel_name}. Skipping.")
+def write_index(channel_path: str, output_name: str, inputs):
+    """Write the (episode, shard, offset, length, md5) index of every included episode."""
+    episodes = [
+        {"episode": i["name"], "shard": i["shard"], "offset": i["offset"], "length": i["length"], "md5": i["md5"]}
+        for i in inputs if i["included"]
+    ]
+    tmp = index_path(channel_path, output_name) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"channel": os.path.basename(channel_path), "episodes": episodes}, f, indent=1)
+    os.replace(tmp, index_path(channel_path, output_name))
+
+
+def read_episode(channel_path: str, episode: str, output_name: str = OUTPUT_NAME) -> str:
+    """One episode's text straight from its shard via the index — a seek and a read, no scan."""
+    with open(index_path(channel_path, output_name), "r", encoding="utf-8") as f:
+        entry = next(e for e in json.load(f)["episodes"] if e["episode"] == episode)
+    with open(os.path.join(channel_path, entry["shard"]), "rb") as f:
+        f.seek(entry["offset"])
+        return f.read(entry["length"]).decode("utf-8")
+
+
+def build_channel_master(channel_path: str, output_name: str = OUTPUT_NAME, full: bool = False,
+                         shard_bytes: int = SHARD_BYTES):
+    """
+    Bring a channel's master transcript up to date.
+
+    Untouched channels cost one directory scan; new episodes that sort after
+    the existing ones are appended; anything else is a full rewrite. Bytes go
+    from input to master without being decoded into Python strings, so
+    memory stays at one BLOCK_SIZE buffer whatever the channel size. Output
+    rolls over to a new shard every `shard_bytes` (0 = one file).
+    """
+    channel_name = os.path.basename(channel_path)
+    output_file = os.path.join(channel_path, output_name)
+    scanned = scan_inputs(channel_path)
+
+    if not scanned:
+        print(f"[WARN] No transcripts found in {channel_name}, skipping.")
         return None
 
-    combined = "\n".join(parts)
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(combined)
+    mode, state, new_names = _plan(channel_path, output_name, scanned, full)
+    stats = {name: (size, mtime) for name, size, mtime in scanned}
+
+    if mode == "skip":
+        with open(_inputs_path(output_file), "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=1)     # persists refreshed mtimes
+        print(f"[SKIP] {channel_name} unchanged.")
+        return state["info"]
+
+    known = {}
+    if mode == "append":
+        inputs = state["inputs"]
+        todo = new_names
+        seen_hashes = {i["md5"] for i in inputs if i["included"]}
+        writer = ShardedWriter(channel_path, output_name, shard_bytes, state["shards"]).open()
+    else:
+        inputs, todo, seen_hashes = [], [name for name, _, _ in scanned], set()
+        for rec in state["inputs"] if state else ():
+            if stats.get(rec["name"]) == (rec["size"], rec["mtime_ns"]) and rec.get("md5"):
+                known[rec["name"]] = rec
+        writer = ShardedWriter(channel_path, output_name, shard_bytes).open(truncate=True)
 
-    print(f"[OK] Created {output_file} — {files_processed} files, {total_words:,} words.")
-    return {
+    buf = bytearray(BLOCK_SIZE)
+    added = 0
+    try:
+        for filename in todo:
+            record = {"name": filename, "size": stats[filename][0], "mtime_ns": stats[filename][1],
+                      "md5": None, "words": 0, "included": False, "body": None}
+            inputs.append(record)
+            writer.make_room(record["size"])
+            writer.sizes[-1] = _add_input(writer.fd, writer.sizes[-1], os.path.join(channel_path, filename),
+                                          filename, record, known.get(filename), seen_hashes, buf)
+            if record["included"]:
+                record["shard"] = writer.shard
+                added += 1
+    finally:
+        shards = writer.close()
+
+    included = [i for i in inputs if i["included"]]
+    if not included:
+        print(f"[WARN] No valid text content found in {channel_name}. Skipping.")
+        return None
+
+    info = {
         "channel": channel_name,
-        "files": files_processed,
-        "words": total_words,
+        "files": len(included),
+        "words": sum(i["words"] for i in included),
         "output": output_file,
+        "shards": len(shards),
         "updated": datetime.now().isoformat(),
     }
+    with open(_inputs_path(output_file), "w", encoding="utf-8") as f:
+        json.dump({"shards": shards, "info": info, "inputs": inputs}, f, indent=1)
+    write_index(channel_path, output_name, inputs)
 
+    verb = f"Appended {added} new files to" if mode == "append" else "Created"
+    print(f"[{'APPEND' if mode == 'append' else 'OK'}] {verb} {output_file} — "
+          f"{info['files']} files, {info['words']:,} words, {len(shards)} shard(s).")
+    return info
 
-def build_all_channels():
-    """Rebuild all master transcripts and generate summary + stats files."""
+
+def _build_one(job):
+    """Pool task: build one channel, capturing its log so the parent can print it in order."""
+    channel_path, output_name, full, shard_bytes = job
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            info = build_channel_master(channel_path, output_name, full, shard_bytes)
+        except Exception as e:
+            print(f"[ERROR] {os.path.basename(channel_path)}: {type(e).__name__}: {e}")
+            info = None
+    return info, log.getvalue()
+
+
+def build_channels(folders, output_name: str = OUTPUT_NAME, full: bool = False, workers: int = None,
+                   shard_bytes: int = SHARD_BYTES):
+    """
+    Build many channels' masters on a process pool; returns their infos in
+    `folders` order (None for a skipped or failed channel).
+
+    Channels are independent, so each worker owns whole channels: its reads,
+    hashing, duplicate checks and sidecar. Logs are replayed in folder order,
+    so the output does not depend on which channel finishes first.
+    """
+    jobs = [(folder, output_name, full, shard_bytes) for folder in folders]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    # fork where available: callers run top-level code a spawned worker would re-execute
+    ctx = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    infos = []
+    with ProcessPoolExecutor(workers, mp_context=ctx) if workers > 1 else contextlib.nullcontext() as pool:
+        for info, log in (pool.map if pool else map)(_build_one, jobs):
+            print(log, end="")
+            infos.append(info)
+    return infos
+
+
+def build_all_channels(channels=None, full: bool = False, workers: int = None, shard_bytes: int = SHARD_BYTES):
+    """
+    Update master transcripts and generate summary + stats files.
+
+    With `channels`, only those channel folders are rebuilt; every other
+    channel keeps its entry from the existing manifest.
+    Channels are built on `workers` processes (default: one per core) and
+    merged in channel order.
+    """
     os.makedirs(TRANSCRIPTS_DIR, exist_ok=True)
     manifest = []
+    folders = get_channel_folders()
+
+    if channels is not None:
+        wanted = {os.path.basename(c.rstrip("/")) for c in channels}
+        if os.path.exists(MANIFEST_PATH):
+            with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+                existing = {item["channel"]: item for item in json.load(f)}
+        else:
+            existing = {}
+        for folder in folders:
+            name = os.path.basename(folder)
+            if name not in wanted and name in existing:
+                manifest.append(existing[name])
+        folders = [f for f in folders if os.path.basename(f) in wanted]
 
-    for channel_folder in get_channel_folders():
-        info = build_channel_master(channel_folder)
-        if info:
-            manifest.append(info)
+    manifest += [info for info in build_channels(folders, full=full, workers=workers, shard_bytes=shard_bytes) if info]
+    manifest.sort(key=lambda item: item["channel"])
 
     if not manifest:
         print("[WARN] No channels processed — verify your transcripts directory.")
@@ -152,4 +594,11 @@ def build_all_channels():
 
 
 if __name__ == "__main__":
-    build_all_channels()
+    parser = argparse.ArgumentParser(description="Build per-channel master transcripts.")
+    parser.add_argument("--channels", nargs="+", help="only rebuild these channel folders")
+    parser.add_argument("--full", action="store_true", help="ignore the input sidecars and rewrite everything")
+    parser.add_argument("--workers", type=int, default=None, help="channel build processes (default: CPU count)")
+    parser.add_argument("--shard-mb", type=float, default=SHARD_BYTES / (1 << 20),
+                        help="roll master output over to a new shard after this many MB (0 = never)")
+    args = parser.parse_args()
+    build_all_channels(args.channels, args.full, args.workers, int(args.shard_mb * (1 << 20)))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+chunk_catalog.py — Forged by Freedom Chunk Catalog
+────────────────────────────────────────────────────────────────────────────
+Local record of which chunks are stored in the vector index and which
+transcript files reference them.
+
+✨ Features:
+- Chunks are keyed by content (normalized-text hash), so a sponsor read or
+  intro repeated across 1,000 episodes is embedded and stored ONCE
+- Every stored chunk keeps a list of source references ("file#chunk")
+- Replacing a file's chunk list returns the chunks nobody references any
+  more, so the caller can delete exactly those vectors
+- Counts vectors and tokens avoided by dedupe for the run report
+
+File layout (transcripts/chunk_catalog.json):
+    {"chunks": {vector_id: {"refs": [...], "tokens": n}},
+     "files":  {rel_path: [vector_id, ...]},
+     "legacy_cleaned": [rel_path, ...]}    # pre-CDC `{basename}_{i}` ids deleted
+"""
+
+import json
+import os
+
+CATALOG_PATH = os.path.join("transcripts", "chunk_catalog.json")
+REPORT_PATH = os.path.join("transcripts", "chunk_dedupe_report.json")
+
+
+class ChunkCatalog:
+    """Content-addressed chunk → source-reference catalog."""
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self.chunks = {}
+        self.files = {}
+        self.legacy_cleaned = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if "files" in data:
+                self.chunks, self.files = data.get("chunks", {}), data["files"]
+                self.legacy_cleaned = set(data.get("legacy_cleaned", []))
+            else:
+                # Older catalogs were a plain {rel_path: [ids]} mapping; their
+                # per-file ids come back as orphans and get deleted on rewrite.
+                self.files = data
+
+        self.seen = 0              # chunks encountered this run
+        self.embedded = 0          # chunks sent to the embedding API
+        self.dupes = 0             # chunks skipped because the content was already stored
+        self.tokens_avoided = 0
+
+    def has(self, vector_id: str) -> bool:
+        return vector_id in self.chunks
+
+    def referenced_elsewhere(self, vector_id: str, rel_path: str) -> bool:
+        """True if a file other than rel_path references this chunk."""
+        refs = self.chunks.get(vector_id, {}).get("refs", [])
+        return any(r.rsplit("#", 1)[0] != rel_path for r in refs)
+
+    def count_duplicate(self, vector_id: str, tokens: int = None):
+        """Record that a chunk was not embedded because its content is already stored."""
+        self.dupes += 1
+        self.tokens_avoided += tokens if tokens is not None else self.chunks.get(vector_id, {}).get("tokens", 0)
+
+    def set_file(self, rel_path: str, refs, tokens: dict = None):
+        """
+        Replace the chunk references of one file.
+
+        refs: [(vector_id, chunk_index)]; tokens: {vector_id: n} for new chunks.
+        Returns vector ids that are no longer referenced by any file.
+        """
+        tokens = tokens or {}
+        old = set(self.files.get(rel_path, []))
+        for vid in old:
+            entry = self.chunks.get(vid)
+            if entry:
+                entry["refs"] = [r for r in entry["refs"] if r.rsplit("#", 1)[0] != rel_path]
+
+        ids = []
+        for vid, i in refs:
+            entry = self.chunks.setdefault(vid, {"refs": [], "tokens": tokens.get(vid, 0)})
+            entry["refs"].append(f"{rel_path}#{i}")
+            if vid not in ids:
+                ids.append(vid)
+        self.files[rel_path] = ids
+
+        orphans = sorted(v for v in old if not self.chunks.get(v, {}).get("refs"))
+        for vid in orphans:
+            self.chunks.pop(vid, None)
+        return orphans
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"chunks": self.chunks, "files": self.files,
+                       "legacy_cleaned": sorted(self.legacy_cleaned)}, f, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def report(self, path: str = REPORT_PATH) -> dict:
+        """Write and return the dedupe summary for this run."""
+        shared = sum(1 for c in self.chunks.values() if len(c["refs"]) > 1)
+        summary = {
+            "chunks_seen": self.seen,
+            "chunks_embedded": self.embedded,
+            "vectors_avoided": self.dupes,
+            "tokens_avoided": self.tokens_avoided,
+            "stored_chunks": len(self.chunks),
+            "stored_chunks_shared": shared,
+            "references": sum(len(c["refs"]) for c in self.chunks.values()),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"♻️ Dedupe: {self.dupes:,} of {self.seen:,} chunks already stored — "
+              f"{self.tokens_avoided:,} tokens not embedded ({shared:,} stored chunks shared by several files)")
+        return summary
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+chunking.py — Forged by Freedom Transcript Chunkers
+────────────────────────────────────────────────────────────────────────────
+Shared chunking helpers for the ingestion scripts.
+
+✨ Content-defined chunking:
+- A rolling hash over the last WINDOW words/tokens decides where chunks end
+- Boundaries depend only on local content, so an edit near the start of a
+  transcript shifts one or two chunks instead of every chunk after it
+- min/max bounds keep chunk sizes inside the embedding model limits
+- chunk_hash() gives each chunk a content id, so unchanged chunks keep
+  their vector id and never need to be re-embedded
+"""
+
+import hashlib
+import re
+import zlib
+
+# ============================================================
+# ⚙️ Defaults
+# ============================================================
+ROLLING_WINDOW = 16
+ROLLING_BASE = 0x100000001B3
+MASK64 = (1 << 64) - 1
+
+WORD_MIN, WORD_AVG, WORD_MAX = 200, 400, 800
+TOKEN_MIN, TOKEN_AVG, TOKEN_MAX = 1500, 3000, 3500
+
+_WS_RE = re.compile(r"\s+")
+
+
+# ============================================================
+# 🧮 Rolling-hash boundaries
+# ============================================================
+def _unit_value(unit) -> int:
+    """Map a word (str) or token (int) to a well-mixed 64-bit value."""
+    if isinstance(unit, int):
+        return ((unit + 1) * 0x9E3779B97F4A7C15) & MASK64
+    return (zlib.crc32(unit.encode("utf-8")) * 0x9E3779B97F4A7C15) & MASK64
+
+
+def content_defined_spans(units, min_size: int, avg_size: int, max_size: int,
+                          window: int = ROLLING_WINDOW):
+    """
+    Yield (start, end) spans over `units` with content-defined boundaries.
+
+    A boundary is placed after a unit when the rolling hash of the last
+    `window` units has its top bits all zero (expected gap ≈ avg_size), or
+    when a chunk reaches max_size. No boundary is placed before min_size.
+    """
+    if not (0 < min_size <= avg_size <= max_size):
+        raise ValueError("chunk sizes must satisfy 0 < min <= avg <= max")
+
+    n = len(units)
+    if n == 0:
+        return
+
+    bits = max(1, (avg_size - min_size).bit_length() - 1)
+    shift = 64 - bits
+    drop = pow(ROLLING_BASE, window, 1 << 64)
+    values = [_unit_value(u) for u in units]
+
+    start = 0
+    h = 0
+    for i in range(n):
+        h = (h * ROLLING_BASE + values[i]) & MASK64
+        if i - window >= start:
+            h = (h - values[i - window] * drop) & MASK64
+
+        size = i + 1 - start
+        if size < min_size:
+            continue
+        if size >= max_size or (h >> shift) == 0:
+            yield start, i + 1
+            start = i + 1
+            h = 0
+
+    if start < n:
+        yield start, n
+
+
+# ============================================================
+# 🧩 Chunkers
+# ============================================================
+def chunk_words_cdc(text: str, min_words: int = WORD_MIN, avg_words: int = WORD_AVG,
+                    max_words: int = WORD_MAX):
+    """Split text into whitespace-normalized word chunks with content-defined boundaries."""
+    words = text.split()
+    for start, end in content_defined_spans(words, min_words, avg_words, max_words):
+        yield " ".join(words[start:end])
+
+
+def chunk_tokens_cdc(text: str, enc, min_tokens: int = TOKEN_MIN, avg_tokens: int = TOKEN_AVG,
+                     max_tokens: int = TOKEN_MAX):
+    """Split text into tiktoken chunks with content-defined boundaries."""
+    tokens = enc.encode(text)
+    for start, end in content_defined_spans(tokens, min_tokens, avg_tokens, max_tokens):
+        yield enc.decode(tokens[start:end])
+
+
+# ============================================================
+# 🔑 Chunk identity
+# ============================================================
+def normalize_chunk(chunk: str) -> str:
+    """Collapse whitespace and case so cosmetic differences hash the same."""
+    return _WS_RE.sub(" ", chunk).strip().lower()
+
+
+def chunk_hash(chunk: str) -> str:
+    """Stable content hash of a chunk (hex SHA-1 of the normalized text)."""
+    return hashlib.sha1(normalize_chunk(chunk).encode("utf-8")).hexdigest()
+
+
+def chunk_vector_id(source: str, chunk: str) -> str:
+    """ASCII-safe vector id derived from the source name and chunk content."""
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", source).strip("_")[:120] or "chunk"
+    return f"{safe}-{chunk_hash(chunk)[:16]}"
+
+
+# ============================================================
+# 🌊 Streaming chunker (constant memory for huge master files)
+# ============================================================
+STREAM_BLOCK_BYTES = 1 << 20
+_WS_BYTES = (b" ", b"\n", b"\t", b"\r")
+
+
+def iter_byte_blocks(path: str, block_bytes: int = STREAM_BLOCK_BYTES):
+    """Yield ~block_bytes pieces of a file, each ending right after ASCII whitespace."""
+    from transcript_store import open_transcript
+
+    carry = b""
+    with open_transcript(path, "rb") as f:
+        while True:
+            data = f.read(block_bytes)
+            if not data:
+                break
+            data = carry + data
+            cut = max(data.rfind(ws) for ws in _WS_BYTES) + 1
+            if cut <= 0:
+                cut = len(data)  # no whitespace at all — emit as is
+            carry = data[cut:]
+            yield data[:cut]
+    if carry:
+        yield carry
+
+
+def stream_token_chunks(path: str, enc, min_tokens: int = TOKEN_MIN, avg_tokens: int = TOKEN_AVG,
+                        max_tokens: int = TOKEN_MAX, block_bytes: int = STREAM_BLOCK_BYTES):
+    """
+    Yield (chunk, byte_start, byte_end) for a file without loading it whole.
+
+    The file is tokenized one whitespace-aligned block at a time; complete
+    content-defined chunks are emitted and only the trailing partial chunk is
+    carried into the next block, so peak memory is ~block_bytes + max_tokens
+    regardless of file size. Chunks match chunk_tokens_cdc() on the whole
+    text except, rarely, at a block seam. Offsets are exact for valid UTF-8.
+    """
+    tokens = []
+    offset = 0
+
+    def emit(spans):
+        nonlocal offset
+        for start, end in spans:
+            raw = enc.decode_bytes(tokens[start:end])
+            yield raw.decode("utf-8", errors="replace"), offset, offset + len(raw)
+            offset += len(raw)
+
+    for block in iter_byte_blocks(path, block_bytes):
+        tokens.extend(enc.encode(block.decode("utf-8", errors="replace"), disallowed_special=()))
+        if len(tokens) < 2 * max_tokens:
+            continue
+        spans = list(content_defined_spans(tokens, min_tokens, avg_tokens, max_tokens))
+        yield from emit(spans[:-1])
+        tokens = tokens[spans[-1][0]:]
+
+    yield from emit(list(content_defined_spans(tokens, min_tokens, avg_tokens, max_tokens)))
+
+
+# ============================================================
+# 🗣️ Sentence-aware chunker (single-line Whisper transcripts)
+# ============================================================
+SENTENCE_MAX_TOKENS = 800
+SENTENCE_OVERLAP_TOKENS = 120
+
+# One sentence = shortest run of text ending in . ! ? … (plus closing quotes /
+# brackets) followed by whitespace, or the end of the text. Decimals ("2.5")
+# and common abbreviations don't end a sentence because the terminator must be
+# followed by whitespace and the abbreviation guard rejects "Dr." / "vs.".
+_SENTENCE_RE = re.compile(
+    r"\S.*?"
+    r"(?:(?<!\bDr)(?<!\bMr)(?<!\bMs)(?<!\bSt)(?<!\bvs)(?<!\bMrs)(?<!\betc)(?<!\be\.g)(?<!\bi\.e)"
+    r"[.!?…]+[\"'”’)\]]*(?=\s)|$)",
+    re.S,
+)
+
+
+def split_sentences(text: str):
+    """Split text into sentences in one regex pass (no paragraph breaks needed)."""
+    return [m.group().strip() for m in _SENTENCE_RE.finditer(text) if m.group().strip()]
+
+
+def chunk_sentences(text: str, enc, max_tokens: int = SENTENCE_MAX_TOKENS,
+                    overlap_tokens: int = SENTENCE_OVERLAP_TOKENS):
+    """
+    Pack whole sentences into chunks of at most max_tokens tokens.
+
+    Consecutive chunks share trailing sentences worth up to overlap_tokens, so a
+    passage cut at a boundary is still retrievable in one piece. A single
+    sentence longer than max_tokens is split on token boundaries.
+    """
+    if overlap_tokens >= max_tokens:
+        raise ValueError("overlap_tokens must be smaller than max_tokens")
+
+    window = []          # [(sentence, n_tokens)]
+    window_tokens = 0
+
+    def flush():
+        return " ".join(s for s, _ in window)
+
+    for sentence in split_sentences(text):
+        tokens = enc.encode(sentence, disallowed_special=())
+        if len(tokens) > max_tokens:
+            if window:
+                yield flush()
+                window, window_tokens = [], 0
+            for i in range(0, len(tokens), max_tokens):
+                yield enc.decode(tokens[i:i + max_tokens])
+            continue
+
+        if window_tokens + len(tokens) > max_tokens:
+            yield flush()
+            # keep the tail of the previous chunk as overlap
+            kept, kept_tokens = [], 0
+            for s, n in reversed(window):
+                if kept_tokens + n > overlap_tokens or kept_tokens + n + len(tokens) > max_tokens:
+                    break
+                kept.insert(0, (s, n))
+                kept_tokens += n
+            window, window_tokens = kept, kept_tokens
+
+        window.append((sentence, len(tokens)))
+        window_tokens += len(tokens)
+
+    if window:
+        yield flush()
+
+
+def content_vector_id(chunk: str) -> str:
+    """Source-independent vector id: identical chunks in any file share one vector."""
+    return f"chunk-{chunk_hash(chunk)[:32]}"
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+corpus_stats.py — Forged by Freedom Corpus Statistics Engine
+────────────────────────────────────────────────────────────────────────────
+One pass over the transcript corpus for every stats file the site and the
+workflows read, with a persistent per-file cache so only changed files are
+ever re-read.
+
+✨ Features:
+- Cache keyed by (path, size, mtime_ns, inode): an unchanged file costs one
+  stat; a changed, replaced or new file is read once (word count + md5,
+  over an mmap through wordcount.py)
+- Packed folders (transcript_store.py) are counted through the same
+  interface, keyed by the pack file's stat
+- Per-channel and global aggregates from one scan, written as:
+    • <out-dir>/stats.json                {total_channels, total_episodes, total_words, last_updated}
+    • <out-dir>/transcripts_summary.json  {channel: {episodes, words}}
+    • <out-dir>/file_index.json           [{path, channel, size, modified, words, md5}]
+    • --site: ./stats.json + ./transcripts_summary.json in the dashboard
+      {"summary": …, "channels": […]} format (--pinecone adds vector counts)
+- Episodes are transcript .txt files; master_transcript*.txt is derived
+  output and never counted
+
+Replaces the per-script rescans in analyze_transcripts.py,
+scripts/analyze_full_stats.py, generate_site_stats.py, rebuild_stats.py,
+build_file_index.py, build_channels_index.py and the stats tail of
+smart_pinecone_sync.py (those entry points now call run()).
+
+Usage:
+    python scripts/corpus_stats.py                       # transcripts/ → transcripts/*.json
+    python scripts/corpus_stats.py --site --pinecone --print
+    python scripts/corpus_stats.py transcripts split_transcripts --out-dir /tmp/stats
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import time
+from datetime import datetime
+
+from transcript_store import INDEX_NAME, PACK_NAME, PackReader
+from wordcount import count_words
+
+TRANSCRIPTS_DIR = "transcripts"
+CACHE_PATH = os.getenv("CORPUS_STATS_CACHE", ".corpus_stats_cache.json")
+CACHE_VERSION = 1
+SKIP_PREFIX = "master_transcript"
+
+
+# ============================================================
+# 🗃️ Per-file cache
+# ============================================================
+class StatsCache:
+    """{path: {"key": [size, mtime_ns, inode], "words": n, "md5": hex}} persisted as JSON."""
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self.files = {}
+        self.hits = self.misses = 0
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.files = data["files"]
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable stats cache {path}: {e}")
+
+    def get(self, path: str, key, compute):
+        """Cached (words, md5) for path if its key still matches, else compute() and remember it."""
+        entry = self.files.get(path)
+        if entry and entry["key"] == list(key):
+            self.hits += 1
+            return entry["words"], entry["md5"]
+        self.misses += 1
+        words, md5 = compute()
+        self.files[path] = {"key": list(key), "words": words, "md5": md5}
+        self._dirty = True
+        return words, md5
+
+    def prune(self, seen):
+        """Forget files that no longer exist under the scanned roots."""
+        for path in set(self.files) - set(seen):
+            del self.files[path]
+            self._dirty = True
+
+    def save(self):
+        if not (self.path and self._dirty):
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "files": self.files}, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+# ============================================================
+# 🔍 Scan
+# ============================================================
+def measure(data) -> tuple:
+    """(words, md5) of one transcript's bytes — words as len(text.split()), without decoding."""
+    return count_words(data), hashlib.md5(data).hexdigest()
+
+
+def measure_file(path: str) -> tuple:
+    """measure() over a read-only mmap of the file, so it is never copied into memory."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return measure(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return measure(mm)
+
+
+def scan(roots, cache: StatsCache):
+    """
+    One record per transcript under `roots`:
+    {"path", "channel", "size", "mtime_ns", "words", "md5"}, sorted by path.
+    """
+    records = []
+
+    def visit(directory: str):
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError as e:
+            print(f"⚠️ Could not scan {directory}: {e}")
+            return
+        channel = os.path.basename(os.path.abspath(directory))
+        names = {e.name for e in entries}
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith(".") and entry.name != "node_modules":
+                    visit(entry.path)
+            elif entry.name.endswith(".txt") and not entry.name.startswith(SKIP_PREFIX):
+                st = entry.stat()
+                words, md5 = cache.get(entry.path, (st.st_size, st.st_mtime_ns, st.st_ino),
+                                       lambda p=entry.path: measure_file(p))
+                records.append({"path": entry.path, "channel": channel, "size": st.st_size,
+                                "mtime_ns": st.st_mtime_ns, "words": words, "md5": md5})
+        if INDEX_NAME in names and PACK_NAME in names:
+            _visit_pack(directory, channel, names, cache, records)
+
+    for root in [roots] if isinstance(roots, str) else roots:
+        if os.path.isdir(root):
+            visit(root)
+    records.sort(key=lambda r: r["path"])
+    return records
+
+
+def _visit_pack(directory: str, channel: str, plain_names, cache: StatsCache, records):
+    """Packed episodes (that have no plain copy beside them), keyed by the pack's stat."""
+    st = os.stat(os.path.join(directory, PACK_NAME))
+    with open(os.path.join(directory, INDEX_NAME), "r", encoding="utf-8") as f:
+        episodes = sorted(json.load(f)["episodes"], key=lambda e: e["name"])
+    reader = None
+    try:
+        for ep in episodes:
+            if ep["name"] in plain_names or ep["name"].startswith(SKIP_PREFIX):
+                continue
+
+            def compute(name=ep["name"]):
+                nonlocal reader
+                reader = reader or PackReader(directory)
+                return measure(reader.read_bytes(name))
+
+            path = os.path.join(directory, ep["name"])
+            words, md5 = cache.get(path, (st.st_size, st.st_mtime_ns, st.st_ino), compute)
+            records.append({"path": path, "channel": channel, "size": ep["size"],
+                            "mtime_ns": ep["mtime_ns"], "words": words, "md5": md5})
+    finally:
+        if reader:
+            reader.close()
+
+
+# ============================================================
+# 📊 Aggregate + write
+# ============================================================
+def channel_summary(records) -> dict:
+    """{channel: {"episodes", "words"}}, channels sorted."""
+    summary = {}
+    for r in records:
+        s = summary.setdefault(r["channel"], {"episodes": 0, "words": 0})
+        s["episodes"] += 1
+        s["words"] += r["words"]
+    return dict(sorted(summary.items()))
+
+
+def totals(summary: dict) -> dict:
+    return {
+        "total_channels": len(summary),
+        "total_episodes": sum(s["episodes"] for s in summary.values()),
+        "total_words": sum(s["words"] for s in summary.values()),
+        "last_updated": datetime.now().isoformat(),
+    }
+
+
+def write_json(path: str, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def pinecone_stats() -> dict:
+    """Vector count + estimated storage of the live index (zeros without a key or client)."""
+    api_key = os.getenv("PINECONE_API_KEY")
+    try:
+        from pinecone import Pinecone
+    except ImportError:
+        Pinecone = None
+    if not (api_key and Pinecone):
+        print("ℹ️ Pinecone stats skipped (no key or client).")
+        return {"pinecone_vectors": 0, "pinecone_storage_gb": 0}
+    try:
+        from index_generations import resolve_alias
+
+        index = Pinecone(api_key=api_key).Index(resolve_alias(os.getenv("PINECONE_INDEX", "forgedbyfreedom")))
+        stats = index.describe_index_stats()
+        vectors = stats.get("total_vector_count", 0)
+        return {"pinecone_vectors": vectors,
+                "pinecone_storage_gb": round(vectors * stats.get("dimension", 1536) * 4 / 1e9, 2)}
+    except Exception as e:
+        print(f"⚠️ Pinecone connection failed: {e}")
+        return {"pinecone_vectors": 0, "pinecone_storage_gb": 0}
+
+
+def run(roots=(TRANSCRIPTS_DIR,), out_dir: str = TRANSCRIPTS_DIR, site: bool = False, pinecone: bool = False,
+        cache_path: str = CACHE_PATH) -> dict:
+    """Scan once (through the cache), write every output, return {"summary", "totals", "records"}."""
+    start = time.time()
+    cache = StatsCache(cache_path)
+    records = scan(roots, cache)
+    cache.prune(r["path"] for r in records)
+    cache.save()
+
+    summary = channel_summary(records)
+    stats = totals(summary)
+
+    if out_dir:
+        write_json(os.path.join(out_dir, "stats.json"), stats)
+        write_json(os.path.join(out_dir, "transcripts_summary.json"), summary)
+        write_json(os.path.join(out_dir, "file_index.json"), [
+            {
+                "path": os.path.relpath(r["path"], out_dir),
+                "channel": r["channel"],
+                "size": r["size"],
+                "modified": datetime.fromtimestamp(r["mtime_ns"] / 1e9).isoformat(),
+                "words": r["words"],
+                "md5": r["md5"],
+            }
+            for r in records
+        ])
+
+    if site:
+        overview = {"channels": stats["total_channels"], "episodes": stats["total_episodes"],
+                    "total_words": stats["total_words"]}
+        dashboard = dict(overview, **(pinecone_stats() if pinecone else {}),
+                         updated=datetime.utcnow().isoformat() + "Z")
+        write_json("stats.json", {
+            "summary": dashboard,
+            "channels": [{"name": ch, "episodes": s["episodes"], "words": s["words"]} for ch, s in summary.items()],
+        })
+        write_json("transcripts_summary.json", {
+            "summary": overview,
+            "channels": [{"channel": ch, "episodes": s["episodes"], "words": s["words"]} for ch, s in summary.items()],
+        })
+
+    print(f"📊 {stats['total_channels']} channels, {stats['total_episodes']:,} episodes, "
+          f"{stats['total_words']:,} words — {cache.misses} files read, {cache.hits} cached "
+          f"({time.time() - start:.2f}s)")
+    return {"summary": summary, "totals": stats, "records": records}
+
+
+def print_breakdown(summary: dict):
+    print("=== Breakdown by Channel ===")
+    for ch, s in sorted(summary.items(), key=lambda x: x[1]["words"], reverse=True):
+        print(f"{ch:<30} | {s['episodes']} files | {s['words']:,} words")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Corpus stats with a per-file cache.")
+    parser.add_argument("roots", nargs="*", default=[TRANSCRIPTS_DIR])
+    parser.add_argument("--out-dir", default=TRANSCRIPTS_DIR,
+                        help="where stats.json, transcripts_summary.json and file_index.json go ('' = none)")
+    parser.add_argument("--site", action="store_true", help="also write the dashboard ./stats.json + ./transcripts_summary.json")
+    parser.add_argument("--pinecone", action="store_true", help="include Pinecone vector counts in ./stats.json")
+    parser.add_argument("--print", action="store_true", dest="print_", help="print the per-channel breakdown")
+    parser.add_argument("--cache", default=CACHE_PATH, help="cache file ('' = no cache)")
+    args = parser.parse_args(argv)
+
+    result = run(args.roots, args.out_dir, args.site, args.pinecone, args.cache)
+    if args.print_:
+        print_breakdown(result["summary"])
+    return result
+
+
+if __name__ == "__main__":
+    main()
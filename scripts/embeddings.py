@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+embeddings.py — Forged by Freedom Embedding Backends
+────────────────────────────────────────────────────────────────────────────
+One interface for every script that turns text into vectors.
+
+✨ Backends:
+- openai      OpenAI embeddings API (text-embedding-3-small / -large)
+- openrouter  Same API shape through OpenRouter (what app.py uses)
+- local       Offline CPU embedder: hashing vectorizer (1–2 grams) → TF-IDF
+              → truncated SVD, fitted on our own transcripts. No network,
+              no cost — for bulk experiments, offline tests and as a
+              fallback when the API is down.
+
+Pick a backend with get_backend(); EMBED_BACKEND / EMBED_MODEL in the
+environment override the script's defaults. Every backend reports
+metadata() so vectors record which backend + dimension produced them.
+Scripts pass the Pinecone index they read or write (get_backend(...,
+index=index) or check_dimension()), so an override meant for one index
+fails fast on another instead of embedding at the wrong dimension.
+
+Fit the local model (writes models/local_embedder.joblib):
+    python scripts/embeddings.py fit --dim 256
+"""
+
+import argparse
+import os
+
+HASH_FEATURES = 2 ** 16   # SVD components are dim × HASH_FEATURES floats (~64 MB at 256 dims)
+
+LOCAL_MODEL_PATH = os.getenv(
+    "LOCAL_EMBED_MODEL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "models", "local_embedder.joblib"),
+)
+
+
+class EmbeddingBackend:
+    """Base class: embed(texts) -> list of float vectors, all of length `dimension`."""
+
+    name = "base"
+    model = ""
+    dimension = 0
+
+    def embed(self, texts):
+        raise NotImplementedError
+
+    def embed_one(self, text: str):
+        return self.embed([text])[0]
+
+    def metadata(self) -> dict:
+        return {"embed_backend": self.name, "embed_model": self.model, "embed_dim": self.dimension}
+
+    def __repr__(self):
+        return f"<{self.name}:{self.model} dim={self.dimension}>"
+
+
+# ============================================================
+# ☁️ API backends
+# ============================================================
+class OpenAIBackend(EmbeddingBackend):
+    name = "openai"
+    DIMENSIONS = {
+        "text-embedding-3-small": 1536,
+        "text-embedding-3-large": 3072,
+        "text-embedding-ada-002": 1536,
+    }
+
+    def __init__(self, model: str = "text-embedding-3-large", api_key: str = None,
+                 base_url: str = None, batch_size: int = 64):
+        from openai import OpenAI
+
+        self.model = model
+        self.dimension = self.DIMENSIONS.get(model.split("/")[-1], 0)
+        self.batch_size = batch_size
+        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"), base_url=base_url)
+
+    def embed(self, texts):
+        vectors = []
+        for i in range(0, len(texts), self.batch_size):
+            resp = self.client.embeddings.create(model=self.model, input=texts[i:i + self.batch_size])
+            vectors.extend(d.embedding for d in sorted(resp.data, key=lambda d: d.index))
+        if vectors and not self.dimension:
+            self.dimension = len(vectors[0])
+        return vectors
+
+
+class OpenRouterBackend(OpenAIBackend):
+    name = "openrouter"
+
+    def __init__(self, model: str = "text-embedding-3-small", api_key: str = None,
+                 base_url: str = None, batch_size: int = 64):
+        super().__init__(
+            model,
+            api_key=api_key or os.getenv("OPENROUTER_API_KEY"),
+            base_url=base_url or os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
+            batch_size=batch_size,
+        )
+
+
+# ============================================================
+# 💻 Local backend
+# ============================================================
+class LocalBackend(EmbeddingBackend):
+    """Hashing-vectorizer + TF-IDF + truncated-SVD embedder (scikit-learn)."""
+
+    name = "local"
+
+    def __init__(self, model_path: str = LOCAL_MODEL_PATH):
+        import joblib
+
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"Local embedding model not found at {model_path} — "
+                "run `python scripts/embeddings.py fit` first."
+            )
+        self.pipeline = joblib.load(model_path)
+        self.dimension = self.pipeline[-1].n_components
+        self.model = f"hash-tfidf-svd-{self.dimension}"
+
+    def embed(self, texts):
+        import numpy as np
+
+        vectors = self.pipeline.transform(list(texts))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype("float32").tolist()
+
+    @staticmethod
+    def fit(texts, dimension: int = 256, model_path: str = LOCAL_MODEL_PATH):
+        """Fit the local model on an iterable of texts and save it."""
+        import joblib
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+        from sklearn.pipeline import make_pipeline
+
+        pipeline = make_pipeline(
+            HashingVectorizer(n_features=HASH_FEATURES, ngram_range=(1, 2), stop_words="english",
+                              alternate_sign=False, norm=None),
+            TfidfTransformer(sublinear_tf=True),
+            TruncatedSVD(n_components=dimension, random_state=0),
+        )
+        pipeline.fit(list(texts))
+        svd = pipeline[-1]
+        svd.components_ = svd.components_.astype("float32")  # halves the model file
+        os.makedirs(os.path.dirname(os.path.abspath(model_path)), exist_ok=True)
+        joblib.dump(pipeline, model_path, compress=3)
+        return pipeline
+
+
+# ============================================================
+# 🔌 Factory
+# ============================================================
+BACKENDS = {
+    "openai": OpenAIBackend,
+    "openrouter": OpenRouterBackend,
+    "local": LocalBackend,
+}
+
+
+def check_dimension(backend: EmbeddingBackend, index) -> EmbeddingBackend:
+    """Raise ValueError if `backend` embeds at a different dimension than `index` stores."""
+    try:
+        expected = index.describe_index_stats().get("dimension")
+    except Exception as e:
+        print(f"⚠️ Could not read the index dimension ({e}); not checked.")
+        return backend
+    if expected and backend.dimension and backend.dimension != expected:
+        raise ValueError(
+            f"{backend} embeds at {backend.dimension} dims but the index stores {expected} — "
+            "check EMBED_BACKEND / EMBED_MODEL (they apply to every script that runs with them)."
+        )
+    return backend
+
+
+def get_backend(backend: str = "openai", model: str = None, index=None, env: bool = True) -> EmbeddingBackend:
+    """
+    Build the embedding backend for a script.
+
+    `backend` / `model` are the script's defaults; EMBED_BACKEND and
+    EMBED_MODEL in the environment take precedence unless env=False (for
+    callers whose choice is already explicit, e.g. a migration target).
+    With `index`, the backend's dimension is checked against it.
+    """
+    name = (os.getenv("EMBED_BACKEND", backend) if env else backend).lower()
+    model = os.getenv("EMBED_MODEL", model) if env else model
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown embedding backend {name!r} (choose from {', '.join(BACKENDS)})")
+    if name == "local":
+        instance = LocalBackend()
+    else:
+        instance = BACKENDS[name](model) if model else BACKENDS[name]()
+    return check_dimension(instance, index) if index is not None else instance
+
+
+# ============================================================
+# 🚀 CLI: fit the local model
+# ============================================================
+def main():
+    from chunking import chunk_words_cdc
+    from transcript_store import read_transcript, walk_transcripts
+
+    parser = argparse.ArgumentParser(description="Fit the offline local embedding model.")
+    parser.add_argument("command", choices=["fit"])
+    parser.add_argument("roots", nargs="*", default=["transcripts"])
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--output", default=LOCAL_MODEL_PATH)
+    args = parser.parse_args()
+
+    def corpus():
+        for path in walk_transcripts(args.roots):
+            yield from chunk_words_cdc(read_transcript(path))
+
+    print(f"🧠 Fitting local embedder ({args.dim} dims) on {', '.join(args.roots)}...")
+    LocalBackend.fit(corpus(), dimension=args.dim, model_path=args.output)
+    print(f"✅ Saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+fake_ytdlp.py — local stand-in for yt-dlp
+────────────────────────────────────────────────────────────────────────────
+Serves fake media from a folder so the fetch stage can be run and timed
+without touching YouTube. Understands the yt-dlp options youtube_fetch.py
+passes: -o, --download-archive, --break-on-existing, --limit-rate.
+
+Layout of FAKE_YTDLP_MEDIA (default ./fake_media):
+    <channel>/<title> [<11-char id>].mp3     newest upload = last in sort order
+
+    FAKE_YTDLP_MEDIA=/tmp/media python scripts/youtube_fetch.py @A \\
+        --ytdlp "python scripts/fake_ytdlp.py"
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+
+from youtube_fetch import ID_RE
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("url")
+    parser.add_argument("-o", dest="template", default="%(title)s [%(id)s].%(ext)s")
+    parser.add_argument("--download-archive")
+    parser.add_argument("--break-on-existing", action="store_true")
+    parser.add_argument("--limit-rate", type=int, default=0)
+    parser.add_argument("--extract-audio", action="store_true")
+    parser.add_argument("--audio-format")
+    parser.add_argument("--audio-quality")
+    args, _ = parser.parse_known_args()
+
+    media = os.path.join(os.getenv("FAKE_YTDLP_MEDIA", "fake_media"), args.url.rstrip("/").rsplit("/", 1)[-1])
+    archived = set()
+    if args.download_archive and os.path.exists(args.download_archive):
+        with open(args.download_archive, "r", encoding="utf-8") as f:
+            archived = {line.split()[1] for line in f if len(line.split()) == 2}
+
+    for name in sorted(os.listdir(media) if os.path.isdir(media) else [], reverse=True):
+        m = ID_RE.search(name)
+        if not m:
+            continue
+        vid, (title, ext) = m.group(1), os.path.splitext(name)
+        if vid in archived:
+            print(f"[download] {vid} has already been recorded in the archive")
+            if args.break_on_existing:
+                print("Encountered a video that is already in the archive, stopping due to --break-on-existing")
+                break
+            continue
+        src = os.path.join(media, name)
+        dest = args.template % {"title": title[:m.start()].rstrip(), "id": vid, "ext": ext.lstrip(".")}
+        os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+        shutil.copyfile(src, dest)
+        if args.limit_rate:
+            time.sleep(os.path.getsize(src) / args.limit_rate)
+        if args.download_archive:
+            with open(args.download_archive, "a", encoding="utf-8") as f:
+                f.write(f"youtube {vid}\n")
+        print(f"[download] Destination: {dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
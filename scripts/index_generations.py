@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+index_generations.py — Forged by Freedom Blue-Green Index Generations
+────────────────────────────────────────────────────────────────────────────
+Full rebuilds write into a fresh, versioned Pinecone index ("generation")
+while search keeps reading the live one; an alias record is flipped
+atomically once the build is complete.
+
+✨ Files (indexes/):
+- alias.json        {alias: {"index": <live generation>, "previous": ..., "flipped": ts}}
+- generations.json  manifest of every generation: index name, status
+                    (building / live / retired / deleted), backend, model,
+                    dimension, created / promoted / retired times, stats
+
+Search (app.py) and incremental ingests resolve the alias on every use, so a
+flip takes effect without restarting anything. Retired generations are kept
+for --grace-hours (instant rollback) and then deleted by `gc`, which
+Pinecone.index.upload.py runs at the end of every run; run it by hand
+(below) where that script is not scheduled.
+
+Usage:
+    python scripts/Pinecone.index.upload.py --new-generation   # build + promote
+    python scripts/index_generations.py list
+    python scripts/index_generations.py promote forged-freedom-ai-g20261019T1530
+    python scripts/index_generations.py rollback
+    python scripts/index_generations.py gc --grace-hours 48
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+INDEXES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "indexes")
+ALIAS_PATH = os.getenv("INDEX_ALIAS_FILE", os.path.join(INDEXES_DIR, "alias.json"))
+MANIFEST_PATH = os.path.join(INDEXES_DIR, "generations.json")
+GRACE_HOURS = 48
+
+
+# ============================================================
+# 📄 JSON helpers
+# ============================================================
+def _read(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_atomic(path: str, data: dict):
+    """Write tmp file + fsync + rename, so readers see the old or the new record, never half."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# ============================================================
+# 🔗 Alias resolution
+# ============================================================
+_cache = {"mtime": None, "aliases": {}}
+
+
+def resolve_alias(name: str, path: str = ALIAS_PATH) -> str:
+    """
+    Index name an alias currently points to (the name itself if it is not an alias).
+
+    Cheap enough to call per request: the alias file is only re-read when its
+    mtime changes.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return name
+    if mtime != _cache["mtime"]:
+        _cache["aliases"], _cache["mtime"] = _read(path), mtime
+    return _cache["aliases"].get(name, {}).get("index", name)
+
+
+def generation_name(alias: str) -> str:
+    """Versioned index name, e.g. forged-freedom-ai-g20261019t153000 (Pinecone: lowercase, ≤45 chars)."""
+    stamp = datetime.now().strftime("%Y%m%dt%H%M%S")
+    return f"{alias[:45 - len(stamp) - 2]}-g{stamp}"
+
+
+# ============================================================
+# 🟦🟩 Generations
+# ============================================================
+class Generations:
+    """Manifest of index generations for one alias."""
+
+    def __init__(self, alias: str, manifest_path: str = MANIFEST_PATH, alias_path: str = ALIAS_PATH):
+        self.alias = alias
+        self.manifest_path = manifest_path
+        self.alias_path = alias_path
+        self.manifest = _read(manifest_path)
+        self.entries = self.manifest.setdefault(alias, {})
+
+    def save(self):
+        _write_atomic(self.manifest_path, self.manifest)
+
+    def live(self) -> str:
+        return resolve_alias(self.alias, self.alias_path)
+
+    def create(self, pc, embedder, spec=None) -> str:
+        """Create a new empty generation index and record it as building."""
+        name = generation_name(self.alias)
+        if spec is None:
+            from pinecone import ServerlessSpec
+
+            spec = ServerlessSpec(cloud="aws", region="us-east-1")
+        print(f"🪶 Creating generation {name} ({embedder.dimension} dims)")
+        pc.create_index(name=name, dimension=embedder.dimension, metric="cosine", spec=spec)
+        self.entries[name] = {
+            "status": "building",
+            "created": datetime.now().isoformat(),
+            **embedder.metadata(),
+        }
+        self.save()
+        return name
+
+    def promote(self, name: str, stats: dict = None):
+        """Flip the alias to `name`; the previous live generation is retired (kept for rollback)."""
+        if name not in self.entries:
+            raise KeyError(f"Unknown generation {name!r} for alias {self.alias!r}")
+        previous = self.live()
+        now = time.time()
+
+        aliases = _read(self.alias_path)
+        aliases[self.alias] = {"index": name, "previous": previous, "flipped": datetime.now().isoformat()}
+        _write_atomic(self.alias_path, aliases)
+
+        entry = self.entries[name]
+        entry.update(status="live", promoted=datetime.now().isoformat())
+        entry.pop("retired_at", None)
+        if stats:
+            entry["stats"] = stats
+        if previous != name and previous in self.entries:
+            self.entries[previous].update(status="retired", retired_at=now)
+        self.save()
+        print(f"🔀 {self.alias} → {name} (was {previous})")
+
+    def rollback(self):
+        """Point the alias back at the most recently retired generation."""
+        retired = [(e.get("retired_at", 0), n) for n, e in self.entries.items() if e["status"] == "retired"]
+        if not retired:
+            raise SystemExit("❌ No retired generation to roll back to.")
+        self.promote(max(retired)[1])
+
+    def gc(self, pc, grace_hours: float = GRACE_HOURS, dry_run: bool = False):
+        """Delete retired generations whose grace period has passed; returns their names."""
+        cutoff = time.time() - grace_hours * 3600
+        live = self.live()
+        doomed = [
+            n for n, e in self.entries.items()
+            if n != live and (
+                (e["status"] == "retired" and e.get("retired_at", 0) < cutoff)
+                # abandoned builds: never promoted, older than the grace period
+                or (e["status"] == "building" and datetime.fromisoformat(e["created"]).timestamp() < cutoff)
+            )
+        ]
+        existing = set(pc.list_indexes().names())
+        for name in doomed:
+            print(f"🗑️ {'Would delete' if dry_run else 'Deleting'} generation {name}")
+            if dry_run:
+                continue
+            if name in existing:
+                pc.delete_index(name)
+            self.entries[name].update(status="deleted", deleted=datetime.now().isoformat())
+        if doomed and not dry_run:
+            self.save()
+        return doomed
+
+
+# ============================================================
+# 🚀 CLI
+# ============================================================
+def main():
+    parser = argparse.ArgumentParser(description="Manage blue-green Pinecone index generations.")
+    parser.add_argument("--alias", default=os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai"))
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list")
+    promote = sub.add_parser("promote")
+    promote.add_argument("generation")
+    sub.add_parser("rollback")
+    gc = sub.add_parser("gc")
+    gc.add_argument("--grace-hours", type=float, default=GRACE_HOURS)
+    gc.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    gens = Generations(args.alias)
+    if args.command == "list":
+        live = gens.live()
+        print(f"🔗 {args.alias} → {live}")
+        for name, e in sorted(gens.entries.items(), key=lambda kv: kv[1]["created"]):
+            marker = "★" if name == live else " "
+            print(f" {marker} {name:45} {e['status']:9} {e.get('embed_model', '')} {e.get('stats', '')}")
+    elif args.command == "promote":
+        gens.promote(args.generation)
+    elif args.command == "rollback":
+        gens.rollback()
+    elif args.command == "gc":
+        from pinecone import Pinecone
+
+        pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+        removed = gens.gc(pc, args.grace_hours, args.dry_run)
+        print(f"✅ {len(removed)} generation(s) collected.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+index_migration.py — Forged by Freedom Zero-Downtime Embedding Migration
+────────────────────────────────────────────────────────────────────────────
+Moves the search corpus to a new embedding model / index without a
+blocking rebuild and without pointing search at a half-filled index.
+
+✨ Flow:
+1. start     create the target index (dimension from the target backend)
+             and write indexes/migration.json (status "backfilling")
+2. dual-write
+             while a migration is active, the ingestion scripts embed every
+             new chunk with BOTH backends and upsert into both indexes
+3. backfill  re-chunks the local transcripts (cached text — nothing is read
+             back from Pinecone), embeds chunks the target is missing at a
+             throttled rate (--rate chunks/s) and reports progress; safe to
+             stop and restart at any time
+4. switch    coverage is measured over the content ids the corpus chunks
+             into (every one must be in the target — legacy ids left in the
+             source by older writers are duplicates of the same text and
+             are not required); only at 100% does the state flip to
+             "complete";
+             search (app.py) reads the state and only then queries the
+             target index with the target backend
+
+Usage:
+    python scripts/index_migration.py start --target-index forged-transcripts \\
+        --target-backend openai --target-model text-embedding-3-large
+    python scripts/index_migration.py backfill --rate 20
+    python scripts/index_migration.py status
+    python scripts/index_migration.py abort
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+from embeddings import get_backend
+from ingest_journal import IngestJournal
+from transcript_store import walk_transcripts
+
+INDEXES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "indexes")
+STATE_PATH = os.getenv("INDEX_MIGRATION_STATE", os.path.join(INDEXES_DIR, "migration.json"))
+JOURNAL_PATH = os.path.join(INDEXES_DIR, "migration_journal.jsonl")
+
+
+# ============================================================
+# 📄 State
+# ============================================================
+def load_state(path: str = STATE_PATH):
+    """Return the migration state dict, or None when no migration exists."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state: dict, path: str = STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    state["updated"] = datetime.now().isoformat()
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+
+
+def search_target(default_index: str, default_backend: str, default_model: str, path: str = STATE_PATH):
+    """
+    (index, backend, model) that search should use right now.
+
+    The source side until the migration is complete, then the target side.
+    """
+    state = load_state(path)
+    if state and state.get("status") == "complete":
+        t = state["target"]
+        return t["index"], t["backend"], t["model"]
+    if state and state.get("status") == "backfilling":
+        s = state["source"]
+        return s["index"], s["backend"], s["model"]
+    return default_index, default_backend, default_model
+
+
+# ============================================================
+# ✍️ Dual-write
+# ============================================================
+class Migration:
+    """Active migration: embeds with the target backend and writes the target index."""
+
+    def __init__(self, state: dict, pc, journal_path: str = JOURNAL_PATH):
+        from pinecone_writer import UpsertWriter
+
+        self.state = state
+        t = state["target"]
+        self.backend = _explicit_backend(t["backend"], t["model"], pc.Index(t["index"]))
+        self.writer = UpsertWriter(pc.Index(t["index"]))
+        self.journal = IngestJournal(journal_path, resume=True)
+
+    @classmethod
+    def active(cls, pc, path: str = STATE_PATH):
+        """Return a Migration if one is backfilling, else None."""
+        state = load_state(path)
+        if state and state.get("status") == "backfilling":
+            return cls(state, pc)
+        return None
+
+    def done_ids(self) -> set:
+        done = set()
+        for ids in self.journal.chunks.values():
+            done |= ids
+        return done
+
+    def write(self, items, key: str):
+        """Embed + upsert [(vector_id, text, metadata)] into the target; returns failures."""
+        items = list(items)
+        if not items:
+            return 0
+        embeddings = self.backend.embed([text for _, text, _ in items])
+        vectors = [
+            {"id": vid, "values": emb, "metadata": {**meta, **self.backend.metadata()}}
+            for (vid, _, meta), emb in zip(items, embeddings)
+        ]
+        report = self.writer.write(vectors, verbose=False)
+        bad = {vid for vid, _ in report.failed}
+        self.journal.record_chunks(key, (v["id"] for v in vectors if v["id"] not in bad))
+        return len(bad)
+
+    def coverage(self, ids, batch: int = 100):
+        """
+        (coverage, missing): the share of `ids` — the content ids the corpus
+        chunks into — that the target holds, checked by fetching them.
+        """
+        ids = sorted(ids)
+        missing = 0
+        for i in range(0, len(ids), batch):
+            part = ids[i:i + batch]
+            missing += len(part) - len(self.writer.index.fetch(ids=part).vectors)
+        return (1 - missing / len(ids) if ids else 1.0), missing
+
+    def close(self):
+        self.journal.close()
+
+
+def _explicit_backend(name, model, index=None):
+    """get_backend() without the EMBED_* environment overrides (they describe the source side)."""
+    return get_backend(name, model, index=index, env=False)
+
+
+# ============================================================
+# 🚀 Commands
+# ============================================================
+def cmd_start(args, pc):
+    state = load_state()
+    if state and state.get("status") == "backfilling":
+        raise SystemExit("❌ A migration is already in progress (see `status`).")
+    backend = _explicit_backend(args.target_backend, args.target_model)
+    if not backend.dimension:
+        raise SystemExit(f"❌ Unknown dimension for {backend}; cannot create the target index.")
+
+    if args.target_index not in pc.list_indexes().names():
+        from pinecone import ServerlessSpec
+
+        print(f"🪶 Creating target index {args.target_index} ({backend.dimension} dims)")
+        pc.create_index(name=args.target_index, dimension=backend.dimension, metric="cosine",
+                        spec=ServerlessSpec(cloud="aws", region="us-east-1"))
+
+    if os.path.exists(JOURNAL_PATH):
+        os.remove(JOURNAL_PATH)
+    save_state({
+        "status": "backfilling",
+        "started": datetime.now().isoformat(),
+        "source": {"index": args.source_index, "backend": args.source_backend, "model": args.source_model},
+        "target": {"index": args.target_index, "backend": args.target_backend,
+                   "model": backend.model, "dim": backend.dimension},
+        "coverage": 0.0,
+    })
+    print(f"✅ Migration started: {args.source_index} → {args.target_index}. New ingests now dual-write.")
+
+
+def cmd_backfill(args, pc):
+    import tiktoken
+
+    from chunking import content_vector_id, stream_token_chunks
+
+    migration = Migration.active(pc)
+    if not migration:
+        raise SystemExit("❌ No migration in progress.")
+    enc = tiktoken.get_encoding("cl100k_base")
+    done = migration.done_ids()
+
+    files = list(walk_transcripts(args.root, skip_masters=False))
+
+    expected = set()   # every content id of the corpus: what "complete" means
+    embedded = failed = 0
+    min_interval = args.batch / args.rate if args.rate else 0.0
+    start = last_report = time.time()
+
+    for n, path in enumerate(files, 1):
+        rel_path = os.path.relpath(path, args.root)
+        pending = []
+        for i, (chunk, b0, b1) in enumerate(stream_token_chunks(path, enc)):
+            if not chunk.strip():
+                continue
+            vid = content_vector_id(chunk)
+            expected.add(vid)
+            if vid in done:
+                continue
+            done.add(vid)
+            pending.append((vid, chunk, {
+                "source": os.path.basename(path),
+                "channel": os.path.basename(os.path.dirname(path)),
+                "chunk_index": i, "byte_start": b0, "byte_end": b1,
+                "text": chunk[:1500],
+            }))
+            if len(pending) >= args.batch:
+                tick = time.time()
+                failed += migration.write(pending, rel_path)
+                embedded += len(pending)
+                pending = []
+                time.sleep(max(0.0, min_interval - (time.time() - tick)))   # throttle
+        if pending:
+            failed += migration.write(pending, rel_path)
+            embedded += len(pending)
+
+        if time.time() - last_report > 30 or n == len(files):
+            last_report = time.time()
+            rate = embedded / max(time.time() - start, 1e-9)
+            print(f"🔁 {n}/{len(files)} files, {embedded:,} chunks backfilled ({rate:.1f}/s), {failed} failed")
+
+    migration.close()
+    state = migration.state
+    coverage, missing = migration.coverage(expected)
+    state["coverage"] = round(coverage, 4)
+    state["missing"] = missing
+    if failed == 0 and missing == 0:
+        state["status"] = "complete"
+        state["completed"] = datetime.now().isoformat()
+    save_state(state)
+    if state["status"] == "complete":
+        print(f"✅ Coverage 100% of {len(expected):,} corpus chunks — search now uses {state['target']['index']}.")
+    else:
+        print(f"⚠️ Coverage {coverage:.2%} of {len(expected):,} corpus chunks ({missing:,} missing in "
+              f"{state['target']['index']}, {failed} failed this run); re-run backfill.")
+
+
+def cmd_status(args, pc):
+    state = load_state()
+    if not state:
+        print("ℹ️ No migration.")
+        return
+    print(json.dumps(state, indent=2))
+
+
+def cmd_abort(args, pc):
+    state = load_state()
+    if not state:
+        print("ℹ️ No migration.")
+        return
+    state["status"] = "aborted"
+    save_state(state)
+    print("🛑 Migration aborted; search stays on the source index, dual-write stopped.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zero-downtime embedding-model migration.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    start = sub.add_parser("start")
+    start.add_argument("--source-index", default=os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai"))
+    start.add_argument("--source-backend", default="openrouter")
+    start.add_argument("--source-model", default="text-embedding-3-small")
+    start.add_argument("--target-index", required=True)
+    start.add_argument("--target-backend", default="openai")
+    start.add_argument("--target-model", default="text-embedding-3-large")
+
+    backfill = sub.add_parser("backfill")
+    backfill.add_argument("--root", default="transcripts")
+    backfill.add_argument("--rate", type=float, default=10.0, help="max chunks per second (0 = unthrottled)")
+    backfill.add_argument("--batch", type=int, default=32)
+
+    sub.add_parser("status")
+    sub.add_parser("abort")
+    args = parser.parse_args()
+
+    from pinecone import Pinecone
+
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+    {"start": cmd_start, "backfill": cmd_backfill, "status": cmd_status, "abort": cmd_abort}[args.command](args, pc)
+
+
+if __name__ == "__main__":
+    main()
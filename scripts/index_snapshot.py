@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+index_snapshot.py — Forged by Freedom Vector Index Snapshots
+────────────────────────────────────────────────────────────────────────────
+Exports every vector + metadata of a Pinecone index to local compressed
+shards and loads them back, so restoring or cloning an index runs at disk
+speed instead of re-embedding the whole corpus.
+
+✨ Snapshot layout (snapshots/<name>/):
+- manifest.json        source index, dimension, vector count, embedding
+                       backend/model, and per shard: file, count, SHA-256
+- shard-00000.npz      compressed NumPy arrays: ids, vectors (float32),
+                       metadata (JSON strings), namespace       [default]
+- shard-00000.parquet  same columns as Parquet/zstd       [--format parquet,
+                       needs pyarrow]
+
+Export lists ids page by page and fetches them in batches, so only one
+shard is held in memory. Import verifies every checksum first, then
+decompresses the next shard while the current one is being upserted
+through the parallel UpsertWriter.
+
+Usage:
+    python scripts/index_snapshot.py export --index forged-freedom-ai
+    python scripts/index_snapshot.py verify snapshots/forged-freedom-ai-20261019t0300
+    python scripts/index_snapshot.py import snapshots/forged-freedom-ai-20261019t0300 --index forged-clone
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from pinecone_writer import UpsertWriter
+
+SNAPSHOT_DIR = "snapshots"
+SHARD_VECTORS = 5000        # ~60 MB of float32 at 3072 dims before compression
+FETCH_BATCH = 100
+
+
+# ============================================================
+# 📦 Shard I/O
+# ============================================================
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def write_shard(directory: str, number: int, rows, fmt: str = "npz") -> dict:
+    """Write [(namespace, id, values, metadata)] as one shard; returns its manifest entry."""
+    namespaces = [r[0] for r in rows]
+    ids = [r[1] for r in rows]
+    vectors = np.asarray([r[2] for r in rows], dtype=np.float32)
+    metadata = [json.dumps(r[3] or {}, ensure_ascii=False) for r in rows]
+
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        name = f"shard-{number:05d}.parquet"
+        table = pa.table({
+            "namespace": namespaces,
+            "id": ids,
+            "values": pa.FixedSizeListArray.from_arrays(pa.array(vectors.ravel()), vectors.shape[1]),
+            "metadata": metadata,
+        })
+        pq.write_table(table, os.path.join(directory, name), compression="zstd")
+    else:
+        name = f"shard-{number:05d}.npz"
+        np.savez_compressed(
+            os.path.join(directory, name),
+            namespaces=np.asarray(namespaces, dtype=str),
+            ids=np.asarray(ids, dtype=str),
+            vectors=vectors,
+            metadata=np.asarray(metadata, dtype=str),
+        )
+    path = os.path.join(directory, name)
+    return {"file": name, "count": len(rows), "bytes": os.path.getsize(path), "sha256": _sha256(path)}
+
+
+def read_shard(path: str):
+    """Return (namespaces, ids, vectors, metadata dicts) for one shard."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        vectors = np.asarray(table.column("values").combine_chunks().flatten(), dtype=np.float32)
+        vectors = vectors.reshape(table.num_rows, -1)
+        return (table.column("namespace").to_pylist(), table.column("id").to_pylist(), vectors,
+                [json.loads(m) for m in table.column("metadata").to_pylist()])
+    with np.load(path) as data:
+        return (data["namespaces"].tolist(), data["ids"].tolist(), data["vectors"],
+                [json.loads(m) for m in data["metadata"]])
+
+
+# ============================================================
+# 📤 Export
+# ============================================================
+def iter_index_vectors(index, namespaces):
+    """Yield (namespace, id, values, metadata) for every vector in the index."""
+    for ns in namespaces:
+        for page in index.list(namespace=ns):
+            ids = list(page)
+            for i in range(0, len(ids), FETCH_BATCH):
+                fetched = index.fetch(ids=ids[i:i + FETCH_BATCH], namespace=ns).vectors
+                for vid in ids[i:i + FETCH_BATCH]:
+                    v = fetched.get(vid)
+                    if v is not None:
+                        yield ns, vid, v.values, dict(v.metadata or {})
+
+
+def export_snapshot(index, index_name: str, output: str, shard_vectors: int = SHARD_VECTORS,
+                    fmt: str = "npz") -> dict:
+    """Stream the whole index into shards under `output`; returns the manifest."""
+    stats = index.describe_index_stats()
+    namespaces = list(stats.namespaces or {}) or [""]
+    os.makedirs(output, exist_ok=True)
+
+    manifest = {
+        "index": index_name,
+        "created": datetime.now().isoformat(),
+        "dimension": stats.dimension,
+        "format": fmt,
+        "namespaces": namespaces,
+        "count": 0,
+        "shards": [],
+    }
+    start = time.time()
+    rows = []
+
+    def flush():
+        manifest["shards"].append(write_shard(output, len(manifest["shards"]), rows, fmt))
+        manifest["count"] += len(rows)
+        rows.clear()
+        rate = manifest["count"] / max(time.time() - start, 1e-9)
+        print(f"📦 {manifest['count']:,} vectors in {len(manifest['shards'])} shards ({rate:,.0f}/s)")
+
+    for row in iter_index_vectors(index, namespaces):
+        if "embed_model" not in manifest:
+            meta = row[3]
+            manifest.update({k: meta[k] for k in ("embed_backend", "embed_model", "embed_dim") if k in meta})
+        rows.append(row)
+        if len(rows) >= shard_vectors:
+            flush()
+    if rows:
+        flush()
+
+    with open(os.path.join(output, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+# ============================================================
+# 📥 Import
+# ============================================================
+def load_manifest(snapshot: str) -> dict:
+    with open(os.path.join(snapshot, "manifest.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def verify_snapshot(snapshot: str) -> list:
+    """Return the shard files whose checksum does not match the manifest."""
+    bad = []
+    for shard in load_manifest(snapshot)["shards"]:
+        path = os.path.join(snapshot, shard["file"])
+        if not os.path.exists(path) or _sha256(path) != shard["sha256"]:
+            bad.append(shard["file"])
+    return bad
+
+
+def import_snapshot(index, snapshot: str, workers: int = 8):
+    """Upsert every shard into `index`; returns (upserted, failed ids)."""
+    manifest = load_manifest(snapshot)
+    bad = verify_snapshot(snapshot)
+    if bad:
+        raise ValueError(f"Checksum mismatch in {len(bad)} shard(s): {', '.join(bad[:5])}")
+
+    writers = {}
+    upserted, failed = 0, []
+    start = time.time()
+    paths = [os.path.join(snapshot, s["file"]) for s in manifest["shards"]]
+
+    # One thread decompresses the next shard while this one is upserted
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        for namespaces, ids, vectors, metadata in loader.map(read_shard, paths):
+            by_ns = {}
+            for ns, vid, values, meta in zip(namespaces, ids, vectors, metadata):
+                by_ns.setdefault(ns, []).append({"id": vid, "values": values.tolist(), "metadata": meta})
+            for ns, batch in by_ns.items():
+                if ns not in writers:
+                    writers[ns] = UpsertWriter(index, namespace=ns or None, workers=workers)
+                report = writers[ns].write(batch, verbose=False)
+                upserted += report.upserted
+                failed.extend(report.failed)
+            rate = upserted / max(time.time() - start, 1e-9)
+            print(f"📥 {upserted:,}/{manifest['count']:,} vectors ({rate:,.0f}/s), {len(failed)} failed")
+    return upserted, failed
+
+
+# ============================================================
+# 🚀 CLI
+# ============================================================
+def main():
+    parser = argparse.ArgumentParser(description="Export / import Pinecone index snapshots.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export")
+    exp.add_argument("--index", default=os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai"))
+    exp.add_argument("--output", help="snapshot folder (default: snapshots/<index>-<timestamp>)")
+    exp.add_argument("--shard-vectors", type=int, default=SHARD_VECTORS)
+    exp.add_argument("--format", choices=["npz", "parquet"], default="npz")
+
+    ver = sub.add_parser("verify")
+    ver.add_argument("snapshot")
+
+    imp = sub.add_parser("import")
+    imp.add_argument("snapshot")
+    imp.add_argument("--index", required=True, help="target index (created if missing)")
+    imp.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.command == "verify":
+        bad = verify_snapshot(args.snapshot)
+        print("✅ All shard checksums match." if not bad else f"❌ Bad shards: {', '.join(bad)}")
+        raise SystemExit(1 if bad else 0)
+
+    from pinecone import Pinecone, ServerlessSpec
+
+    from index_generations import resolve_alias
+
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+
+    if args.command == "export":
+        name = resolve_alias(args.index)
+        output = args.output or os.path.join(
+            SNAPSHOT_DIR, f"{name}-{datetime.now().strftime('%Y%m%dt%H%M')}")
+        manifest = export_snapshot(pc.Index(name), name, output, args.shard_vectors, args.format)
+        print(f"✅ Exported {manifest['count']:,} vectors from {name} → {output}")
+    else:
+        manifest = load_manifest(args.snapshot)
+        if args.index not in pc.list_indexes().names():
+            print(f"🪶 Creating Pinecone index: {args.index} ({manifest['dimension']} dims)")
+            pc.create_index(name=args.index, dimension=manifest["dimension"], metric="cosine",
+                            spec=ServerlessSpec(cloud="aws", region="us-east-1"))
+        upserted, failed = import_snapshot(pc.Index(args.index), args.snapshot, args.workers)
+        print(f"✅ Imported {upserted:,} vectors into {args.index}" + (f", {len(failed)} failed" if failed else ""))
+
+
+if __name__ == "__main__":
+    main()
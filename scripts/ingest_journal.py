@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+ingest_journal.py — Forged by Freedom Ingestion Checkpoints
+────────────────────────────────────────────────────────────────────────────
+Durable per-file / per-chunk state journal for resumable ingestion runs.
+
+✨ How it works:
+- Append-only JSON-lines file, flushed + fsync'd after every record
+- A "chunks" record is written after each committed upsert batch
+- A "file" record (with a content signature) is written once a file is done
+- With resume=True, completed files whose signature still matches are
+  skipped and already-committed chunk ids are not embedded again
+- Vector ids are content hashes, so replaying a half-written batch is safe
+- A torn last line (crash mid-write) is ignored on load
+- compact() rewrites the journal as one record per finished file (plus
+  the chunk ids of unfinished ones) — call it after a successful full run
+  so a journal carried between CI runs stays the size of the corpus
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from transcript_store import open_transcript
+
+JOURNAL_PATH = os.getenv("INGEST_JOURNAL", ".ingest_journal.jsonl")
+
+
+def file_signature(path: str) -> str:
+    """Content signature of a file (size + BLAKE2 hash; mtime is useless on fresh CI checkouts)."""
+    h = hashlib.blake2b(digest_size=16)
+    size = 0
+    with open_transcript(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+            size += len(block)
+    return f"{size}:{h.hexdigest()}"
+
+
+class IngestJournal:
+    """Checkpoint journal; use one instance per ingestion run."""
+
+    def __init__(self, path: str = JOURNAL_PATH, resume: bool = False):
+        self.path = path
+        self.done_files = {}      # key -> signature
+        self.chunks = {}          # key -> set(vector ids)
+
+        if resume and os.path.exists(path):
+            self._load()
+        elif os.path.exists(path):
+            os.replace(path, path + ".prev")
+
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._fh = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()   # pipeline stages checkpoint from several threads
+
+    def _load(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn write from a crash
+                key = rec.get("key")
+                if rec.get("type") == "chunks":
+                    self.chunks.setdefault(key, set()).update(rec["ids"])
+                elif rec.get("type") == "file":
+                    self.done_files[key] = rec["sig"]
+
+    def _append(self, rec: dict):
+        rec["ts"] = round(time.time(), 3)
+        line = json.dumps(rec, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._fh.write(line)
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+
+    # -- queries ---------------------------------------------------------
+    def is_file_done(self, key: str, sig: str) -> bool:
+        return self.done_files.get(key) == sig
+
+    def committed_chunks(self, key: str) -> set:
+        return set(self.chunks.get(key, ()))
+
+    # -- checkpoints -----------------------------------------------------
+    def record_chunks(self, key: str, ids):
+        """Checkpoint a batch of vector ids that were successfully upserted."""
+        ids = list(ids)
+        if ids:
+            self.chunks.setdefault(key, set()).update(ids)
+            self._append({"type": "chunks", "key": key, "ids": ids})
+
+    def record_file(self, key: str, sig: str):
+        """Mark a file as fully ingested."""
+        self.done_files[key] = sig
+        self._append({"type": "file", "key": key, "sig": sig})
+
+    def compact(self):
+        """Atomically rewrite the journal with only the state a resume needs."""
+        with self._lock:
+            self._fh.close()
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                ts = round(time.time(), 3)
+                for key, sig in self.done_files.items():
+                    f.write(json.dumps({"type": "file", "key": key, "sig": sig, "ts": ts}, ensure_ascii=False) + "\n")
+                for key, ids in self.chunks.items():
+                    if key not in self.done_files and ids:
+                        f.write(json.dumps({"type": "chunks", "key": key, "ids": sorted(ids), "ts": ts},
+                                           ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            self._fh = open(self.path, "a", encoding="utf-8")
+
+    def close(self):
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
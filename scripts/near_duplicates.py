@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+near_duplicates.py — Forged by Freedom Near-Duplicate Finder
+────────────────────────────────────────────────────────────────────────────
+Finds transcripts (or chunks) that are the same content stored more than
+once — e.g. @<channel>/, transcripts/@<channel>/ and split_transcripts/ copies
+that differ only in headers — using MinHash signatures + LSH banding.
+
+✨ How it works:
+- Text → lowercase word 5-gram shingles, hashed with NumPy
+- 128-permutation MinHash signature per document
+- LSH: 16 bands × 8 rows; documents sharing any band become candidates
+- Candidates are confirmed by estimated Jaccard ≥ --threshold
+- Union-find groups confirmed pairs into clusters with one canonical member
+  (longest text, then @<channel>/ > transcripts/ > split_transcripts/)
+
+Usage:
+    python scripts/near_duplicates.py                       # whole repo
+    python scripts/near_duplicates.py transcripts --chunks  # chunk level
+Writes near_duplicates.json.
+"""
+
+import argparse
+import json
+import os
+import re
+import zlib
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+
+from chunking import chunk_words_cdc
+from transcript_store import read_transcript, walk_transcripts
+
+# ============================================================
+# ⚙️ Defaults
+# ============================================================
+NUM_PERM = 128
+BANDS, ROWS = 16, 8          # BANDS * ROWS == NUM_PERM; LSH threshold ≈ 0.7
+SHINGLE = 5
+THRESHOLD = 0.8
+OUTPUT_PATH = "near_duplicates.json"
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_rng = np.random.RandomState(0x5EED)
+_PERM_A = (_rng.randint(1, 2**62, NUM_PERM, dtype=np.int64).astype(np.uint64) << np.uint64(1)) | np.uint64(1)
+_PERM_B = _rng.randint(0, 2**62, NUM_PERM, dtype=np.int64).astype(np.uint64)
+_SHINGLE_MULT = np.uint64(0x100000001B3)
+_EMPTY = np.full(NUM_PERM, np.iinfo(np.uint64).max, dtype=np.uint64)
+
+
+# ============================================================
+# ✍️ MinHash
+# ============================================================
+def shingle_hashes(text: str, k: int = SHINGLE) -> np.ndarray:
+    """Unique 64-bit hashes of the word k-grams of text."""
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    w = np.fromiter((zlib.crc32(x.encode()) for x in words), dtype=np.uint64, count=len(words))
+    if len(w) < k:
+        k = len(w)
+    n = len(w) - k + 1
+    h = np.zeros(n, dtype=np.uint64)
+    for j in range(k):                      # polynomial combine, wraps mod 2**64
+        h = h * _SHINGLE_MULT + w[j:j + n]
+    return np.unique(h)
+
+
+def minhash(hashes: np.ndarray, block: int = 4096) -> np.ndarray:
+    """NUM_PERM-long MinHash signature of a set of shingle hashes."""
+    sig = _EMPTY.copy()
+    for i in range(0, len(hashes), block):
+        x = hashes[i:i + block]
+        permuted = (_PERM_A[:, None] * x[None, :] + _PERM_B[:, None]) >> np.uint64(32)
+        np.minimum(sig, permuted.min(axis=1), out=sig)
+    return sig
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(a == b))
+
+
+# ============================================================
+# 🪣 LSH + clustering
+# ============================================================
+def lsh_candidates(signatures: dict, bands: int = BANDS, rows: int = ROWS):
+    """
+    Yield candidate (key_a, key_b) pairs that collide in at least one band.
+
+    Each bucket is linked as a star around its first member rather than as all
+    pairs, so a sponsor read repeated 5,000 times costs 5,000 pairs, not 12.5M;
+    union-find makes the clusters transitive anyway.
+    """
+    seen = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        lo, hi = band * rows, (band + 1) * rows
+        for key, sig in signatures.items():
+            if sig[0] != _EMPTY[0]:
+                buckets[sig[lo:hi].tobytes()].append(key)
+        for members in buckets.values():
+            for other in members[1:]:
+                pair = (members[0], other)
+                if pair not in seen:
+                    seen.add(pair)
+                    yield pair
+
+
+def _location_rank(path: str) -> int:
+    parts = path.replace("\\", "/").split("/")
+    if parts[0].startswith("@"):
+        return 0
+    if parts[0] == "transcripts":
+        return 1
+    if parts[0] == "split_transcripts":
+        return 2
+    return 3
+
+
+def canonical(members, sizes: dict) -> str:
+    """Pick the copy to keep: most text, then preferred folder, then shortest path."""
+    return min(members, key=lambda m: (-sizes[m], _location_rank(m), len(m), m))
+
+
+def find_clusters(signatures: dict, sizes: dict, threshold: float = THRESHOLD):
+    """Group near-duplicate keys; returns clusters sorted by canonical key."""
+    parent = {}
+
+    def root(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    confirmed = []
+    for a, b in lsh_candidates(signatures):
+        sim = similarity(signatures[a], signatures[b])
+        if sim >= threshold:
+            ra, rb = root(a), root(b)
+            if ra != rb:
+                parent[ra] = rb
+            confirmed.append((a, sim))
+
+    groups = defaultdict(list)
+    for key in parent:
+        groups[root(key)].append(key)
+    lowest = {}
+    for a, sim in confirmed:
+        r = root(a)
+        lowest[r] = min(lowest.get(r, 1.0), sim)
+
+    clusters = []
+    for r, members in groups.items():
+        if len(members) < 2:
+            continue
+        keep = canonical(members, sizes)
+        clusters.append({
+            "canonical": keep,
+            "duplicates": sorted(m for m in members if m != keep),
+            "min_similarity": round(lowest[r], 3),
+        })
+    return sorted(clusters, key=lambda c: c["canonical"])
+
+
+# ============================================================
+# 🚀 CLI
+# ============================================================
+def collect_files(roots):
+    """Plain and packed transcripts alike (see transcript_store.py)."""
+    for path in walk_transcripts(roots):
+        yield os.path.relpath(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate transcripts with MinHash/LSH.")
+    parser.add_argument("roots", nargs="*", help="folders to scan (default: @*/, transcripts/, split_transcripts/)")
+    parser.add_argument("--chunks", action="store_true", help="compare ~400-word chunks instead of whole files")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("-o", "--output", default=OUTPUT_PATH)
+    args = parser.parse_args()
+
+    roots = args.roots or sorted(
+        d for d in os.listdir(".") if d.startswith("@") and os.path.isdir(d)
+    ) + ["transcripts", "split_transcripts"]
+
+    signatures, sizes = {}, {}
+    for path in collect_files(roots):
+        try:
+            text = read_transcript(path)
+        except Exception as e:
+            print(f"⚠️ Could not read {path}: {e}")
+            continue
+        pieces = enumerate(chunk_words_cdc(text)) if args.chunks else [(None, text)]
+        for i, piece in pieces:
+            key = path if i is None else f"{path}#{i}"
+            signatures[key] = minhash(shingle_hashes(piece))
+            sizes[key] = len(piece)
+
+    print(f"🔍 {len(signatures):,} {'chunks' if args.chunks else 'files'} signed, finding clusters...")
+    clusters = find_clusters(signatures, sizes, args.threshold)
+    redundant = sum(len(c["duplicates"]) for c in clusters)
+    redundant_chars = sum(sizes[d] for c in clusters for d in c["duplicates"])
+
+    report = {
+        "generated": datetime.now().isoformat(),
+        "unit": "chunk" if args.chunks else "file",
+        "threshold": args.threshold,
+        "items": len(signatures),
+        "clusters": len(clusters),
+        "redundant_items": redundant,
+        "redundant_chars": redundant_chars,
+        "duplicate_clusters": clusters,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"✅ {len(clusters):,} duplicate clusters, {redundant:,} redundant copies "
+          f"({redundant_chars / 1e6:.1f} MB of text) → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+parallel_chunking.py — Forged by Freedom Multi-Process Chunking Stage
+────────────────────────────────────────────────────────────────────────────
+Tokenizes + chunks transcript files on every CPU core.
+
+✨ Features:
+- Files are distributed across a process pool
+- Each worker loads the tiktoken encoder once (pool initializer)
+- Results come back in the same order as the input file list
+- At most `max_pending` files are in flight, so memory stays bounded
+- Files above SPLIT_THRESHOLD (the ~100 MB master transcripts, most of the
+  corpus bytes) are cut into ranges of whole streaming blocks, one per
+  worker; each range is chunked as if a chunk started there, and the parent
+  re-chains the boundaries across every seam until they meet the worker's
+  (a boundary depends only on the chunk start and the last 16 tokens, so
+  both chains agree from then on). The chunks are exactly those of
+  stream_token_chunks() on the whole file.
+
+Benchmark (serial vs parallel over a folder; --sweep times 1, 2, 4, …
+workers up to --workers and checks every run against the serial chunks):
+    python scripts/parallel_chunking.py transcripts --workers 8 --sweep
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import tiktoken
+
+from chunking import (STREAM_BLOCK_BYTES, TOKEN_AVG, TOKEN_MAX, TOKEN_MIN, content_defined_spans,
+                      iter_byte_blocks, stream_token_chunks)
+from transcript_store import open_transcript, transcript_size, walk_transcripts
+
+ENCODING = "cl100k_base"
+SPLIT_THRESHOLD = 8 * 1024 * 1024    # bytes; bigger files are split across workers
+MAX_RANGE_BYTES = 16 * 1024 * 1024   # per-worker range cap (bounds worker memory)
+HEAD_TOKENS = 16 * TOKEN_MAX         # tokens a range returns for re-chaining its seam
+
+_ENC = None
+
+
+# ============================================================
+# 👷 Worker side
+# ============================================================
+def _init_worker(encoding_name: str):
+    global _ENC
+    _ENC = tiktoken.get_encoding(encoding_name)
+
+
+def _chunk_file(path: str):
+    """Chunk one file inside a worker; returns a list of (chunk, byte_start, byte_end)."""
+    return list(stream_token_chunks(path, _ENC))
+
+
+def _tokenize_blocks(path: str, blocks, enc):
+    """Tokens of consecutive (start, end) blocks, each encoded on its own as the streaming chunker does."""
+    tokens = []
+    with open_transcript(path, "rb") as f:
+        f.seek(blocks[0][0])
+        for start, end in blocks:
+            tokens.extend(enc.encode(f.read(end - start).decode("utf-8", errors="replace"),
+                                     disallowed_special=()))
+    return tokens
+
+
+def _chunk_range(path: str, blocks):
+    """
+    Chunk a range of blocks as if a chunk started at its first byte.
+
+    Returns (chunks, head, tail, n): chunks are (text, byte_start, byte_end,
+    token_start); the last one is cut by the range end, not by a boundary.
+    `head` is the first HEAD_TOKENS tokens, `tail` the last chunk's tokens.
+    """
+    tokens = _tokenize_blocks(path, blocks, _ENC)
+    chunks, offset = [], blocks[0][0]
+    for start, end in content_defined_spans(tokens, TOKEN_MIN, TOKEN_AVG, TOKEN_MAX):
+        raw = _ENC.decode_bytes(tokens[start:end])
+        chunks.append((raw.decode("utf-8", errors="replace"), offset, offset + len(raw), start))
+        offset += len(raw)
+    return chunks, tokens[:HEAD_TOKENS], tokens[chunks[-1][3]:] if chunks else [], len(tokens)
+
+
+# ============================================================
+# 🧩 Parent side
+# ============================================================
+def _split_ranges(path: str, parts: int):
+    """Cut a file into ≤ `parts`-ish runs of whole streaming blocks (the serial chunker's blocks)."""
+    size = transcript_size(path)
+    target = max(STREAM_BLOCK_BYTES, min(-(-size // parts), MAX_RANGE_BYTES))
+    ranges, current, offset = [], [], 0
+    for block in iter_byte_blocks(path):
+        current.append((offset, offset + len(block)))
+        offset += len(block)
+        if offset - current[0][0] >= target:
+            ranges.append(current)
+            current = []
+    if current:
+        ranges.append(current)
+    return ranges
+
+
+def _merge_ranges(path: str, ranges, futures, encoding_name: str):
+    """Yield (chunk, byte_start, byte_end) for a split file, identical to stream_token_chunks()."""
+    enc = tiktoken.get_encoding(encoding_name)
+    carry, offset = [], 0     # tokens of the chunk still open before this range, and its byte start
+
+    def emit(units, spans):
+        nonlocal offset
+        for start, end in spans:
+            raw = enc.decode_bytes(units[start:end])
+            yield raw.decode("utf-8", errors="replace"), offset, offset + len(raw)
+            offset += len(raw)
+
+    for k, (blocks, future) in enumerate(zip(ranges, futures)):
+        last = k == len(ranges) - 1
+        chunks, head, tail, n = future.result()
+        if not chunks:
+            continue
+
+        # Continue the serial chain from `carry` into this range until one of
+        # its boundaries is also a boundary of the worker's chain
+        units = carry + head
+        starts = {c[3]: i for i, c in enumerate(chunks)}
+        joined, spans = None, []
+        for start, end in content_defined_spans(units, TOKEN_MIN, TOKEN_AVG, TOKEN_MAX):
+            if start >= len(carry) and start - len(carry) in starts:
+                joined = starts[start - len(carry)]
+                break
+            if end == len(units):
+                break                      # cut by the end of `head`, not a boundary
+            spans.append((start, end))
+
+        if joined is None:
+            # No meeting point inside `head`: chunk the whole range here (rare)
+            units = carry + (head if len(head) == n else _tokenize_blocks(path, blocks, enc))
+            spans = list(content_defined_spans(units, TOKEN_MIN, TOKEN_AVG, TOKEN_MAX))
+            yield from emit(units, spans if last else spans[:-1])
+            carry = units[spans[-1][0]:]
+            continue
+
+        yield from emit(units, spans)
+        for text, start, end, _ in (chunks[joined:] if last else chunks[joined:-1]):
+            yield text, start, end
+        carry, offset = tail, chunks[-1][1]
+
+
+def chunk_files_parallel(paths, workers: int = None, max_pending: int = None,
+                         encoding_name: str = ENCODING):
+    """
+    Yield (path, chunks) for each path, in input order.
+
+    `chunks` is a list of (chunk, byte_start, byte_end) for files chunked in
+    one worker, or an iterator over the same tuples for files over
+    SPLIT_THRESHOLD, whose ranges are chunked by all workers at once.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+
+    # fork where available: the ingestion scripts run top-level code, which a
+    # spawn-started worker would re-execute on import.
+    ctx = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker,
+                             initargs=(encoding_name,)) as pool:
+        inflight = deque()   # (path, future or (ranges, futures)) in submission order
+        it = iter(paths)
+
+        def submit_next():
+            path = next(it, None)
+            if path is None:
+                return False
+            if transcript_size(path) > SPLIT_THRESHOLD:
+                ranges = _split_ranges(path, workers)
+                inflight.append((path, (ranges, [pool.submit(_chunk_range, path, r) for r in ranges])))
+            else:
+                inflight.append((path, pool.submit(_chunk_file, path)))
+            return True
+
+        while len(inflight) < max_pending and submit_next():
+            pass
+
+        while inflight:
+            path, job = inflight.popleft()
+            if isinstance(job, tuple):
+                yield path, _merge_ranges(path, *job, encoding_name)
+            else:
+                yield path, job.result()
+            submit_next()
+
+
+def chunk_files_serial(paths, encoding_name: str = ENCODING):
+    """Single-process baseline: the same chunker, one file after another."""
+    enc = tiktoken.get_encoding(encoding_name)
+    for path in paths:
+        yield path, list(stream_token_chunks(path, enc))
+
+
+# ============================================================
+# ⏱️ Benchmark
+# ============================================================
+def _collect(root: str):
+    return list(walk_transcripts(root, skip_masters=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serial vs parallel chunking.")
+    parser.add_argument("root", nargs="?", default="transcripts")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--sweep", action="store_true", help="also time 1, 2, 4, … workers up to --workers")
+    args = parser.parse_args()
+
+    paths = _collect(args.root)
+    total_mb = sum(transcript_size(p) for p in paths) / 1e6
+    print(f"📚 {len(paths)} files, {total_mb:.1f} MB under {args.root} ({os.cpu_count()} CPUs)")
+    if not paths:
+        return
+
+    start = time.time()
+    expected = [(p, c) for p, c in chunk_files_serial(paths)]
+    serial = time.time() - start
+    print(f"🐢 serial:   {serial:7.2f}s  {total_mb / serial:6.1f} MB/s  "
+          f"{sum(len(c) for _, c in expected):,} chunks")
+
+    counts = [args.workers]
+    if args.sweep:
+        counts = sorted({min(1 << i, args.workers) for i in range(args.workers.bit_length())} | {args.workers})
+    for workers in counts:
+        start = time.time()
+        got = [(p, list(c)) for p, c in chunk_files_parallel(paths, workers)]
+        parallel = time.time() - start
+        same = "identical" if got == expected else "MISMATCH"
+        print(f"🚀 {workers:2d} workers: {parallel:7.2f}s  {total_mb / parallel:6.1f} MB/s  "
+              f"speedup {serial / parallel:.2f}x  ({same})")
+
+
+if __name__ == "__main__":
+    main()
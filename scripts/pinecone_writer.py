@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+pinecone_writer.py — Forged by Freedom Pinecone Upsert Writer
+────────────────────────────────────────────────────────────────────────────
+Batched, parallel upserts for every ingestion script.
+
+✨ Features:
+- Splits vectors into batches by serialized byte size AND vector count
+  (Pinecone rejects requests over ~2 MB or 1000 vectors)
+- Sends batches from a small thread pool
+- Retries each batch with exponential backoff (transient errors only)
+- A batch rejected as invalid (a 4xx other than 401/403/429, or a
+  client-side validation error) is bisected, so one bad vector (e.g. a
+  non-ASCII id) only costs itself instead of the whole batch; outages,
+  auth errors and rate limits fail the batch at once instead of
+  multiplying requests
+- Reports upserted / failed counts and vectors per second
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# ============================================================
+# ⚙️ Defaults
+# ============================================================
+MAX_BATCH_BYTES = 2_000_000 - 100_000   # request limit minus envelope headroom
+MAX_BATCH_VECTORS = 100
+WORKERS = 4
+RETRIES = 3
+BACKOFF_SECONDS = 1.0
+
+
+def vector_size(vector) -> int:
+    """Approximate request bytes of one vector as Pinecone serializes it."""
+    if not isinstance(vector, dict):
+        vid, values, *rest = vector
+        vector = {"id": vid, "values": values, "metadata": rest[0] if rest else {}}
+    return len(json.dumps(vector, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def error_status(error):
+    """HTTP status of a client error (Pinecone, urllib3 or requests style), or None."""
+    for status in (getattr(error, "status", None), getattr(error, "status_code", None),
+                   getattr(getattr(error, "response", None), "status_code", None)):
+        try:
+            return int(status)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def is_payload_error(error) -> bool:
+    """True if the request itself was rejected, so splitting the batch can help."""
+    status = error_status(error)
+    if status is None:
+        return isinstance(error, (ValueError, TypeError))   # rejected before it was sent
+    return 400 <= status < 500 and status not in (401, 403, 429)
+
+
+def vector_id(vector) -> str:
+    return vector["id"] if isinstance(vector, dict) else vector[0]
+
+
+def split_batches(vectors, max_bytes: int = MAX_BATCH_BYTES, max_vectors: int = MAX_BATCH_VECTORS):
+    """Yield lists of vectors that fit under both the byte and count limits."""
+    batch, batch_bytes = [], 0
+    for vector in vectors:
+        size = vector_size(vector)
+        if batch and (batch_bytes + size > max_bytes or len(batch) >= max_vectors):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(vector)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+class UpsertReport:
+    """Totals for one write() call."""
+
+    def __init__(self):
+        self.upserted = 0
+        self.batches = 0
+        self.failed = []      # [(vector_id, error message)]
+        self.elapsed = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.upserted / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.upserted:,} vectors in {self.batches} batches, "
+                f"{len(self.failed)} failed, {self.elapsed:.1f}s ({self.rate:,.0f} vectors/s)")
+
+
+class UpsertWriter:
+    """Size-aware parallel upserts into one Pinecone index (or anything with .upsert)."""
+
+    def __init__(self, index, namespace=None, max_bytes: int = MAX_BATCH_BYTES,
+                 max_vectors: int = MAX_BATCH_VECTORS, workers: int = WORKERS,
+                 retries: int = RETRIES, backoff: float = BACKOFF_SECONDS):
+        self.index = index
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.max_vectors = max_vectors
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+
+    def _send(self, batch):
+        """Upsert one batch with retries; re-raises the last error."""
+        kwargs = {"namespace": self.namespace} if self.namespace else {}
+        for attempt in range(self.retries + 1):
+            try:
+                self.index.upsert(vectors=batch, **kwargs)
+                return len(batch)
+            except Exception as e:
+                if attempt == self.retries or is_payload_error(e):
+                    raise
+                time.sleep(self.backoff * (2 ** attempt))
+
+    def _send_or_bisect(self, batch, report):
+        """Send a batch; if it is rejected as invalid, split it in half to isolate bad vectors."""
+        try:
+            return self._send(batch)
+        except Exception as e:
+            if len(batch) == 1 or not is_payload_error(e):
+                report.failed.extend((vector_id(v), str(e)) for v in batch)
+                return 0
+            mid = len(batch) // 2
+            return self._send_or_bisect(batch[:mid], report) + self._send_or_bisect(batch[mid:], report)
+
+    def write(self, vectors, verbose: bool = True) -> UpsertReport:
+        """Upsert an iterable of vectors and return an UpsertReport."""
+        report = UpsertReport()
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(self._send_or_bisect, batch, report)
+                for batch in split_batches(vectors, self.max_bytes, self.max_vectors)
+            ]
+            report.batches = len(futures)
+            for future in as_completed(futures):
+                report.upserted += future.result()
+        report.elapsed = time.time() - start
+
+        if verbose:
+            print(f"⬆️ Upserted {report.summary()}")
+            for vid, err in report.failed[:10]:
+                print(f"   ❌ {vid}: {err}")
+        return report
@@ -3,6 +3,8 @@
 import os
 import pinecone
 
+from index_generations import resolve_alias
+
 def get_pinecone_index():
     api_key = os.getenv("PINECONE_API_KEY")
     index_name = os.getenv("PINECONE_INDEX_NAME")
@@ -11,4 +13,4 @@ def get_pinecone_index():
         raise RuntimeError("PINECONE_API_KEY or PINECONE_INDEX_NAME not set")
 
     pc = pinecone.Pinecone(api_key=api_key)
-    return pc.Index(index_name)
+    return pc.Index(resolve_alias(index_name))
@@ -4,19 +4,42 @@ smart_pinecone_sync.py
 ──────────────────────────────
 Scans all transcript directories, uploads new or modified files to Pinecone,
 and rebuilds stats + summary JSON files.
+
+Files are streamed through the content-defined token chunker (any size,
+constant memory) into content-hash ids and the same vector metadata as
+Pinecone.index.upload.py, embedded with the configured backend and upserted
+through UpsertWriter; chunks already in the index are not embedded again. Every committed batch
+and finished file is checkpointed in the ingest journal, which is compacted
+after a run with no failures.
+
+Run with --resume to skip files a previous (crashed) run already finished.
 """
 
-import os, json, time
-from datetime import datetime
+import os, argparse
+import tiktoken
 from tqdm import tqdm
 from pinecone import Pinecone
 
+from chunking import content_vector_id, stream_token_chunks
+from corpus_stats import run as corpus_stats
+from embeddings import get_backend
+from ingest_journal import IngestJournal, file_signature
+from index_generations import resolve_alias
+from index_migration import Migration
+from pinecone_writer import UpsertWriter
+from transcript_store import walk_transcripts
+
+parser = argparse.ArgumentParser(description="Sync transcripts to Pinecone.")
+parser.add_argument("--resume", action="store_true",
+                    help="skip files already committed by a previous run")
+args = parser.parse_args()
+
 # ============================================================
 # 🔧 CONFIG
 # ============================================================
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai")
-EMBED_MODEL = os.getenv("OPENROUTER_EMBED_MODEL", "text-embedding-3-small")
+INDEX_NAME = resolve_alias(os.getenv("PINECONE_INDEX_NAME", "forged-freedom-ai"))
+FLUSH_EVERY = 100  # chunks embedded per checkpoint
 
 # Directories to scan
 SOURCE_DIRS = ["transcripts", "thinkbig-transcripts", "archive", "uploads"]
@@ -27,7 +50,16 @@ SOURCE_DIRS = ["transcripts", "thinkbig-transcripts", "archive", "uploads"]
 print("🔌 Connecting to Pinecone...")
 pc = Pinecone(api_key=PINECONE_API_KEY)
 index = pc.Index(INDEX_NAME)
-print(f"✅ Connected to Pinecone index: {INDEX_NAME}")
+embedder = get_backend("openai", "text-embedding-3-large", index=index)
+writer = UpsertWriter(index)
+print(f"✅ Connected to Pinecone index: {INDEX_NAME} ({embedder})")
+
+# Dual-write while an embedding-model migration is backfilling
+migration = Migration.active(pc)
+if migration:
+    print(f"🔀 Migration active: also writing {migration.state['target']['index']} ({migration.backend})")
+
+ENC = tiktoken.get_encoding("cl100k_base")
 
 # ============================================================
 # 🧭 BUILD FILE INDEX
@@ -37,12 +69,9 @@ def collect_transcripts():
     for base in SOURCE_DIRS:
         if not os.path.exists(base):
             continue
-        for root, dirs, files in os.walk(base):
-            for f in files:
-                if f.endswith(".txt"):
-                    path = os.path.join(root, f)
-                    rel_path = os.path.relpath(path)
-                    file_index[rel_path] = os.path.getmtime(path)
+        # plain and packed (transcript_store.py) transcripts alike
+        for path in walk_transcripts(base, skip_masters=False):
+            file_index[os.path.relpath(path)] = path
     return file_index
 
 print("📂 Scanning transcript directories...")
@@ -50,54 +79,105 @@ file_index = collect_transcripts()
 print(f"✅ Found {len(file_index)} transcript files total.")
 
 # ============================================================
-# 🚀 UPLOAD LOOP (SIMULATED HERE)
+# 🚀 UPLOAD LOOP
 # ============================================================
+def stored_ids(ids, batch_size=100):
+    """Return the subset of ids already stored in the index."""
+    found = set()
+    for i in range(0, len(ids), batch_size):
+        found.update(index.fetch(ids=ids[i:i + batch_size]).vectors.keys())
+    return found
+
+def upload_batch(key, batch):
+    """Embed + upsert one batch of (chunk_index, chunk, byte_start, byte_end, id), checkpoint it; returns failures."""
+    embeddings = embedder.embed([chunk for _, chunk, _, _, _ in batch])
+    vectors = [{
+        "id": vid,
+        "values": embedding,
+        "metadata": {
+            "source": os.path.basename(key),
+            "channel": os.path.basename(os.path.dirname(key)),
+            "chunk_index": i,
+            "byte_start": start,
+            "byte_end": end,
+            "text": chunk[:1500],
+            **embedder.metadata(),
+        },
+    } for (i, chunk, start, end, vid), embedding in zip(batch, embeddings)]
+    report = writer.write(vectors, verbose=False)
+    bad = {vid for vid, _ in report.failed}
+    journal.record_chunks(key, (v["id"] for v in vectors if v["id"] not in bad))
+    if migration:
+        # Target-side failures are left for the backfill to pick up
+        migration.write([(v["id"], c[1], v["metadata"]) for v, c in zip(vectors, batch)
+                         if v["id"] not in bad], key)
+    return len(bad)
+
+def upload_file(key, path):
+    """Stream-chunk a file, skip chunks already stored, embed + upsert the rest; returns failures."""
+    committed = journal.committed_chunks(key)
+    pending, seen = [], set()
+    failed = 0
+
+    def flush():
+        nonlocal failed
+        stored = stored_ids([c[4] for c in pending])
+        todo = [c for c in pending if c[4] not in stored]
+        if todo:
+            failed += upload_batch(key, todo)
+        pending.clear()
+
+    # Streamed: only FLUSH_EVERY chunks (plus one tokenizer block) are in memory at once
+    for i, (chunk, start, end) in enumerate(stream_token_chunks(path, ENC)):
+        vid = content_vector_id(chunk)
+        if chunk.strip() and vid not in seen and vid not in committed:
+            seen.add(vid)
+            pending.append((i, chunk, start, end, vid))
+            if len(pending) >= FLUSH_EVERY:
+                flush()
+    if pending:
+        flush()
+    return failed
+
 updated_files = list(file_index.keys())
+journal = IngestJournal(resume=args.resume)
+failed_files = 0
 for path in tqdm(updated_files, desc="Uploading to Pinecone"):
     try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-        if len(text.encode("utf-8")) > 4_000_000:
-            print(f"⚠️ Skipping oversized file: {path}")
+        # Unchanged files cost one read (the signature); only new or edited
+        # files are read again by the chunker
+        sig = file_signature(file_index[path])
+        if journal.is_file_done(path, sig):
+            continue
+        failed = upload_file(path, file_index[path])
+        if failed:
+            print(f"❌ {failed} vectors failed for {path}")
+            failed_files += 1
             continue
-        # Normally you’d generate embedding + upsert here.
-        time.sleep(0.1)
+        journal.record_file(path, sig)
     except Exception as e:
         print(f"❌ Error uploading {path}: {e}")
+        failed_files += 1
 
-# ============================================================
-# 📊 BUILD STATS + SUMMARY
-# ============================================================
-summary = {}
-for path in updated_files:
-    channel = os.path.basename(os.path.dirname(path))
-    summary.setdefault(channel, {"episodes": 0, "words": 0})
-    try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f: 
-            summary[channel]["episodes"] += 1
-            summary[channel]["words"] += len(f.read().split())
-    except Exception:
-        pass
-
-stats = {
-    "total_channels": len(summary),
-    "total_episodes": sum(v["episodes"] for v in summary.values()),
-    "total_words": sum(v["words"] for v in summary.values()),
-    "last_updated": datetime.now().isoformat()
-}
+if not failed_files:
+    journal.compact()
+journal.close()
+if migration:
+    migration.close()
 
 # ============================================================
-# 💾 WRITE FILES
+# 📊 BUILD STATS + SUMMARY (cached: only changed files are re-read)
 # ============================================================
-os.makedirs("transcripts", exist_ok=True)
-with open("transcripts/transcripts_summary.json", "w", encoding="utf-8") as f:
-    json.dump(summary, f, indent=2)
-with open("transcripts/stats.json", "w", encoding="utf-8") as f:
-    json.dump(stats, f, indent=2)
+# transcripts/ only, like every other stats entry point: file_index.json
+# paths stay transcripts-relative and channels from other roots aren't merged
+stats = corpus_stats()["totals"]
 
-print("\n✅ Pinecone index sync completed successfully!")
+if failed_files:
+    print(f"\n⚠️ {failed_files} files failed — re-run with --resume to retry them.")
+else:
+    print("\n✅ Pinecone index sync completed successfully!")
 print(f"📊 Stats Summary:\n"
-      f"   • Channels: {len(summary)}\n"
+      f"   • Channels: {stats['total_channels']}\n"
       f"   • Episodes: {stats['total_episodes']}\n"
       f"   • Words: {stats['total_words']:,}\n"
       f"   • Updated: {stats['last_updated']}")
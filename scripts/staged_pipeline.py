@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+staged_pipeline.py — Forged by Freedom Staged Concurrent Pipeline
+────────────────────────────────────────────────────────────────────────────
+Small thread-based pipeline: stages connected by bounded queues.
+
+✨ Features:
+- Each stage has its own worker count (e.g. 2 downloads, 1 Whisper,
+  4 embedding calls) — network waits, CPU work and disk I/O overlap
+- Queues are bounded: a fast stage blocks on put() when the next stage is
+  behind (backpressure), so memory stays flat
+- A stage function takes one item and returns an iterable of outputs
+  (generator, list, or None) — fan-out like channel → new audio files is
+  natural, and the last stage simply returns nothing
+- A failing item is logged and counted; the pipeline keeps going
+- Per-stage stats: items in / out, errors, busy time, time blocked on the
+  next queue, throughput, and peak queue depth
+
+Example:
+    pipeline = Pipeline([
+        Stage("fetch", download, workers=2),
+        Stage("transcribe", transcribe, workers=1),
+    ], log=print)
+    pipeline.run(channels)
+    pipeline.report()
+"""
+
+import queue
+import reprlib
+import threading
+import time
+
+_DONE = object()
+
+
+class Stage:
+    """One pipeline step: `fn(item)` → iterable of items for the next stage."""
+
+    def __init__(self, name: str, fn, workers: int = 1, queue_size: int = 8):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.inbox = queue.Queue(maxsize=max(1, queue_size))
+
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy = 0.0          # seconds spent in fn, excluding blocked puts
+        self.blocked = 0.0       # seconds waiting for room in the next stage's queue
+        self.peak_depth = 0
+        self.started = None
+        self.finished = None
+        self._lock = threading.Lock()
+        self._alive = 0
+
+    def stats(self) -> dict:
+        elapsed = (self.finished or time.time()) - (self.started or time.time())
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "in": self.items_in,
+            "out": self.items_out,
+            "errors": self.errors,
+            "busy_s": round(self.busy, 2),
+            "blocked_s": round(self.blocked, 2),
+            "utilization": round(self.busy / (elapsed * self.workers), 3) if elapsed > 0 else 0.0,
+            "items_per_s": round(self.items_in / elapsed, 3) if elapsed > 0 else 0.0,
+            "peak_queue": self.peak_depth,
+        }
+
+
+class Pipeline:
+    """Runs a list of Stages concurrently; items flow from the first to the last."""
+
+    def __init__(self, stages, log=print, report_every: float = 60.0):
+        self.stages = list(stages)
+        self.log = log
+        self.report_every = report_every
+
+    # -- workers ---------------------------------------------------------
+    def _put(self, stage: Stage, item):
+        stage.inbox.put(item)   # blocks when full → backpressure
+        stage.peak_depth = max(stage.peak_depth, stage.inbox.qsize())
+
+    def _worker(self, i: int):
+        stage = self.stages[i]
+        nxt = self.stages[i + 1] if i + 1 < len(self.stages) else None
+
+        while True:
+            item = stage.inbox.get()
+            if item is _DONE:
+                break
+            with stage._lock:
+                stage.items_in += 1
+            start = time.time()
+            blocked = 0.0
+            try:
+                for out in stage.fn(item) or ():
+                    with stage._lock:
+                        stage.items_out += 1
+                    if nxt is not None:
+                        t = time.time()
+                        self._put(nxt, out)
+                        blocked += time.time() - t
+            except Exception as e:
+                with stage._lock:
+                    stage.errors += 1
+                self.log(f"❌ [{stage.name}] {reprlib.repr(item)}: {e}")
+            with stage._lock:
+                stage.busy += time.time() - start - blocked
+                stage.blocked += blocked
+
+        # last worker out closes the next stage
+        with stage._lock:
+            stage._alive -= 1
+            last = stage._alive == 0
+        if last:
+            stage.finished = time.time()
+            if nxt is not None:
+                for _ in range(nxt.workers):
+                    nxt.inbox.put(_DONE)
+
+    def _monitor(self, stop: threading.Event):
+        while not stop.wait(self.report_every):
+            self.log("📊 " + " | ".join(
+                f"{s.name}: {s.items_in} done, {s.inbox.qsize()} queued" for s in self.stages))
+
+    # -- driver ----------------------------------------------------------
+    def run(self, items):
+        """Feed `items` into the first stage and block until every stage has drained."""
+        threads = []
+        now = time.time()
+        for i, stage in enumerate(self.stages):
+            stage.started = now
+            stage._alive = stage.workers
+            for w in range(stage.workers):
+                t = threading.Thread(target=self._worker, args=(i,), name=f"{stage.name}-{w}", daemon=True)
+                t.start()
+                threads.append(t)
+
+        stop = threading.Event()
+        monitor = threading.Thread(target=self._monitor, args=(stop,), daemon=True)
+        monitor.start()
+
+        first = self.stages[0]
+        for item in items:
+            self._put(first, item)
+        for _ in range(first.workers):
+            first.inbox.put(_DONE)
+
+        for t in threads:
+            t.join()
+        stop.set()
+        return [s.stats() for s in self.stages]
+
+    def report(self):
+        """Log one line of throughput stats per stage."""
+        for s in (stage.stats() for stage in self.stages):
+            self.log(
+                f"⏱️ {s['stage']:<11} x{s['workers']}: {s['in']} in → {s['out']} out, "
+                f"{s['errors']} errors, {s['items_per_s']:.2f}/s, busy {s['busy_s']}s "
+                f"({s['utilization']:.0%}), blocked {s['blocked_s']}s, peak queue {s['peak_queue']}"
+            )
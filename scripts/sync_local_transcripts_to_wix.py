@@ -18,6 +18,8 @@ import json
 import requests
 from time import sleep
 
+from transcript_store import list_transcripts, read_transcript
+
 # ============================================
 # 🔧 CONFIGURATION
 # ============================================
@@ -100,7 +102,7 @@ def main():
 
     existing_titles = fetch_existing_titles()
 
-    files = [f for f in os.listdir(TRANSCRIPTS_DIR) if f.endswith(".txt")]
+    files = [name for name, _, _ in list_transcripts(TRANSCRIPTS_DIR, skip_masters=False)]
     print(f"🧾 Found {len(files)} local .txt files.\n")
 
     uploaded, skipped = 0, 0
@@ -112,8 +114,7 @@ def main():
             skipped += 1
             continue
 
-        with open(os.path.join(TRANSCRIPTS_DIR, filename), "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_transcript(os.path.join(TRANSCRIPTS_DIR, filename))
 
         upload_transcript(title, content)
         uploaded += 1
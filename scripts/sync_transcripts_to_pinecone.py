@@ -2,9 +2,11 @@ import os
 import time
 import json
 from tqdm import tqdm
-from openai import OpenAI
 from pinecone import Pinecone, ServerlessSpec
 
+from embeddings import check_dimension, get_backend
+from transcript_store import list_transcripts, read_transcript
+
 # ========== CONFIG ==========
 TRANSCRIPTS_DIR = os.path.expanduser("~/forged-by-freedom/transcripts")
 INDEX_NAME = "forged-transcripts"
@@ -14,12 +16,13 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 
 # Check environment
-if not OPENAI_API_KEY or not PINECONE_API_KEY:
+embedder = get_backend("openai", "text-embedding-3-large")
+
+if not PINECONE_API_KEY or (embedder.name == "openai" and not OPENAI_API_KEY):
     raise EnvironmentError("❌ Missing OPENAI_API_KEY or PINECONE_API_KEY in environment variables!")
 
 # Initialize clients
-print("🔗 Connecting to OpenAI + Pinecone...")
-client = OpenAI(api_key=OPENAI_API_KEY)
+print(f"🔗 Connecting to {embedder} + Pinecone...")
 pc = Pinecone(api_key=PINECONE_API_KEY)
 
 # Ensure Pinecone index exists
@@ -27,28 +30,26 @@ if INDEX_NAME not in [idx["name"] for idx in pc.list_indexes()]:
     print(f"🪶 Creating Pinecone index: {INDEX_NAME} ...")
     pc.create_index(
         name=INDEX_NAME,
-        dimension=3072,  # for text-embedding-3-large
+        dimension=embedder.dimension,  # 3072 for text-embedding-3-large
         metric="cosine",
         spec=ServerlessSpec(cloud="aws", region="us-east-1"),
     )
     time.sleep(10)
 
 index = pc.Index(INDEX_NAME)
+check_dimension(embedder, index)
 print(f"✅ Using Pinecone index: {INDEX_NAME}")
 
 # ========== LOAD TRANSCRIPTS ==========
 def read_text_files(folder_path):
     files = []
-    for filename in os.listdir(folder_path):
-        if filename.endswith(".txt"):
-            path = os.path.join(folder_path, filename)
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        files.append({"id": filename, "text": content})
-            except Exception as e:
-                print(f"⚠️ Error reading {filename}: {e}")
+    for filename, _, _ in list_transcripts(folder_path, skip_masters=False):
+        try:
+            content = read_transcript(os.path.join(folder_path, filename)).strip()
+            if content:
+                files.append({"id": filename, "text": content})
+        except Exception as e:
+            print(f"⚠️ Error reading {filename}: {e}")
     return files
 
 print(f"📂 Scanning transcripts folder: {TRANSCRIPTS_DIR}")
@@ -71,18 +72,14 @@ def embed_and_upload(files):
 
         try:
             # Generate embedding
-            embedding_response = client.embeddings.create(
-                model="text-embedding-3-large",
-                input=text[:8000]  # truncate to stay within token limit
-            )
-            vector = embedding_response.data[0].embedding
+            vector = embedder.embed_one(text[:8000])  # truncate to stay within token limit
 
             # Upsert to Pinecone
             index.upsert([
                 {
                     "id": filename,
                     "values": vector,
-                    "metadata": {"filename": filename, "text": text[:500]}  # store preview
+                    "metadata": {"filename": filename, "text": text[:500], **embedder.metadata()}  # store preview
                 }
             ])
 
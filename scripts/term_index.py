@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+term_index.py — Forged by Freedom Term-Frequency & Vocabulary Index
+────────────────────────────────────────────────────────────────────────────
+Precomputed per-episode and per-channel term counts, so the dashboard can
+show top terms and topics per channel ("how often is 'insulin' mentioned")
+without rescanning the corpus.
+
+✨ Features:
+- Terms are lowercase words minus stopwords and spoken filler (counted
+  reps included), plus bigrams of adjacent kept words ("blood sugar",
+  "growth hormone"; repeats like "good good" are not bigrams)
+- One compact file per channel, indexes/terms/<channel>.npz: the channel's
+  vocabulary and a CSR matrix of (term id, count) per episode
+  (episode bigrams seen only once are dropped to keep it small)
+- Incremental: episodes come from corpus_stats.scan() (cached md5s), and
+  only new or changed episodes are tokenized; a channel file is rewritten
+  only when one of its episodes changed or went away
+- Changed episodes are tokenized on a process pool; the parent merges the
+  returned Counters into the channel tables
+- Writes term_stats.json for the dashboard:
+    • summary                 {channels, episodes, tokens, vocabulary, updated}
+    • top_terms / top_bigrams [[term, count, episodes], …] across the corpus
+    • channels                [{name, episodes, tokens, vocabulary,
+                                top_terms, top_bigrams, topics}]
+    • terms                   {term: {count, episodes, channels: {channel: count}}}
+                              for the most frequent terms
+  topics are the channel's most distinctive terms: count × log(channel
+  rate / corpus rate), for terms in ≥ TOPIC_MIN_EPISODES of its episodes
+
+Usage:
+    python scripts/term_index.py                     # update + write term_stats.json
+    python scripts/term_index.py --full --workers 4
+    python scripts/term_index.py --query insulin --query "blood sugar"
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from corpus_stats import CACHE_PATH, TRANSCRIPTS_DIR, StatsCache, scan, write_json
+from transcript_store import read_transcript
+
+INDEX_DIR = os.path.join("indexes", "terms")
+STATS_PATH = "term_stats.json"
+INDEX_VERSION = 1
+BIGRAM_MIN = 2          # per episode: bigrams seen once are noise, not topics
+TOP_N = 25              # top terms / bigrams per channel
+TOPICS_N = 15
+TOPIC_MIN_EPISODES = 3  # a topic has to come up in at least this many of the channel's episodes
+GLOBAL_TOP_N = 100
+TERMS_LIMIT = 2000      # terms with a per-channel breakdown in term_stats.json
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOPWORDS = frozenset("""
+a about above after again against all almost also although always am among an and another any anybody anyone
+anything anyway anywhere are aren't around as at away back be became because become been before being below
+between both but by came can can't cannot could couldn't did didn't do does doesn't doing don't done down during
+each either else enough even ever every everybody everyone everything few for from further get gets getting give
+go goes going gone got gotten had hadn't has hasn't have haven't having he he'd he'll her here hers herself him
+himself his how however i i'd i'll i'm i've if in into is isn't it it'd it'll its itself just keep kind least
+less let let's like made make makes making many may maybe me might mine more most much must my myself near need
+neither never new next no nobody none nor not nothing now of off often oh ok okay on once one only onto or other
+others otherwise our ours ourselves out over own part per perhaps put quite rather re really right said same saw
+say saying says see seem seemed seems seen several shall she she'd she'll should shouldn't since so some somebody
+someone something sometimes somewhat somewhere still such sure take taken than that that'll that's the their
+theirs them themselves then there there's therefore these they they'd they'll they're they've thing things think
+this those though through thus to together too took toward towards under until up upon us use used using very via
+want wanted wants was wasn't way we we'd we'll we're we've well went were weren't what what's whatever when
+whenever where whether which while who who's whoever whole whom whose why will with within without won't would
+wouldn't yes yet you you'd you'll you're you've your yours yourself yourselves
+ah alright anyways basically bit gonna gotta guess guy guys hey hmm huh kinda know literally lot lots mean mhm mm
+pretty stuff sort talk talking tell thank thanks uh uhm um wanna yeah yep yup
+two three four five six seven eight nine ten
+""".split())
+
+
+# ============================================================
+# 🔤 Tokenize
+# ============================================================
+def terms(text: str) -> Counter:
+    """Unigram + bigram counts of one transcript (bigrams joined by a space)."""
+    kept = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token.endswith("'s"):
+            token = token[:-2]
+        kept.append(None if len(token) < 2 or token in STOPWORDS or token.isdigit() else token)
+    counts = Counter(t for t in kept if t)
+    bigrams = Counter(f"{a} {b}" for a, b in zip(kept, kept[1:]) if a and b and a != b)
+    counts.update({bg: n for bg, n in bigrams.items() if n >= BIGRAM_MIN})
+    return counts
+
+
+def _episode_terms(path: str):
+    """Pool task: (path, Counter, kept word count) for one episode."""
+    try:
+        counts = terms(read_transcript(path))
+    except OSError as e:
+        print(f"⚠️ Could not read {path}: {e}")
+        counts = Counter()
+    return path, counts, sum(n for t, n in counts.items() if " " not in t)
+
+
+# ============================================================
+# 🗃️ Channel tables (indexes/terms/<channel>.npz)
+# ============================================================
+class ChannelTerms:
+    """
+    One channel's episodes as a CSR matrix over its vocabulary:
+    episode i has terms vocab[ids[indptr[i]:indptr[i+1]]] with those counts.
+    """
+
+    def __init__(self, name: str, vocab=(), episodes=(), indptr=None, ids=None, counts=None):
+        self.name = name
+        self.vocab = list(vocab)
+        self.episodes = list(episodes)   # [{"path", "md5", "tokens"}]
+        self.indptr = np.zeros(1, dtype=np.int64) if indptr is None else indptr
+        self.ids = np.zeros(0, dtype=np.uint32) if ids is None else ids
+        self.counts = np.zeros(0, dtype=np.uint32) if counts is None else counts
+
+    @staticmethod
+    def path_for(name: str, index_dir: str = INDEX_DIR) -> str:
+        return os.path.join(index_dir, f"{name}.npz")
+
+    @classmethod
+    def load(cls, name: str, index_dir: str = INDEX_DIR):
+        """The saved table, or an empty one if it is missing, unreadable or from another version."""
+        path = cls.path_for(name, index_dir)
+        if not os.path.exists(path):
+            return cls(name)
+        try:
+            with np.load(path) as z:
+                meta = json.loads(z["meta"].tobytes())
+                if meta.get("version") != INDEX_VERSION:
+                    return cls(name)
+                vocab = z["vocab"].tobytes().decode("utf-8").split("\n") if z["vocab"].size else []
+                return cls(name, vocab, meta["episodes"], z["indptr"], z["ids"], z["counts"])
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Ignoring unreadable term table {path}: {e}")
+            return cls(name)
+
+    def save(self, index_dir: str = INDEX_DIR):
+        os.makedirs(index_dir, exist_ok=True)
+        path = self.path_for(self.name, index_dir)
+        tmp = path + ".tmp.npz"
+        meta = json.dumps({"version": INDEX_VERSION, "channel": self.name, "episodes": self.episodes},
+                          separators=(",", ":")).encode("utf-8")
+        np.savez_compressed(
+            tmp,
+            meta=np.frombuffer(meta, dtype=np.uint8),
+            vocab=np.frombuffer("\n".join(self.vocab).encode("utf-8"), dtype=np.uint8),
+            indptr=self.indptr, ids=self.ids, counts=self.counts,
+        )
+        os.replace(tmp, path)
+
+    def update(self, keep, fresh):
+        """
+        Keep the episodes whose paths are in `keep` and append `fresh`
+        ([(episode, Counter)]); unreferenced terms are dropped from the vocabulary.
+        """
+        index = {t: i for i, t in enumerate(self.vocab)}
+        rows_ids, rows_counts, lengths, episodes = [], [], [], []
+        for i, ep in enumerate(self.episodes):
+            if ep["path"] in keep:
+                lo, hi = self.indptr[i], self.indptr[i + 1]
+                rows_ids.append(self.ids[lo:hi])
+                rows_counts.append(self.counts[lo:hi])
+                lengths.append(hi - lo)
+                episodes.append(ep)
+        for ep, counts in fresh:
+            rows_ids.append(np.fromiter((index.setdefault(t, len(index)) for t in counts),
+                                        dtype=np.uint32, count=len(counts)))
+            rows_counts.append(np.fromiter(counts.values(), dtype=np.uint32, count=len(counts)))
+            lengths.append(len(counts))
+            episodes.append(ep)
+
+        vocab = list(index)   # insertion order == id order
+        ids = np.concatenate(rows_ids) if rows_ids else np.zeros(0, dtype=np.uint32)
+        used = np.unique(ids)
+        remap = np.zeros(len(vocab), dtype=np.uint32)
+        remap[used] = np.arange(len(used), dtype=np.uint32)
+        self.vocab = [vocab[i] for i in used]
+        self.ids = remap[ids]
+        self.counts = np.concatenate(rows_counts) if rows_counts else np.zeros(0, dtype=np.uint32)
+        self.indptr = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        self.episodes = episodes
+
+    def totals(self):
+        """(count per term, episodes per term) over the whole channel, aligned with vocab."""
+        n = len(self.vocab)
+        return (np.bincount(self.ids, weights=self.counts, minlength=n).astype(np.int64),
+                np.bincount(self.ids, minlength=n))
+
+    def episode_counts(self, term: str):
+        """[(episode path, count)] for one term, most mentions first."""
+        try:
+            tid = self.vocab.index(term)
+        except ValueError:
+            return []
+        rows = np.repeat(np.arange(len(self.episodes)), np.diff(self.indptr))
+        hit = self.ids == tid
+        return sorted(((self.episodes[r]["path"], int(c)) for r, c in zip(rows[hit], self.counts[hit])),
+                      key=lambda x: -x[1])
+
+
+# ============================================================
+# 🏗️ Build (incremental)
+# ============================================================
+def _tokenize_all(paths, workers: int = None):
+    """{path: (Counter, tokens)} for `paths`, tokenized on a process pool."""
+    if not paths:
+        return {}
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    # fork where available, like build_master_transcripts.build_channels
+    ctx = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(workers, mp_context=ctx) if workers > 1 else contextlib.nullcontext() as pool:
+        mapped = pool.map(_episode_terms, paths, chunksize=16) if pool else map(_episode_terms, paths)
+        return {path: (counts, tokens) for path, counts, tokens in mapped}
+
+
+def build_index(roots=(TRANSCRIPTS_DIR,), index_dir: str = INDEX_DIR, full: bool = False, workers: int = None,
+                cache_path: str = CACHE_PATH) -> dict:
+    """
+    Bring every channel table up to date with the corpus; returns
+    {channel: ChannelTerms}. Channel tables with no episodes left are removed.
+    """
+    cache = StatsCache(cache_path)
+    records = scan(roots, cache)
+    cache.save()
+
+    by_channel = {}
+    for r in records:
+        by_channel.setdefault(r["channel"], []).append(r)
+
+    tables, stale = {}, {}
+    for channel, recs in sorted(by_channel.items()):
+        table = ChannelTerms(channel) if full else ChannelTerms.load(channel, index_dir)
+        known = {ep["path"]: ep["md5"] for ep in table.episodes}
+        current = {r["path"] for r in recs}
+        changed = [r for r in recs if known.get(r["path"]) != r["md5"]]
+        if changed or set(known) - current:
+            stale[channel] = changed
+        tables[channel] = table
+
+    fresh = _tokenize_all([r["path"] for recs in stale.values() for r in recs], workers)
+    for channel, changed in stale.items():
+        table = tables[channel]
+        changed_paths = {r["path"] for r in changed}
+        keep = {r["path"] for r in by_channel[channel]} - changed_paths
+        table.update(keep, [({"path": r["path"], "md5": r["md5"], "tokens": fresh[r["path"]][1]},
+                             fresh[r["path"]][0]) for r in changed])
+        table.save(index_dir)
+
+    if os.path.isdir(index_dir):
+        for name in os.listdir(index_dir):
+            if name.endswith(".npz") and name[:-4] not in tables:
+                os.remove(os.path.join(index_dir, name))
+                print(f"🧹 Removed term table for vanished channel {name[:-4]}")
+
+    print(f"🔤 {len(tables)} channels, {len(records):,} episodes — {len(fresh)} tokenized, "
+          f"{len(stale)} channel tables rewritten")
+    return tables
+
+
+# ============================================================
+# 📊 Dashboard JSON
+# ============================================================
+def _rank(vocab, score):
+    """Indices by descending score, ties alphabetical — independent of vocabulary order."""
+    return np.lexsort((np.array(vocab, dtype=object), -score)) if len(vocab) else np.zeros(0, dtype=np.int64)
+
+
+def _top(vocab, counts, df, n: int, bigrams: bool):
+    order = [i for i in _rank(vocab, counts) if (" " in vocab[i]) == bigrams][:n]
+    return [[vocab[i], int(counts[i]), int(df[i])] for i in order]
+
+
+def dashboard(tables: dict) -> dict:
+    """term_stats.json contents from the channel tables (no transcript is read)."""
+    channel_totals = {}
+    corpus, corpus_df = Counter(), Counter()
+    for name, table in tables.items():
+        counts, df = table.totals()
+        channel_totals[name] = (counts, df)
+        corpus.update(dict(zip(table.vocab, counts.tolist())))
+        corpus_df.update(dict(zip(table.vocab, df.tolist())))
+
+    n_channels = len(tables)
+    corpus_total = max(sum(corpus.values()), 1)
+    channels = []
+    for name, table in tables.items():
+        counts, df = channel_totals[name]
+        base = np.array([corpus[t] / corpus_total for t in table.vocab])
+        lift = np.log(counts / max(int(counts.sum()), 1) / np.maximum(base, 1e-12), where=counts > 0,
+                      out=np.zeros(len(counts)))
+        score = np.where((df >= TOPIC_MIN_EPISODES) & (lift > 0), counts * lift, 0)
+        topics = [[table.vocab[i], round(float(score[i]), 1)]
+                  for i in _rank(table.vocab, score)[:TOPICS_N] if score[i] > 0]
+        channels.append({
+            "name": name,
+            "episodes": len(table.episodes),
+            "tokens": sum(ep["tokens"] for ep in table.episodes),
+            "vocabulary": len(table.vocab),
+            "top_terms": [t[:2] for t in _top(table.vocab, counts, df, TOP_N, False)],
+            "top_bigrams": [t[:2] for t in _top(table.vocab, counts, df, TOP_N, True)],
+            "topics": topics,
+        })
+
+    vocab = list(corpus)
+    totals = np.array([corpus[t] for t in vocab], dtype=np.int64)
+    dfs = np.array([corpus_df[t] for t in vocab], dtype=np.int64)
+    lookup = {}
+    for i in _rank(vocab, totals)[:TERMS_LIMIT]:
+        term = vocab[i]
+        lookup[term] = {"count": int(totals[i]), "episodes": int(dfs[i]), "channels": {}}
+    for name, table in tables.items():
+        counts = channel_totals[name][0]
+        for i, term in enumerate(table.vocab):
+            if term in lookup:
+                lookup[term]["channels"][name] = int(counts[i])
+
+    return {
+        "summary": {
+            "channels": n_channels,
+            "episodes": sum(c["episodes"] for c in channels),
+            "tokens": sum(c["tokens"] for c in channels),
+            "vocabulary": len(vocab),
+            "updated": datetime.utcnow().isoformat() + "Z",
+        },
+        "top_terms": _top(vocab, totals, dfs, GLOBAL_TOP_N, False),
+        "top_bigrams": _top(vocab, totals, dfs, GLOBAL_TOP_N, True),
+        "channels": channels,
+        "terms": lookup,
+    }
+
+
+def query(term: str, index_dir: str = INDEX_DIR, top: int = 5) -> dict:
+    """{channel: {"count", "episodes": [(path, count), …]}} for one term, straight from the tables."""
+    term = " ".join(term.lower().split())
+    result = {}
+    for name in sorted(os.listdir(index_dir)) if os.path.isdir(index_dir) else []:
+        if name.endswith(".npz"):
+            hits = ChannelTerms.load(name[:-4], index_dir).episode_counts(term)
+            if hits:
+                result[name[:-4]] = {"count": sum(c for _, c in hits), "episodes": hits[:top]}
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental per-channel term-frequency index.")
+    parser.add_argument("roots", nargs="*", default=[TRANSCRIPTS_DIR])
+    parser.add_argument("--index-dir", default=INDEX_DIR)
+    parser.add_argument("--out", default=STATS_PATH, help="dashboard JSON ('' = don't write)")
+    parser.add_argument("--full", action="store_true", help="re-tokenize every episode")
+    parser.add_argument("--workers", type=int, default=None, help="tokenizer processes (default: all cores)")
+    parser.add_argument("--cache", default=CACHE_PATH, help="corpus_stats cache file ('' = no cache)")
+    parser.add_argument("--query", action="append", default=[], help="print where a term is mentioned (repeatable)")
+    args = parser.parse_args(argv)
+
+    if args.query:
+        for term in args.query:
+            hits = query(term, args.index_dir)
+            print(f"🔎 \"{term}\": {sum(h['count'] for h in hits.values()):,} mentions in {len(hits)} channels")
+            for channel, h in sorted(hits.items(), key=lambda x: -x[1]["count"]):
+                print(f"   {channel:<30} {h['count']:>7,}   top: {os.path.basename(h['episodes'][0][0])}")
+        return
+
+    start = time.time()
+    tables = build_index(args.roots, args.index_dir, args.full, args.workers, args.cache)
+    if args.out:
+        write_json(args.out, dashboard(tables))
+        print(f"✅ Wrote {args.out} ({time.time() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+transcript_store.py — Forged by Freedom Packed Transcript Storage
+────────────────────────────────────────────────────────────────────────────
+Optional compressed storage for transcript folders: a folder's .txt files
+become one `episodes.pack` of independently compressed frames, plus an
+`episodes.pack.json` frame index, sharing a dictionary trained on the corpus.
+
+✨ Features:
+- zstd with a trained dictionary (`pip install zstandard`); without it the
+  same format falls back to stdlib zlib with a preset dictionary
+- Every episode is cut into frames of ≤ FRAME_BYTES that decompress on
+  their own, so reading one episode — or one byte range of it — touches
+  only its frames, never the whole pack
+- Reader API: read_text / read_bytes(offset, size) by episode, a streaming
+  iterator over frames, and open() returning a seekable file object
+- One interface for every script: open_transcript(), walk_transcripts()
+  and list_transcripts() serve plain .txt files and packed episodes alike,
+  under the same paths — the master builder, the chunkers, the ingest
+  journal and every Pinecone ingestion script read through it, so a packed
+  folder looks exactly like a plain one to them
+- `pack --remove` deletes the plain files only after every episode has been
+  decompressed and checked against its md5; `unpack` restores them
+
+Usage:
+    python scripts/transcript_store.py train transcripts split_transcripts @*/
+    python scripts/transcript_store.py pack split_transcripts/@* --remove
+    python scripts/transcript_store.py cat "split_transcripts/@ChrisBumstead/episode_001_....txt"
+    python scripts/transcript_store.py stats split_transcripts/@*
+    python scripts/transcript_store.py unpack split_transcripts/@*
+"""
+
+import argparse
+import bisect
+import hashlib
+import io
+import json
+import os
+import threading
+import zlib
+from collections import Counter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+PACK_NAME = "episodes.pack"
+INDEX_NAME = PACK_NAME + ".json"
+DICT_PATH = ".transcripts.dict"
+FRAME_BYTES = 128 * 1024
+DICT_BYTES = 112 * 1024            # zstd; zlib only uses the last 32 KB
+LEVEL = 19
+ZLIB_LEVEL = 9
+SAMPLE_BYTES = 100 * DICT_BYTES    # training input budget
+SAMPLE_PIECE = 4096
+SKIP_PREFIX = "master_transcript"
+
+
+# ============================================================
+# 🗜️ Codecs
+# ============================================================
+def default_codec() -> str:
+    return "zstd" if zstandard else "zlib"
+
+
+class Codec:
+    """Frame compressor / decompressor for one codec + dictionary."""
+
+    def __init__(self, name: str, dictionary: bytes = b"", level: int = None):
+        self.name = name
+        self.dictionary = dictionary
+        if name == "zstd":
+            if zstandard is None:
+                raise RuntimeError("this pack is zstd-compressed — pip install zstandard")
+            zdict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+            self._c = zstandard.ZstdCompressor(level=level or LEVEL, dict_data=zdict)
+            self._d = zstandard.ZstdDecompressor(dict_data=zdict)
+        elif name == "zlib":
+            self.level = level or ZLIB_LEVEL
+            self.zdict = dictionary[-32 * 1024:]
+        else:
+            raise ValueError(f"unknown codec {name!r}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self.name == "zstd":
+            return self._c.compress(data)
+        c = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=self.zdict) if self.zdict else \
+            zlib.compressobj(self.level, zlib.DEFLATED, -15)
+        return c.compress(data) + c.flush()
+
+    def decompress(self, frame: bytes, size: int) -> bytes:
+        if self.name == "zstd":
+            return self._d.decompress(frame, max_output_size=size)
+        d = zlib.decompressobj(-15, zdict=self.zdict) if self.zdict else zlib.decompressobj(-15)
+        return d.decompress(frame) + d.flush()
+
+
+def _samples(roots, budget: int = SAMPLE_BYTES):
+    """SAMPLE_PIECE-sized slices spread evenly over the corpus, up to `budget` bytes."""
+    paths = [p for p, _ in _walk_plain(roots)]
+    if not paths:
+        return []
+    per_file = max(SAMPLE_PIECE, budget // len(paths))
+    samples, total = [], 0
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read(per_file)
+        samples += [data[i:i + SAMPLE_PIECE] for i in range(0, len(data), SAMPLE_PIECE)]
+        total += len(data)
+        if total >= budget:
+            break
+    return samples
+
+
+def train_dictionary(roots, codec: str = None, size: int = DICT_BYTES) -> bytes:
+    """
+    Train a shared dictionary on transcript samples.
+
+    zstd uses its own trainer. For zlib the dictionary is the corpus's most
+    frequent word trigrams, most frequent last (deflate prefers the nearest
+    match, and only the final 32 KB is used).
+    """
+    samples = _samples(roots)
+    if (codec or default_codec()) == "zstd":
+        return zstandard.train_dictionary(size, samples).as_bytes()
+    grams = Counter()
+    for data in samples:
+        words = data.split()
+        grams.update(b" ".join(words[i:i + 3]) for i in range(len(words) - 2))
+    out, total = [], 0
+    for gram, count in grams.most_common():
+        if count < 2 or total + len(gram) + 1 > min(size, 32 * 1024):
+            break
+        out.append(gram)
+        total += len(gram) + 1
+    return b" ".join(reversed(out))
+
+
+# ============================================================
+# 📦 Writing
+# ============================================================
+def _walk_plain(roots):
+    """(path, name) of plain transcript .txt files under roots, sorted."""
+    for root in roots:
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "node_modules")
+            for f in sorted(files):
+                if f.endswith(".txt") and not f.startswith(SKIP_PREFIX):
+                    yield os.path.join(dirpath, f), f
+
+
+def _load_dictionary(path: str) -> bytes:
+    if not path or not os.path.exists(path):
+        return b""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def pack_dir(directory: str, dict_path: str = DICT_PATH, codec: str = None, remove: bool = False) -> dict:
+    """
+    Pack every plain .txt in `directory` (plus any episodes already packed
+    there) into a fresh episodes.pack; returns the index.
+    """
+    dictionary = _load_dictionary(dict_path)
+    coder = Codec(codec or default_codec(), dictionary)
+    existing = PackReader(directory) if os.path.exists(os.path.join(directory, INDEX_NAME)) else None
+
+    plain = {f: os.path.join(directory, f) for f in os.listdir(directory)
+             if f.endswith(".txt") and not f.startswith(SKIP_PREFIX) and os.path.isfile(os.path.join(directory, f))}
+    names = sorted(set(plain) | set(existing.names() if existing else ()))
+
+    pack_tmp = os.path.join(directory, PACK_NAME + ".tmp")
+    episodes, offset = [], 0
+    with open(pack_tmp, "wb") as out:
+        for name in names:
+            if name in plain:
+                with open(plain[name], "rb") as f:
+                    data = f.read()
+                mtime_ns = os.stat(plain[name]).st_mtime_ns
+            else:
+                data = existing.read_bytes(name)
+                mtime_ns = existing.entry(name)["mtime_ns"]
+            frames = []
+            for i in range(0, len(data), FRAME_BYTES) or [0]:
+                raw = data[i:i + FRAME_BYTES]
+                frame = coder.compress(raw)
+                out.write(frame)
+                frames.append([offset, len(frame), len(raw)])
+                offset += len(frame)
+            episodes.append({"name": name, "size": len(data), "mtime_ns": mtime_ns,
+                             "md5": hashlib.md5(data).hexdigest(), "frames": frames})
+    if existing:
+        existing.close()
+
+    index = {
+        "version": 1,
+        "codec": coder.name,
+        "dict": os.path.relpath(os.path.abspath(dict_path), os.path.abspath(directory)) if dictionary else None,
+        "dict_sha256": hashlib.sha256(dictionary).hexdigest() if dictionary else None,
+        "frame_bytes": FRAME_BYTES,
+        "episodes": episodes,
+    }
+    index_tmp = os.path.join(directory, INDEX_NAME + ".tmp")
+    with open(index_tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(pack_tmp, os.path.join(directory, PACK_NAME))
+    os.replace(index_tmp, os.path.join(directory, INDEX_NAME))
+    _READERS.pop(os.path.abspath(directory), None)
+
+    if remove:
+        with PackReader(directory) as reader:
+            bad = reader.verify()
+        if bad:
+            raise RuntimeError(f"{directory}: {len(bad)} episodes failed verification, plain files kept: {bad[:3]}")
+        for path in plain.values():
+            os.remove(path)
+    return index
+
+
+def unpack_dir(directory: str):
+    """Restore every packed episode as a plain .txt (original mtime) and drop the pack."""
+    with PackReader(directory) as reader:
+        for name in reader.names():
+            path = os.path.join(directory, name)
+            with open(path, "wb") as f:
+                for block in reader.iter_blocks(name):
+                    f.write(block)
+            mtime = reader.entry(name)["mtime_ns"]
+            os.utime(path, ns=(mtime, mtime))
+    _READERS.pop(os.path.abspath(directory), None)
+    os.remove(os.path.join(directory, PACK_NAME))
+    os.remove(os.path.join(directory, INDEX_NAME))
+
+
+# ============================================================
+# 📖 Reading
+# ============================================================
+class PackReader:
+    """Random-access reader for one folder's episodes.pack."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_NAME), "r", encoding="utf-8") as f:
+            self.index = json.load(f)
+        dictionary = b""
+        if self.index.get("dict"):
+            dictionary = _load_dictionary(os.path.join(directory, self.index["dict"]))
+            if hashlib.sha256(dictionary).hexdigest() != self.index["dict_sha256"]:
+                raise RuntimeError(f"{directory}: dictionary {self.index['dict']} does not match the pack")
+        self.codec = Codec(self.index["codec"], dictionary)
+        self._episodes = {e["name"]: e for e in self.index["episodes"]}
+        self._starts = {}           # name -> uncompressed start offset of each frame
+        self._f = open(os.path.join(directory, PACK_NAME), "rb")
+        self._lock = threading.Lock()
+
+    def names(self):
+        return [e["name"] for e in self.index["episodes"]]
+
+    def entry(self, name: str) -> dict:
+        return self._episodes[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._episodes
+
+    def _frame(self, name: str, i: int) -> bytes:
+        offset, length, size = self._episodes[name]["frames"][i]
+        with self._lock:
+            self._f.seek(offset)
+            data = self._f.read(length)
+        return self.codec.decompress(data, size)
+
+    def _frame_starts(self, name: str):
+        if name not in self._starts:
+            starts, pos = [], 0
+            for _, _, size in self._episodes[name]["frames"]:
+                starts.append(pos)
+                pos += size
+            self._starts[name] = starts
+        return self._starts[name]
+
+    def iter_blocks(self, name: str, offset: int = 0):
+        """Stream an episode's bytes from `offset`, one decompressed frame at a time."""
+        starts = self._frame_starts(name)
+        first = max(0, bisect.bisect_right(starts, offset) - 1)
+        for i in range(first, len(starts)):
+            block = self._frame(name, i)
+            yield block[offset - starts[i]:] if i == first and offset > starts[i] else block
+
+    def read_bytes(self, name: str, offset: int = 0, size: int = -1) -> bytes:
+        """Bytes [offset, offset + size) of an episode, decompressing only the frames they span."""
+        end = self._episodes[name]["size"] if size < 0 else min(offset + size, self._episodes[name]["size"])
+        out = bytearray()
+        for block in self.iter_blocks(name, offset):
+            out += block[: end - offset - len(out)]
+            if offset + len(out) >= end:
+                break
+        return bytes(out)
+
+    def read_text(self, name: str) -> str:
+        return self.read_bytes(name).decode("utf-8", errors="ignore")
+
+    def open(self, name: str):
+        """Seekable binary file object for one episode."""
+        return io.BufferedReader(_EpisodeIO(self, name), buffer_size=self.index["frame_bytes"])
+
+    def verify(self):
+        """Names of episodes whose decompressed bytes do not match their md5."""
+        bad = []
+        for name in self.names():
+            md5 = hashlib.md5()
+            for block in self.iter_blocks(name):
+                md5.update(block)
+            if md5.hexdigest() != self._episodes[name]["md5"]:
+                bad.append(name)
+        return bad
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _EpisodeIO(io.RawIOBase):
+    """Raw, seekable view of one packed episode (wrapped in a BufferedReader)."""
+
+    def __init__(self, reader: PackReader, name: str):
+        self.reader = reader
+        self.name = os.path.join(reader.directory, name)
+        self._episode = name
+        self._size = reader.entry(name)["size"]
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, b):
+        data = self.reader.read_bytes(self._episode, self._pos, len(b))
+        b[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+# ============================================================
+# 🔌 One interface for plain and packed transcripts
+# ============================================================
+_READERS = {}
+
+
+def _reader_for(directory: str):
+    key = os.path.abspath(directory)
+    if key not in _READERS:
+        _READERS[key] = PackReader(directory) if os.path.exists(os.path.join(directory, INDEX_NAME)) else None
+    return _READERS[key]
+
+
+def _packed(path: str):
+    """(reader, name) of a packed episode, or FileNotFoundError."""
+    directory, name = os.path.split(path)
+    reader = _reader_for(directory or ".")
+    if reader is None or name not in reader:
+        raise FileNotFoundError(path)
+    return reader, name
+
+
+def open_transcript(path: str, mode: str = "r", buffering: int = -1):
+    """
+    open() for transcripts: a plain file if it exists, otherwise the packed
+    episode of the same name in that folder. "r" gives UTF-8 text (errors
+    ignored, like our scripts always read), "rb" a seekable binary file
+    (unbuffered with buffering=0, as with open()).
+    """
+    if os.path.exists(path):
+        if "b" in mode:
+            return open(path, "rb", buffering=buffering)
+        return open(path, "r", encoding="utf-8", errors="ignore")
+    reader, name = _packed(path)
+    if "b" in mode and buffering == 0:
+        return _EpisodeIO(reader, name)
+    raw = reader.open(name)
+    return raw if "b" in mode else io.TextIOWrapper(raw, encoding="utf-8", errors="ignore")
+
+
+def transcript_size(path: str) -> int:
+    """os.path.getsize() for plain and packed transcripts alike."""
+    if os.path.exists(path):
+        return os.path.getsize(path)
+    reader, name = _packed(path)
+    return reader.entry(name)["size"]
+
+
+def list_transcripts(directory: str, skip_masters: bool = True):
+    """
+    Sorted (name, size, mtime_ns) of one folder's transcripts, plain and
+    packed — a directory scan plus the pack index, nothing is read.
+    """
+    found, packed = {}, False
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name == INDEX_NAME:
+                packed = True
+            elif entry.name.endswith(".txt") and entry.is_file():
+                st = entry.stat()
+                found[entry.name] = (entry.name, st.st_size, st.st_mtime_ns)
+    if packed:
+        for name in _reader_for(directory).names():
+            if name not in found:
+                e = _reader_for(directory).entry(name)
+                found[name] = (name, e["size"], e["mtime_ns"])
+    return sorted(v for k, v in found.items() if not (skip_masters and k.startswith(SKIP_PREFIX)))
+
+
+def read_transcript(path: str) -> str:
+    with open_transcript(path) as f:
+        return f.read()
+
+
+def walk_transcripts(roots, skip_masters: bool = True):
+    """
+    Sorted transcript paths under `roots` — plain .txt files and packed
+    episodes alike (a plain file wins over a packed copy of the same name).
+    """
+    for root in [roots] if isinstance(roots, str) else roots:
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "node_modules")
+            names = {f for f in files if f.endswith(".txt")}
+            if INDEX_NAME in files:
+                names |= set(_reader_for(dirpath).names())
+            for f in sorted(names):
+                if not (skip_masters and f.startswith(SKIP_PREFIX)):
+                    yield os.path.join(dirpath, f)
+
+
+# ============================================================
+# 🚀 CLI
+# ============================================================
+def _pack_dirs(paths):
+    """Folders that directly contain transcript .txt files or a pack."""
+    dirs = set()
+    for root in paths:
+        for dirpath, sub, files in os.walk(root):
+            sub[:] = [d for d in sub if not d.startswith(".")]
+            if INDEX_NAME in files or any(f.endswith(".txt") and not f.startswith(SKIP_PREFIX) for f in files):
+                dirs.add(dirpath)
+    return sorted(dirs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Packed, seekable transcript storage.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("train", help="train the shared dictionary")
+    p.add_argument("roots", nargs="+")
+    p.add_argument("--dict", default=DICT_PATH)
+    p.add_argument("--codec", choices=["zstd", "zlib"], default=default_codec())
+    p = sub.add_parser("pack", help="pack each folder's .txt files")
+    p.add_argument("roots", nargs="+")
+    p.add_argument("--dict", default=DICT_PATH)
+    p.add_argument("--codec", choices=["zstd", "zlib"], default=default_codec())
+    p.add_argument("--remove", action="store_true", help="delete plain files once the pack verifies")
+    p = sub.add_parser("unpack", help="restore plain .txt files")
+    p.add_argument("roots", nargs="+")
+    p = sub.add_parser("cat", help="print one transcript (plain or packed)")
+    p.add_argument("path")
+    p.add_argument("--offset", type=int, default=0)
+    p.add_argument("--size", type=int, default=-1)
+    p = sub.add_parser("stats", help="compression ratio per folder")
+    p.add_argument("roots", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "train":
+        dictionary = train_dictionary(args.roots, args.codec)
+        with open(args.dict, "wb") as f:
+            f.write(dictionary)
+        print(f"🧠 {args.codec} dictionary: {len(dictionary) / 1024:.0f} KB → {args.dict}")
+    elif args.command == "pack":
+        for d in _pack_dirs(args.roots):
+            index = pack_dir(d, args.dict, args.codec, args.remove)
+            raw = sum(e["size"] for e in index["episodes"])
+            packed = os.path.getsize(os.path.join(d, PACK_NAME))
+            print(f"📦 {d}: {len(index['episodes'])} episodes, {raw / 1e6:.1f} MB → {packed / 1e6:.1f} MB "
+                  f"({raw / max(packed, 1):.1f}x)")
+    elif args.command == "unpack":
+        for d in _pack_dirs(args.roots):
+            if os.path.exists(os.path.join(d, INDEX_NAME)):
+                unpack_dir(d)
+                print(f"📂 Unpacked {d}")
+    elif args.command == "cat":
+        with open_transcript(args.path, "rb") as f:
+            f.seek(args.offset)
+            data = f.read(args.size)
+        print(data.decode("utf-8", errors="ignore"))
+    elif args.command == "stats":
+        raw = packed = 0
+        for d in _pack_dirs(args.roots):
+            if os.path.exists(os.path.join(d, INDEX_NAME)):
+                with PackReader(d) as reader:
+                    raw += sum(e["size"] for e in reader.index["episodes"])
+                packed += os.path.getsize(os.path.join(d, PACK_NAME))
+        print(f"📊 {raw / 1e6:.1f} MB of text in {packed / 1e6:.1f} MB ({raw / max(packed, 1):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+whisper_pool.py — Forged by Freedom Persistent Whisper Workers
+────────────────────────────────────────────────────────────────────────────
+Transcription service that keeps N Whisper processes alive for a whole run
+instead of starting `python -m whisper` (and reloading the weights) per file.
+
+✨ Features:
+- Each worker loads the model ONCE at start-up
+- CPU threads are capped per worker (torch + OMP/MKL) and, where the OS
+  supports it, each worker is pinned to its own cores — N workers × T
+  threads never oversubscribe the machine
+- Work comes from one shared queue; any free worker takes the next file
+- submit() returns a Future, so pipeline threads can wait on their own file;
+  cancel() drops jobs no worker has started yet
+- Per-file metrics: wall seconds, audio seconds and real-time factor
+  (RTF = wall / audio; below 1.0 is faster than real time)
+- A worker that dies fails its current file instead of hanging the run
+
+Output is the same .txt the Whisper CLI writes (one segment per line).
+Jobs without a txt path (segments from segmented_transcribe.py, passed as
+.npy arrays) return Whisper's timestamped segments instead.
+
+Benchmark:
+    python scripts/whisper_pool.py downloads/@sam_sulek/*.mp3 --workers 2 -o /tmp/out
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+
+MODEL = "small"
+
+
+# ============================================================
+# 👷 Worker process
+# ============================================================
+def _pin(worker_id: int, threads: int):
+    """Limit math-library threads and pin this process to its own cores."""
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    if hasattr(os, "sched_setaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+        start = (worker_id * threads) % len(cores)
+        mine = {cores[(start + i) % len(cores)] for i in range(threads)}
+        os.sched_setaffinity(0, mine)
+
+
+def write_txt(result: dict, txt_path: str):
+    """Write segments one per line, like `whisper --output_format txt`."""
+    tmp = txt_path + ".part"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for seg in result["segments"]:
+            f.write(seg["text"].strip() + "\n")
+    os.replace(tmp, txt_path)
+
+
+def _worker_main(worker_id: int, model_name: str, threads: int, jobs, conn, options: dict):
+    _pin(worker_id, threads)
+
+    import torch
+    import whisper
+
+    torch.set_num_threads(threads)
+    start = time.time()
+    model = whisper.load_model(model_name, device="cpu")
+    conn.send(("ready", worker_id, None, {"load_seconds": round(time.time() - start, 2)}))
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        job_id, audio_path, txt_path = job
+        conn.send(("start", worker_id, job_id, None))
+        try:
+            t0 = time.time()
+            if audio_path.endswith(".npy"):
+                import numpy as np
+
+                audio = np.load(audio_path)
+            else:
+                audio = whisper.load_audio(audio_path)
+            audio_seconds = len(audio) / whisper.audio.SAMPLE_RATE
+            result = model.transcribe(audio, fp16=False, **options)
+            wall = time.time() - t0
+            metrics = {
+                "audio": audio_path,
+                "txt": txt_path,
+                "seconds": round(wall, 2),
+                "audio_seconds": round(audio_seconds, 2),
+                "rtf": round(wall / audio_seconds, 3) if audio_seconds else None,
+                "worker": worker_id,
+            }
+            if txt_path:
+                write_txt(result, txt_path)
+            else:
+                metrics["segments"] = [
+                    {"start": s["start"], "end": s["end"], "text": s["text"]} for s in result["segments"]
+                ]
+            conn.send(("done", worker_id, job_id, metrics))
+        except Exception as e:
+            conn.send(("error", worker_id, job_id, f"{type(e).__name__}: {e}"))
+
+
+# ============================================================
+# 🧑‍✈️ Parent side
+# ============================================================
+class WhisperPool:
+    """N long-lived Whisper processes fed from one shared job queue."""
+
+    def __init__(self, workers: int = 1, model: str = MODEL, threads: int = None, log=print, **options):
+        self.workers = max(1, workers)
+        self.model = model
+        self.threads = threads or max(1, (os.cpu_count() or 1) // self.workers)
+        self.log = log
+        self.options = options          # passed to model.transcribe (language=..., etc.)
+        self.metrics = []               # per-file dicts from workers
+        self.load_seconds = {}
+
+        # fork: the calling scripts run top-level code that spawn would re-execute
+        self._ctx = multiprocessing.get_context(
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn")
+        self._jobs = self._ctx.Queue()
+        self._procs = []
+        self._conns = {}                # reader connection -> worker id
+        self._futures = {}
+        self._running = {}              # worker id -> job id
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._collector = None
+        self._closed = False
+
+    def start(self):
+        for wid in range(self.workers):
+            # One pipe per worker: send() is synchronous, so nothing is lost if
+            # the worker is killed, and EOF on the pipe tells us it died.
+            reader, writer = self._ctx.Pipe(duplex=False)
+            p = self._ctx.Process(
+                target=_worker_main, name=f"whisper-{wid}", daemon=True,
+                args=(wid, self.model, self.threads, self._jobs, writer, self.options),
+            )
+            p.start()
+            writer.close()
+            self._procs.append(p)
+            self._conns[reader] = wid
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+        self.log(f"🧠 Whisper pool: {self.workers} workers × {self.threads} threads, model {self.model}")
+        return self
+
+    def _collect(self):
+        while self._conns:
+            for conn in wait(list(self._conns), timeout=1.0):
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    self._worker_exited(self._conns.pop(conn))
+                    continue
+                self._handle(*message)
+
+    def _handle(self, kind, wid, job_id, payload):
+        with self._lock:
+            if kind == "ready":
+                self.load_seconds[wid] = payload["load_seconds"]
+                self.log(f"🔥 whisper-{wid} loaded {self.model} in {payload['load_seconds']}s")
+            elif kind == "start":
+                self._running[wid] = job_id
+            else:
+                self._running.pop(wid, None)
+                future = self._futures.pop(job_id, None)
+                if future is None:
+                    return
+                if kind == "done":
+                    if payload["txt"]:
+                        self.metrics.append(payload)
+                    future.set_result(payload)
+                else:
+                    future.set_exception(RuntimeError(payload))
+
+    def _worker_exited(self, wid: int):
+        """Fail the file a dead worker was holding; fail everything once no worker is left."""
+        self._procs[wid].join()
+        with self._lock:
+            if wid in self._running:
+                future = self._futures.pop(self._running.pop(wid), None)
+                if future is not None:
+                    future.set_exception(RuntimeError(f"whisper-{wid} died (exit {self._procs[wid].exitcode})"))
+            if not self._conns and not self._closed:
+                for future in self._futures.values():
+                    future.set_exception(RuntimeError("all Whisper workers exited"))
+                self._futures.clear()
+
+    def record(self, metrics: dict) -> dict:
+        """Add metrics for a file transcribed outside submit() (e.g. in segments)."""
+        with self._lock:
+            self.metrics.append(metrics)
+        return metrics
+
+    def submit(self, audio_path: str, txt_path: str = None) -> Future:
+        """Queue one file; the Future resolves to its metrics dict (plus segments if txt_path is None)."""
+        if not self._procs:
+            self.start()
+        future = Future()
+        with self._lock:
+            job_id = next(self._ids)
+            self._futures[job_id] = future
+        self._jobs.put((job_id, audio_path, txt_path))
+        return future
+
+    def cancel(self, futures) -> list:
+        """
+        Cancel the given futures whose job no worker has started; returns the
+        ones still running (their workers keep going, so wait for them).
+        A cancelled job still reaches a worker, so delete its input first.
+        """
+        futures = set(futures)
+        running = []
+        with self._lock:
+            busy = set(self._running.values())
+            for job_id, future in list(self._futures.items()):
+                if future not in futures:
+                    continue
+                if job_id in busy:
+                    running.append(future)
+                else:
+                    del self._futures[job_id]
+                    future.cancel()
+        return running
+
+    def transcribe(self, audio_path: str, txt_path: str) -> dict:
+        """Blocking submit(); safe to call from many threads."""
+        return self.submit(audio_path, txt_path).result()
+
+    def close(self):
+        self._closed = True
+        for _ in self._procs:
+            self._jobs.put(None)
+        if self._collector:
+            self._collector.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def report(self):
+        """Log totals: files, audio hours, mean RTF and throughput."""
+        if not self.metrics:
+            self.log("⏱️ Whisper pool: no files transcribed.")
+            return
+        audio = sum(m["audio_seconds"] for m in self.metrics)
+        wall = sum(m["seconds"] for m in self.metrics)
+        rtf = f"{wall / audio:.3f}" if audio else "n/a"   # only silent / empty files
+        self.log(
+            f"⏱️ Whisper pool: {len(self.metrics)} files, {audio / 3600:.2f} h audio, "
+            f"mean RTF {rtf}, per-worker load {sorted(self.load_seconds.values())}s (once)"
+        )
+
+
+# ============================================================
+# 🚀 CLI / benchmark
+# ============================================================
+def main():
+    parser = argparse.ArgumentParser(description="Transcribe audio files with a persistent Whisper pool.")
+    parser.add_argument("audio", nargs="+")
+    parser.add_argument("-o", "--output-dir", default=".")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=None, help="CPU threads per worker")
+    parser.add_argument("--model", default=MODEL)
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    start = time.time()
+    with WhisperPool(args.workers, args.model, args.threads) as pool:
+        futures = [
+            pool.submit(a, os.path.join(args.output_dir, os.path.splitext(os.path.basename(a))[0] + ".txt"))
+            for a in args.audio
+        ]
+        for f in futures:
+            try:
+                m = f.result()
+                print(f"✅ {os.path.basename(m['audio'])}: {m['seconds']}s for "
+                      f"{m['audio_seconds']}s audio (RTF {m['rtf']}, worker {m['worker']})")
+            except Exception as e:
+                print(f"❌ {e}")
+    pool.report()
+    print(f"🏁 Wall time {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
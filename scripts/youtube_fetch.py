@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+youtube_fetch.py — Forged by Freedom Channel Fetcher
+────────────────────────────────────────────────────────────────────────────
+yt-dlp stage for the automation pipeline.
+
+✨ Features:
+- Persistent download archive (yt-dlp --download-archive format,
+  "youtube <id>" per line), seeded from the [<id>] already embedded in our
+  transcript / audio filenames — an episode we have transcribed is never
+  downloaded again even though its MP3 was deleted
+- --break-on-existing: listing a channel stops at the first archived upload
+  (channels list newest first), so a no-new-videos run takes seconds
+- Channels are fetched concurrently, capped by a global number of yt-dlp
+  processes and a global bandwidth budget split across them
+- The yt-dlp command is configurable, so the stage can be exercised against
+  scripts/fake_ytdlp.py and a folder of fake media instead of YouTube
+
+Usage:
+    python scripts/youtube_fetch.py @sam_sulek @JeffNippard --max-concurrent 3 --max-rate 20M
+    FAKE_YTDLP_MEDIA=/tmp/media python scripts/youtube_fetch.py @A @B --ytdlp "python scripts/fake_ytdlp.py"
+"""
+
+import argparse
+import glob
+import os
+import re
+import shlex
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from transcript_store import list_transcripts
+
+ID_RE = re.compile(r"\[([A-Za-z0-9_-]{11})\]")
+BASE_URL = "https://www.youtube.com/"
+MAX_CONCURRENT = 3
+MAX_RATE = "20M"
+
+
+def parse_rate(rate) -> int:
+    """'20M' / '512K' / 1000000 → bytes per second (0 = unlimited)."""
+    if not rate:
+        return 0
+    text = str(rate).strip().upper()
+    mult = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}.get(text[-1], 1)
+    return int(float(text.rstrip("KMG")) * mult)
+
+
+def ids_in_names(paths) -> set:
+    """YouTube ids embedded as [<id>] in file names."""
+    return {m.group(1) for p in paths for m in ID_RE.finditer(os.path.basename(p))}
+
+
+class ChannelFetcher:
+    """Concurrent, archive-aware yt-dlp downloads for many channels."""
+
+    def __init__(self, download_root: str, transcripts_root: str, archive_path: str = None,
+                 max_concurrent: int = MAX_CONCURRENT, max_rate=MAX_RATE, ytdlp: str = "yt-dlp",
+                 base_url: str = BASE_URL, log=print):
+        self.download_root = download_root
+        self.transcripts_root = transcripts_root
+        self.archive_path = archive_path or os.path.join(download_root, "download_archive.txt")
+        self.max_concurrent = max(1, max_concurrent)
+        self.rate_per_process = parse_rate(max_rate) // self.max_concurrent
+        self.ytdlp = shlex.split(ytdlp)
+        self.base_url = base_url
+        self.log = log
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._archive_lock = threading.Lock()
+
+    # -- archive ---------------------------------------------------------
+    def archived_ids(self) -> set:
+        if not os.path.exists(self.archive_path):
+            return set()
+        with open(self.archive_path, "r", encoding="utf-8") as f:
+            return {line.split()[1] for line in f if len(line.split()) == 2}
+
+    def seed_archive(self) -> int:
+        """Add every id found in transcript / audio filenames to the archive; returns ids added."""
+        names = [name for folder in glob.glob(os.path.join(self.transcripts_root, "*", ""))
+                 for name, _, _ in list_transcripts(folder)]
+        names += glob.glob(os.path.join(self.download_root, "*", "*.mp3"))
+        with self._archive_lock:
+            new = ids_in_names(names) - self.archived_ids()
+            if new:
+                os.makedirs(os.path.dirname(os.path.abspath(self.archive_path)), exist_ok=True)
+                with open(self.archive_path, "a", encoding="utf-8") as f:
+                    f.writelines(f"youtube {vid}\n" for vid in sorted(new))
+        return len(new)
+
+    # -- fetching --------------------------------------------------------
+    def fetch(self, channel: str) -> list:
+        """Download new uploads of one channel; returns the new audio paths."""
+        ch_path = os.path.join(self.download_root, channel)
+        os.makedirs(ch_path, exist_ok=True)
+        before = set(glob.glob(os.path.join(ch_path, "*.mp3")))
+        cmd = self.ytdlp + [
+            "--extract-audio", "--audio-format", "mp3", "--audio-quality", "0",
+            "--download-archive", self.archive_path, "--break-on-existing",
+            "-o", f"{ch_path}/%(title)s [%(id)s].%(ext)s",
+        ]
+        if self.rate_per_process:
+            cmd += ["--limit-rate", str(self.rate_per_process)]
+        cmd.append(f"{self.base_url}{channel}")
+
+        with self._slots:
+            start = time.time()
+            subprocess.run(cmd, check=False)
+        new = sorted(set(glob.glob(os.path.join(ch_path, "*.mp3"))) - before)
+        self.log(f"🎧 {channel}: {len(new)} new in {time.time() - start:.1f}s")
+        return new
+
+    def fetch_all(self, channels) -> dict:
+        """Fetch many channels concurrently; returns {channel: [new audio paths]}."""
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as pool:
+            return dict(zip(channels, pool.map(self.fetch, channels)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch new channel uploads with a download archive.")
+    parser.add_argument("channels", nargs="+")
+    parser.add_argument("--downloads", default="downloads")
+    parser.add_argument("--transcripts", default="transcripts")
+    parser.add_argument("--archive", default=None)
+    parser.add_argument("--max-concurrent", type=int, default=MAX_CONCURRENT)
+    parser.add_argument("--max-rate", default=MAX_RATE, help="global bandwidth cap, e.g. 20M (0 = none)")
+    parser.add_argument("--ytdlp", default="yt-dlp", help="yt-dlp command (e.g. a fake for testing)")
+    args = parser.parse_args()
+
+    fetcher = ChannelFetcher(args.downloads, args.transcripts, args.archive, args.max_concurrent,
+                             args.max_rate, args.ytdlp)
+    print(f"🗂️ Archive: {fetcher.seed_archive()} ids added from filenames, "
+          f"{len(fetcher.archived_ids())} total")
+    start = time.time()
+    results = fetcher.fetch_all(args.channels)
+    print(f"✅ {sum(map(len, results.values()))} new files from {len(results)} channels "
+          f"in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
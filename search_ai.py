@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 import os
+import sys
 import openai
 from pinecone import Pinecone
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from embeddings import get_backend
+
 # === Load Environment ===
 load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
@@ -16,10 +20,7 @@ print("🧠 Ask your question:")
 query = input("> ")
 
 # Embed query
-embedding = openai.embeddings.create(
-    input=query,
-    model="text-embedding-3-small"
-).data[0].embedding
+embedding = get_backend("openai", "text-embedding-3-small", index=index).embed_one(query)
 
 # Query Pinecone
 results = index.query(
@@ -1,8 +1,12 @@
 import os
+import sys
 from openai import OpenAI
 from pinecone import Pinecone
 import textwrap
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from embeddings import get_backend
+
 # -----------------------------
 # 🔑 Load API Keys
 # -----------------------------
@@ -14,16 +18,14 @@ openai_client = OpenAI(api_key=OPENAI_API_KEY)
 pc = Pinecone(api_key=PINECONE_API_KEY)
 index_name = "forged-transcripts"
 index = pc.Index(index_name)
+embedder = get_backend("openai", "text-embedding-3-large", index=index)
 
 # -----------------------------
 # 🔍 Ask AI + Pinecone
 # -----------------------------
 def search_pinecone(query: str, top_k: int = 5):
     # Create embedding for the query
-    query_embedding = openai_client.embeddings.create(
-        model="text-embedding-3-large",
-        input=query
-    ).data[0].embedding
+    query_embedding = embedder.embed_one(query)
 
     # Search Pinecone for similar chunks
     results = index.query(vector=query_embedding, top_k=top_k, include_metadata=True)